@@ -0,0 +1 @@
+# Authentication (First-party Session) Package
@@ -0,0 +1,75 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+from config.env import get_env
+from authentication.repository import SessionStoreInterface, SQLiteSessionStore
+from authentication.service import SessionService
+
+
+def build_session_store() -> SessionStoreInterface:
+    """SESSION_STORE_SQLITE_PATH 위치의 SQLite 세션 저장소를 생성한다."""
+    return SQLiteSessionStore(get_env("SESSION_STORE_SQLITE_PATH", "data/sessions.sqlite3"))
+
+
+class AuthenticationContainer:
+    """
+    자체 세션(Authentication) 의존성 컨테이너
+
+    - 세션 Service는 애플리케이션 시작 시 1회 생성되어 프로세스 전역에서 재사용된다.
+    - 만료 세션 정리 작업은 start()/shutdown()으로 관리한다.
+    - 테스트에서는 override()로 다른 인스턴스를 주입할 수 있다.
+    """
+
+    def __init__(self):
+        self._session_service: SessionService | None = None
+        self._override: SessionService | None = None
+
+    def init(self) -> SessionService:
+        """세션 저장소와 Service를 생성한다."""
+        self._session_service = SessionService(build_session_store())
+        return self._session_service
+
+    def start(self) -> None:
+        """백그라운드 작업(만료 세션 정리)을 시작한다."""
+        self.get_session_service().start()
+
+    async def shutdown(self) -> None:
+        """백그라운드 작업을 중지하고 컨테이너가 보유한 인스턴스를 해제한다."""
+        if self._session_service is not None:
+            await self._session_service.stop()
+
+        self._session_service = None
+
+    def get_session_service(self) -> SessionService:
+        """
+        의존성 그래프에 주입할 세션 Service 인스턴스를 반환한다.
+
+        lifespan 밖(스크립트 등)에서 호출되면 최초 1회 지연 생성한다.
+        """
+        if self._override is not None:
+            return self._override
+
+        if self._session_service is None:
+            return self.init()
+
+        return self._session_service
+
+    def get_session_counters(self) -> dict:
+        """세션 Service의 누적 카운터를 반환한다. (Service가 아직 없으면 생성하지 않는다)"""
+        service = self._override or self._session_service
+        if service is not None:
+            return service.get_counters()
+        return {}
+
+    @contextmanager
+    def override(self, service: SessionService) -> Iterator[SessionService]:
+        """테스트용: with 블록 동안 지정한 세션 Service를 주입한다."""
+        previous = self._override
+        self._override = service
+        try:
+            yield service
+        finally:
+            self._override = previous
+
+
+authentication_container = AuthenticationContainer()
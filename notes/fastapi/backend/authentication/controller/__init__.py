@@ -0,0 +1 @@
+# Controller Package
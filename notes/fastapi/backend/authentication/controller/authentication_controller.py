@@ -0,0 +1,57 @@
+from fastapi import APIRouter, Depends
+
+from authentication.dependencies import (
+    clear_session_cookie,
+    get_current_user,
+    get_optional_current_user,
+    get_session_service,
+    get_session_token,
+)
+from authentication.schemas.session import AuthenticationStatusResponse, LogoutResponse, SessionUser
+from authentication.service import SessionService
+from infrastructure.responses import FastJSONResponse
+
+router = APIRouter(prefix="/authentication", tags=["Authentication"])
+
+
+@router.get("/status", response_model=AuthenticationStatusResponse)
+async def authentication_status(user: SessionUser | None = Depends(get_optional_current_user)):
+    """
+    로그인 상태 조회
+
+    세션 쿠키(또는 Bearer 세션 토큰)로 로그인 여부를 확인합니다. Kakao API를 호출하지 않습니다.
+
+    Returns:
+        AuthenticationStatusResponse: 로그인 여부 및 사용자 정보
+    """
+    return AuthenticationStatusResponse(logged_in=user is not None, user=user)
+
+
+@router.get("/me", response_model=SessionUser)
+async def current_user(user: SessionUser = Depends(get_current_user)):
+    """
+    현재 로그인한 사용자 조회
+
+    Returns:
+        SessionUser: 세션에 저장된 사용자 정보
+    """
+    return user
+
+
+@router.post("/logout", response_model=LogoutResponse)
+async def logout(
+    token: str | None = Depends(get_session_token),
+    service: SessionService = Depends(get_session_service),
+):
+    """
+    로그아웃
+
+    세션을 폐기하고 세션 쿠키를 삭제합니다.
+
+    Returns:
+        LogoutResponse: 로그아웃 처리 여부
+    """
+    logged_out = await service.revoke(token)
+    response = FastJSONResponse(content={"logged_out": logged_out})
+    clear_session_cookie(response, service)
+    return response
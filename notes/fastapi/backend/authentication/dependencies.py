@@ -0,0 +1,87 @@
+import hmac
+
+from fastapi import Depends, Header, HTTPException, Request, Response
+
+from authentication.container import authentication_container
+from authentication.schemas.session import SessionUser
+from authentication.service import IssuedSession, SessionService
+from config.env import get_env
+
+
+def get_session_service() -> SessionService:
+    """세션 Service 의존성 주입 (컨테이너가 보유한 프로세스 단일 인스턴스)"""
+    return authentication_container.get_session_service()
+
+
+def get_session_token(request: Request, service: SessionService = Depends(get_session_service)) -> str | None:
+    """세션 쿠키, 없으면 Authorization: Bearer 헤더에서 세션 토큰을 꺼낸다."""
+    token = request.cookies.get(service.config.cookie_name)
+    if token:
+        return token
+
+    scheme, _, credentials = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and credentials:
+        return credentials
+    return None
+
+
+async def get_optional_current_user(
+    token: str | None = Depends(get_session_token),
+    service: SessionService = Depends(get_session_service),
+) -> SessionUser | None:
+    """현재 세션의 사용자 (로그인하지 않았으면 None, upstream 호출 없음)"""
+    return await service.resolve(token)
+
+
+async def get_current_user(user: SessionUser | None = Depends(get_optional_current_user)) -> SessionUser:
+    """
+    현재 세션의 사용자 (upstream 호출 없음)
+
+    Raises:
+        HTTPException: 유효한 세션이 없는 경우 (401)
+    """
+    if user is None:
+        raise HTTPException(status_code=401, detail="로그인이 필요합니다.", headers={"WWW-Authenticate": "Bearer"})
+    return user
+
+
+def require_admin_token(x_admin_token: str | None = Header(None)) -> None:
+    """
+    관리자 API 토큰(X-Admin-Token 헤더)을 확인한다.
+
+    Raises:
+        HTTPException: ADMIN_API_TOKEN이 설정되지 않은 경우 (403), 토큰이 일치하지 않는 경우 (401)
+    """
+    expected = get_env("ADMIN_API_TOKEN")
+    if not expected:
+        raise HTTPException(status_code=403, detail="관리자 API가 비활성화되어 있습니다.")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token.encode(), expected.encode()):
+        raise HTTPException(status_code=401, detail="관리자 토큰이 유효하지 않습니다.")
+
+
+def set_session_cookie(response: Response, service: SessionService, session: IssuedSession) -> None:
+    """발급된 세션 토큰을 HttpOnly 쿠키로 설정한다."""
+    config = service.config
+    response.set_cookie(
+        key=config.cookie_name,
+        value=session.token,
+        max_age=session.max_age,
+        path="/",
+        domain=config.cookie_domain,
+        secure=config.cookie_secure,
+        httponly=True,
+        samesite=config.cookie_samesite,
+    )
+
+
+def clear_session_cookie(response: Response, service: SessionService) -> None:
+    """세션 쿠키를 삭제한다."""
+    config = service.config
+    response.delete_cookie(
+        key=config.cookie_name,
+        path="/",
+        domain=config.cookie_domain,
+        secure=config.cookie_secure,
+        httponly=True,
+        samesite=config.cookie_samesite,
+    )
@@ -0,0 +1,8 @@
+class SessionConfigurationError(RuntimeError):
+    """세션 필수 설정(환경 변수)이 누락된 경우"""
+    pass
+
+
+class SessionRevokedError(RuntimeError):
+    """같은 로그인으로 만든 세션이 이미 로그아웃/정리된 경우 (콜백 재전송)"""
+    pass
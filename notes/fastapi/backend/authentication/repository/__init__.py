@@ -0,0 +1,8 @@
+from authentication.repository.session_store_interface import SessionStoreInterface, StoredSession
+from authentication.repository.sqlite_session_store import SQLiteSessionStore
+
+__all__ = [
+    "SessionStoreInterface",
+    "StoredSession",
+    "SQLiteSessionStore",
+]
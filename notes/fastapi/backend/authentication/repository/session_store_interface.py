@@ -0,0 +1,52 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class StoredSession:
+    """저장된 세션 (시각은 epoch 초 단위)"""
+    session_id: str
+    user_id: int
+    created_at: float
+    expires_at: float
+    nickname: str | None = None
+    email: str | None = None
+    profile_image_url: str | None = None
+
+
+class SessionStoreInterface(ABC):
+    """세션 저장소 Interface"""
+
+    @abstractmethod
+    async def save(self, session: StoredSession) -> None:
+        """세션 저장"""
+        pass
+
+    @abstractmethod
+    async def insert(self, session: StoredSession) -> bool:
+        """같은 session_id가 없을 때만 저장한다. (저장했으면 True)"""
+        pass
+
+    @abstractmethod
+    async def get(self, session_id: str) -> StoredSession | None:
+        """세션 조회"""
+        pass
+
+    @abstractmethod
+    async def delete(self, session_id: str) -> None:
+        """세션 삭제"""
+        pass
+
+    @abstractmethod
+    async def revoke(self, session_id: str) -> None:
+        """세션 폐기: 만료 시각까지 조회되지 않으며 같은 session_id로 insert할 수 없다."""
+        pass
+
+    @abstractmethod
+    async def purge_expired(self, now: float) -> int:
+        """만료된 세션 삭제 후 삭제 건수 반환"""
+        pass
+
+    async def close(self) -> None:
+        """저장소 자원 정리"""
+        pass
@@ -0,0 +1,105 @@
+import asyncio
+import sqlite3
+import threading
+from pathlib import Path
+
+from authentication.repository.session_store_interface import SessionStoreInterface, StoredSession
+
+_COLUMNS = "session_id, user_id, created_at, expires_at, nickname, email, profile_image_url"
+
+
+class SQLiteSessionStore(SessionStoreInterface):
+    """
+    로컬 SQLite 파일 기반 세션 저장소
+
+    - WAL 모드를 사용해 여러 워커 프로세스가 같은 파일을 공유할 수 있다.
+    - SQLite 호출은 블로킹이므로 스레드에서 실행해 이벤트 루프를 막지 않는다.
+    - 폐기한 세션은 만료 시각까지 revoked=1 행(tombstone)으로 남겨 같은 session_id의 재저장(insert)을 막는다.
+    """
+
+    def __init__(self, path: str | Path):
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self._path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sessions (
+                session_id TEXT PRIMARY KEY,
+                user_id INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                nickname TEXT,
+                email TEXT,
+                profile_image_url TEXT,
+                revoked INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(sessions)")}
+        if "revoked" not in columns:
+            # 이전 버전에서 만든 파일: 폐기 표시 컬럼을 추가한다.
+            self._conn.execute("ALTER TABLE sessions ADD COLUMN revoked INTEGER NOT NULL DEFAULT 0")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_expires_at ON sessions (expires_at)")
+
+    def _execute(self, sql: str, params: tuple = ()) -> list[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _execute_rowcount(self, sql: str, params: tuple = ()) -> int:
+        with self._lock:
+            return self._conn.execute(sql, params).rowcount
+
+    def _delete_expired(self, now: float) -> int:
+        return self._execute_rowcount("DELETE FROM sessions WHERE expires_at <= ?", (now,))
+
+    @staticmethod
+    def _to_row(session: StoredSession) -> tuple:
+        return (
+            session.session_id,
+            session.user_id,
+            session.created_at,
+            session.expires_at,
+            session.nickname,
+            session.email,
+            session.profile_image_url,
+        )
+
+    async def save(self, session: StoredSession) -> None:
+        await asyncio.to_thread(
+            self._execute,
+            f"INSERT OR REPLACE INTO sessions ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            self._to_row(session),
+        )
+
+    async def insert(self, session: StoredSession) -> bool:
+        # 한 문장으로 존재 여부를 판단하므로 여러 워커가 같은 session_id로 동시에 호출해도 한 곳만 저장한다.
+        inserted = await asyncio.to_thread(
+            self._execute_rowcount,
+            f"INSERT OR IGNORE INTO sessions ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            self._to_row(session),
+        )
+        return inserted == 1
+
+    async def get(self, session_id: str) -> StoredSession | None:
+        rows = await asyncio.to_thread(
+            self._execute,
+            f"SELECT {_COLUMNS} FROM sessions WHERE session_id = ? AND revoked = 0",
+            (session_id,),
+        )
+        return StoredSession(*rows[0]) if rows else None
+
+    async def delete(self, session_id: str) -> None:
+        await asyncio.to_thread(self._execute, "DELETE FROM sessions WHERE session_id = ?", (session_id,))
+
+    async def revoke(self, session_id: str) -> None:
+        await asyncio.to_thread(self._execute, "UPDATE sessions SET revoked = 1 WHERE session_id = ?", (session_id,))
+
+    async def purge_expired(self, now: float) -> int:
+        return await asyncio.to_thread(self._delete_expired, now)
+
+    async def close(self) -> None:
+        with self._lock:
+            self._conn.close()
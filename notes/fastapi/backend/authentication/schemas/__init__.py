@@ -0,0 +1 @@
+# Schemas Package
@@ -0,0 +1,21 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+
+
+class SessionUser(BaseModel):
+    """세션에 저장된 사용자 정보"""
+    user_id: int = Field(..., description="Kakao 회원번호")
+    nickname: Optional[str] = Field(None, description="닉네임")
+    email: Optional[str] = Field(None, description="이메일")
+    profile_image_url: Optional[str] = Field(None, description="프로필 이미지 URL")
+
+
+class AuthenticationStatusResponse(BaseModel):
+    """로그인 상태 응답"""
+    logged_in: bool = Field(..., description="로그인 여부")
+    user: Optional[SessionUser] = Field(None, description="로그인한 사용자 정보")
+
+
+class LogoutResponse(BaseModel):
+    """로그아웃 응답"""
+    logged_out: bool = Field(..., description="로그아웃 처리 여부")
@@ -0,0 +1,3 @@
+from authentication.service.session_service import IssuedSession, SessionConfig, SessionService
+
+__all__ = ["IssuedSession", "SessionConfig", "SessionService"]
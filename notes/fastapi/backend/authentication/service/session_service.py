@@ -0,0 +1,260 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import logging
+import random
+import secrets
+import time
+from dataclasses import dataclass
+
+from config.env import get_bool_env, get_env, get_float_env, get_int_env
+from infrastructure.cache import TTLLRUCache
+from authentication.exceptions import SessionConfigurationError, SessionRevokedError
+from authentication.repository import SessionStoreInterface, StoredSession
+from authentication.schemas.session import SessionUser
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SessionConfig:
+    """세션 발급/조회 설정"""
+    secret_key: str = ""
+    ttl: float = 7 * 24 * 3600.0
+    cookie_name: str = "session"
+    cookie_secure: bool = False
+    cookie_samesite: str = "lax"
+    cookie_domain: str | None = None
+    # 프로세스 내 LRU 캐시. 다른 워커에서 로그아웃한 세션이 이 시간 동안 남을 수 있으므로 짧게 둔다.
+    cache_ttl: float = 60.0
+    cache_max_entries: int = 100_000
+    purge_interval: float = 3600.0
+
+    @classmethod
+    def from_env(cls) -> "SessionConfig":
+        default = cls()
+        return cls(
+            secret_key=get_env("SESSION_SECRET_KEY", "") or "",
+            ttl=get_float_env("SESSION_TTL", default.ttl),
+            cookie_name=get_env("SESSION_COOKIE_NAME", default.cookie_name) or default.cookie_name,
+            cookie_secure=get_bool_env("SESSION_COOKIE_SECURE", default.cookie_secure),
+            cookie_samesite=(get_env("SESSION_COOKIE_SAMESITE", default.cookie_samesite) or "lax").lower(),
+            cookie_domain=get_env("SESSION_COOKIE_DOMAIN") or None,
+            cache_ttl=get_float_env("SESSION_CACHE_TTL", default.cache_ttl),
+            cache_max_entries=get_int_env("SESSION_CACHE_MAX_ENTRIES", default.cache_max_entries),
+            purge_interval=get_float_env("SESSION_PURGE_INTERVAL", default.purge_interval),
+        )
+
+
+@dataclass(frozen=True)
+class IssuedSession:
+    """발급된 세션 토큰 (created: 이번 호출에서 새로 만든 세션인지 여부)"""
+    token: str
+    expires_at: float
+    max_age: int
+    created: bool = True
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+class SessionService:
+    """
+    자체 세션 발급/조회 Service
+
+    - 토큰 형식은 "<session_id>.<expires_at>.<signature>"이며 서명은 HMAC-SHA256이다.
+    - 서명/만료 검증은 저장소 조회 없이 수행되므로 위조·만료 토큰은 I/O 없이 거절된다.
+    - 유효한 토큰은 프로세스 내 LRU에서 먼저 찾고, 없으면 SQLite 저장소에서 읽어 채운다.
+    - 사용자 확인에 Kakao upstream 호출이 필요 없다.
+    - login_key를 주면 세션 ID를 그 키에서 결정적으로 만들므로, 같은 로그인의 중복 콜백은 워커가 달라도 같은 세션을 받는다.
+    """
+
+    def __init__(self, store: SessionStoreInterface, config: SessionConfig | None = None):
+        self._store = store
+        self._config = config or SessionConfig.from_env()
+
+        # 워커마다 임시 키를 쓰면 다른 워커가 발급한 세션과 login_key 중복 판별이 깨지므로 기동 단계에서 실패한다.
+        if not self._config.secret_key:
+            raise SessionConfigurationError("SESSION_SECRET_KEY 환경 변수가 설정되지 않았습니다.")
+        self._secret = self._config.secret_key.encode()
+
+        self._cache: TTLLRUCache[SessionUser] = TTLLRUCache(
+            max_entries=self._config.cache_max_entries,
+            max_bytes=self._config.cache_max_entries * 1024,
+            default_ttl=self._config.cache_ttl,
+        )
+        self._task: asyncio.Task | None = None
+
+        self.issued = 0
+        self.revoked = 0
+        self.rejected = 0
+        self.store_hits = 0
+        self.store_misses = 0
+        self.purged = 0
+
+    @property
+    def config(self) -> SessionConfig:
+        return self._config
+
+    def _sign(self, payload: str) -> str:
+        return _b64encode(hmac.new(self._secret, payload.encode(), hashlib.sha256).digest())
+
+    def _verify(self, token: str) -> str | None:
+        """서명과 만료를 확인하고 세션 ID를 반환한다."""
+        try:
+            session_id, expires_at, signature = token.split(".")
+            expired = int(expires_at) <= time.time()
+        except ValueError:
+            return None
+
+        if not hmac.compare_digest(signature, self._sign(f"{session_id}.{expires_at}")):
+            return None
+        if expired:
+            return None
+        return session_id
+
+    async def create_session(self, user: SessionUser, login_key: str | None = None) -> IssuedSession:
+        """
+        사용자 세션을 생성하고 서명된 세션 토큰을 반환한다.
+
+        Args:
+            user: 세션에 저장할 사용자 정보
+            login_key: 같은 로그인을 식별하는 키 (예: 발급된 액세스 토큰의 해시).
+                이미 이 키로 만든 세션이 있으면 새로 만들지 않고 그 세션을 반환한다. (created=False)
+
+        Returns:
+            IssuedSession: 세션 토큰과 만료 정보
+
+        Raises:
+            SessionRevokedError: 이 키로 만든 세션이 이미 로그아웃/정리된 경우
+        """
+        now = time.time()
+        expires_at = int(now + self._config.ttl)
+        stored = StoredSession(
+            session_id=secrets.token_urlsafe(32) if login_key is None else self._sign(f"login:{login_key}"),
+            user_id=user.user_id,
+            created_at=now,
+            expires_at=expires_at,
+            nickname=user.nickname,
+            email=user.email,
+            profile_image_url=user.profile_image_url,
+        )
+
+        created = True
+        if login_key is None:
+            await self._store.save(stored)
+        elif not await self._store.insert(stored):
+            created = False
+            existing = await self._store.get(stored.session_id)
+            if existing is None:
+                # 그사이 로그아웃/정리된 경우: 다시 저장하면 로그아웃한 세션이 되살아나므로 거절한다.
+                raise SessionRevokedError("이미 종료된 로그인입니다.")
+            expires_at = int(existing.expires_at)
+
+        self._cache.set(stored.session_id, user)
+        if created:
+            self.issued += 1
+
+        payload = f"{stored.session_id}.{expires_at}"
+        return IssuedSession(
+            token=f"{payload}.{self._sign(payload)}",
+            expires_at=expires_at,
+            max_age=max(0, expires_at - int(now)),
+            created=created,
+        )
+
+    async def resolve(self, token: str | None) -> SessionUser | None:
+        """
+        세션 토큰으로 사용자를 조회한다.
+
+        Returns:
+            SessionUser | None: 유효한 세션의 사용자 정보, 없거나 만료되었으면 None
+        """
+        if not token:
+            return None
+
+        session_id = self._verify(token)
+        if session_id is None:
+            self.rejected += 1
+            return None
+
+        user = self._cache.get(session_id)
+        if user is not None:
+            return user
+
+        stored = await self._store.get(session_id)
+        if stored is None or stored.expires_at <= time.time():
+            self.store_misses += 1
+            return None
+
+        self.store_hits += 1
+        user = SessionUser(
+            user_id=stored.user_id,
+            nickname=stored.nickname,
+            email=stored.email,
+            profile_image_url=stored.profile_image_url,
+        )
+        self._cache.set(session_id, user, ttl=stored.expires_at - time.time())
+        return user
+
+    async def revoke(self, token: str | None) -> bool:
+        """
+        세션을 폐기한다.
+
+        Returns:
+            bool: 유효한 세션 토큰이었는지 여부
+        """
+        session_id = self._verify(token) if token else None
+        if session_id is None:
+            return False
+
+        self._cache.delete(session_id)
+        # 삭제 대신 폐기 표시를 남겨, 같은 로그인의 콜백 재전송이 세션을 되살리지 못하게 한다.
+        await self._store.revoke(session_id)
+        self.revoked += 1
+        return True
+
+    async def purge_expired(self) -> int:
+        """만료된 세션을 저장소에서 삭제한다."""
+        purged = await self._store.purge_expired(time.time())
+        self.purged += purged
+        return purged
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.purge_expired()
+            except Exception:
+                logger.exception("만료 세션 정리 작업이 실패했습니다.")
+            await asyncio.sleep(self._config.purge_interval * random.uniform(0.5, 1.5))
+
+    def start(self) -> None:
+        """백그라운드 만료 세션 정리 작업을 시작한다."""
+        if self._task is None and self._config.purge_interval > 0:
+            self._task = asyncio.create_task(self._run(), name="session-purger")
+
+    async def stop(self) -> None:
+        """백그라운드 작업을 중지하고 저장소를 닫는다."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._store.close()
+
+    def get_counters(self) -> dict:
+        return {
+            "issued": self.issued,
+            "revoked": self.revoked,
+            "rejected": self.rejected,
+            "store_hits": self.store_hits,
+            "store_misses": self.store_misses,
+            "purged": self.purged,
+        }
+
+    def get_stats(self) -> dict:
+        return {**self.get_counters(), "cache": self._cache.stats()}
@@ -0,0 +1,315 @@
+"""
+kakao-authentication 라우트 동시성 벤치마크
+
+로컬 Kakao 대역 서버(kakao_mock_server)와 백엔드를 각각 uvicorn 프로세스로 띄운 뒤,
+지정한 동시성으로 엔드포인트를 호출하여 처리량과 p50/p95/p99 지연을 측정한다.
+결과는 JSON으로 저장되며, 기준선(baseline)과 비교해 회귀가 있으면 종료 코드 1로 실패한다.
+기준선과 측정 조건(동시성, 요청 수, 워밍업, 대역 서버 지연)이 다르면 비교하지 않고 종료 코드 2로 실패한다.
+
+실행 예:
+    python -m benchmark.run_benchmark
+    python -m benchmark.run_benchmark --concurrency 50 --requests 2000 --baseline /tmp/baseline-c50.json --update-baseline
+    python -m benchmark.run_benchmark --update-baseline
+    python -m benchmark.run_benchmark --target http://127.0.0.1:33333   # 이미 떠 있는 서버 대상
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import httpx
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_OUTPUT = Path(__file__).resolve().parent / "results" / "latest.json"
+
+SCENARIOS = {
+    "root": "/",
+    "health": "/health",
+    "request_oauth_link": "/kakao-authentication/request-oauth-link",
+    "request_access_token_after_redirection": "/kakao-authentication/request-access-token-after-redirection",
+}
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    path: str
+    concurrency: int
+    requests: int
+    errors: int
+    duration_s: float
+    throughput_rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """정렬된 값에서 선형 보간 백분위수를 구한다."""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    weight = position - lower
+    return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_uvicorn(app: str, port: int, env: dict[str, str]) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", app, "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+        env={**os.environ, **env},
+    )
+
+
+def _wait_until_healthy(base_url: str, timeout: float = 20.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError(f"서버가 시작되지 않았습니다: {base_url}")
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    name: str,
+    path: str,
+    concurrency: int,
+    total_requests: int,
+    warmup: int,
+) -> ScenarioResult:
+    """하나의 엔드포인트를 지정한 동시성으로 호출하여 지연 분포를 측정한다."""
+    counter = 0
+    latencies: list[float] = []
+    errors = 0
+
+    def next_params() -> dict | None:
+        nonlocal counter
+        counter += 1
+        if name == "request_access_token_after_redirection":
+            # 요청마다 다른 인가 코드를 사용해 single-flight 결과 캐시가 아닌 실제 교환 경로를 측정한다.
+            return {"code": f"bench-{time.time_ns()}-{counter}"}
+        return None
+
+    for _ in range(warmup):
+        await client.get(path, params=next_params())
+
+    remaining = total_requests
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            params = next_params()
+            started = time.perf_counter()
+            try:
+                response = await client.get(path, params=params)
+                ok = response.status_code < 400
+            except httpx.HTTPError:
+                ok = False
+            latencies.append((time.perf_counter() - started) * 1000)
+            if not ok:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    duration = time.perf_counter() - started
+
+    latencies.sort()
+    return ScenarioResult(
+        name=name,
+        path=path,
+        concurrency=concurrency,
+        requests=len(latencies),
+        errors=errors,
+        duration_s=round(duration, 3),
+        throughput_rps=round(len(latencies) / duration, 1) if duration else 0.0,
+        p50_ms=round(percentile(latencies, 0.50), 2),
+        p95_ms=round(percentile(latencies, 0.95), 2),
+        p99_ms=round(percentile(latencies, 0.99), 2),
+        max_ms=round(latencies[-1], 2) if latencies else 0.0,
+    )
+
+
+def benchmark_parameters(args: argparse.Namespace) -> dict:
+    """결과 비교에 영향을 주는 측정 조건 (실행 중인 서버를 대상으로 하면 대역 서버 지연은 알 수 없다)"""
+    return {
+        "concurrency": args.concurrency,
+        "requests": args.requests,
+        "warmup": args.warmup,
+        "mock_latency": args.mock_latency if args.target is None else None,
+    }
+
+
+def parameter_mismatches(parameters: dict, baseline: dict) -> list[str]:
+    """기준선과 측정 조건이 다른 항목을 반환한다. (조건이 기록되지 않은 기준선은 비교할 수 없다)"""
+    base = baseline.get("parameters")
+    if base is None:
+        return ["기준선에 측정 조건(parameters)이 없습니다."]
+    return [
+        f"{key}: {parameters.get(key)!r} != baseline {base.get(key)!r}"
+        for key in sorted(parameters.keys() | base.keys())
+        if parameters.get(key) != base.get(key)
+    ]
+
+
+def compare_with_baseline(results: list[ScenarioResult], baseline: dict, tolerance: float) -> list[str]:
+    """기준선 대비 처리량 감소 / p95·p99 증가가 허용 범위를 넘은 항목을 반환한다."""
+    regressions: list[str] = []
+    baseline_by_name = {item["name"]: item for item in baseline.get("scenarios", [])}
+
+    for result in results:
+        base = baseline_by_name.get(result.name)
+        if base is None:
+            continue
+
+        if result.throughput_rps < base["throughput_rps"] * (1 - tolerance):
+            regressions.append(
+                f"{result.name}: throughput {result.throughput_rps} rps < baseline {base['throughput_rps']} rps"
+            )
+        for key in ("p95_ms", "p99_ms"):
+            if getattr(result, key) > base[key] * (1 + tolerance):
+                regressions.append(f"{result.name}: {key} {getattr(result, key)} > baseline {base[key]}")
+        if result.errors > base.get("errors", 0):
+            regressions.append(f"{result.name}: errors {result.errors} > baseline {base.get('errors', 0)}")
+
+    return regressions
+
+
+async def run(args: argparse.Namespace) -> list[ScenarioResult]:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.target, limits=limits, timeout=30.0) as client:
+        results = []
+        for name in args.scenarios:
+            result = await run_scenario(
+                client, name, SCENARIOS[name], args.concurrency, args.requests, args.warmup
+            )
+            print(
+                f"{name:<42} {result.throughput_rps:>9.1f} rps  "
+                f"p50 {result.p50_ms:>7.2f}ms  p95 {result.p95_ms:>7.2f}ms  "
+                f"p99 {result.p99_ms:>7.2f}ms  errors {result.errors}"
+            )
+            results.append(result)
+        return results
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="kakao-authentication 라우트 동시성 벤치마크")
+    parser.add_argument("--target", help="이미 실행 중인 백엔드 주소 (없으면 대역 서버와 백엔드를 직접 띄운다)")
+    # 기본값은 benchmark/baseline.json의 측정 조건과 같아야 한다.
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=500, help="시나리오별 요청 수")
+    parser.add_argument("--warmup", type=int, default=50, help="시나리오별 워밍업 요청 수")
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--mock-latency", default="fixed:ms=20", help="대역 서버 지연 분포 (MOCK_KAKAO_LATENCY)")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="기준선 대비 허용 오차 비율")
+    parser.add_argument("--update-baseline", action="store_true", help="이번 결과를 기준선으로 저장")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    parameters = benchmark_parameters(args)
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else None
+
+    # 조건이 다른 기준선과는 비교할 수 없으므로 측정 전에 거절한다.
+    if baseline is not None and not args.update_baseline:
+        mismatches = parameter_mismatches(parameters, baseline)
+        if mismatches:
+            print("기준선과 측정 조건이 달라 비교할 수 없습니다:", file=sys.stderr)
+            for mismatch in mismatches:
+                print(f"  - {mismatch}", file=sys.stderr)
+            print("같은 조건으로 실행하거나 --baseline/--update-baseline으로 별도 기준선을 기록하세요.", file=sys.stderr)
+            return 2
+
+    processes: list[subprocess.Popen] = []
+
+    try:
+        if args.target is None:
+            mock_port, backend_port = _free_port(), _free_port()
+            mock_url = f"http://127.0.0.1:{mock_port}"
+            processes.append(
+                _start_uvicorn("kakao_mock_server.main:app", mock_port, {"MOCK_KAKAO_LATENCY": args.mock_latency})
+            )
+            _wait_until_healthy(mock_url)
+            processes.append(
+                _start_uvicorn(
+                    "main:app",
+                    backend_port,
+                    {
+                        "KAKAO_CLIENT_ID": os.getenv("KAKAO_CLIENT_ID", "benchmark-client-id"),
+                        "SESSION_SECRET_KEY": os.getenv("SESSION_SECRET_KEY", "benchmark-session-secret"),
+                        "KAKAO_REDIRECT_URI": os.getenv(
+                            "KAKAO_REDIRECT_URI",
+                            f"http://127.0.0.1:{backend_port}/kakao-authentication/request-access-token-after-redirection",
+                        ),
+                        "KAKAO_AUTH_BASE_URL": f"{mock_url}/oauth/authorize",
+                        "KAKAO_TOKEN_URL": f"{mock_url}/oauth/token",
+                        "KAKAO_USER_INFO_URL": f"{mock_url}/v2/user/me",
+                    },
+                )
+            )
+            args.target = f"http://127.0.0.1:{backend_port}"
+            _wait_until_healthy(args.target)
+
+        results = asyncio.run(run(args))
+    finally:
+        for process in processes:
+            process.terminate()
+            process.wait(timeout=10)
+
+    report = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": parameters,
+        "scenarios": [asdict(result) for result in results],
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n")
+    print(f"결과 저장: {args.output}")
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n")
+        print(f"기준선 갱신: {args.baseline}")
+        return 0
+
+    if baseline is None:
+        print("기준선 파일이 없어 비교를 생략합니다. (--update-baseline으로 생성)")
+        return 0
+
+    regressions = compare_with_baseline(results, baseline, args.tolerance)
+    if regressions:
+        print("\n!!! 성능 회귀 감지 !!!", file=sys.stderr)
+        for regression in regressions:
+            print(f"  - {regression}", file=sys.stderr)
+        return 1
+
+    print("기준선 대비 회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
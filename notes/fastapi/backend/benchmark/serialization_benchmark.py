@@ -0,0 +1,86 @@
+"""
+인증 완료 응답 직렬화 마이크로 벤치마크
+
+/request-access-token-after-redirection 응답을 만드는 두 경로의 요청당 CPU 시간을 비교한다.
+- standard: 검증 모델 생성 → response_model 재검증 → jsonable_encoder → 표준 json
+- fast: model_construct(검증 생략) → model_dump → orjson (FAST_RESPONSE_MODE)
+
+실행 예:
+    python -m benchmark.serialization_benchmark --number 20000
+"""
+import argparse
+import json
+import time
+
+from fastapi.encoders import jsonable_encoder
+
+from infrastructure.responses import dumps, orjson
+from kakao_authentication.schemas.kakao_oauth import (
+    KakaoAuthCompleteResponse,
+    KakaoTokenResponse,
+    KakaoUserInfoResponse,
+)
+
+TOKEN_DATA = {
+    "access_token": "x" * 54,
+    "token_type": "bearer",
+    "refresh_token": "y" * 54,
+    "expires_in": 21599,
+    "refresh_token_expires_in": 5183999,
+    "scope": "account_email profile_image profile_nickname",
+}
+USER_INFO_DATA = {
+    "id": 1234567890,
+    "nickname": "홍길동",
+    "email": "user@example.com",
+    "profile_image_url": "http://k.kakaocdn.net/dn/mock/img_640x640.jpg",
+}
+
+
+def standard_path() -> bytes:
+    response = KakaoAuthCompleteResponse(
+        token=KakaoTokenResponse(**TOKEN_DATA),
+        user_info=KakaoUserInfoResponse(**USER_INFO_DATA),
+    )
+    # FastAPI의 response_model 처리: 반환값을 응답 모델로 다시 검증한 뒤 인코딩한다.
+    validated = KakaoAuthCompleteResponse.model_validate(response.model_dump())
+    return json.dumps(
+        jsonable_encoder(validated), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def fast_path() -> bytes:
+    token = KakaoTokenResponse.model_construct(**TOKEN_DATA)
+    user_info = KakaoUserInfoResponse.model_construct(**USER_INFO_DATA)
+    return dumps({"token": token.model_dump(), "user_info": user_info.model_dump()})
+
+
+def measure(fn, number: int, repeat: int) -> float:
+    """repeat회 측정 중 가장 빠른 값의 호출당 CPU 시간(µs)"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.process_time()
+        for _ in range(number):
+            fn()
+        best = min(best, time.process_time() - started)
+    return best / number * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="인증 완료 응답 직렬화 마이크로 벤치마크")
+    parser.add_argument("--number", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    assert json.loads(standard_path()) == json.loads(fast_path()), "두 경로의 응답 본문이 다릅니다."
+
+    standard = measure(standard_path, args.number, args.repeat)
+    fast = measure(fast_path, args.number, args.repeat)
+    print(f"orjson 사용: {orjson is not None}")
+    print(f"standard: {standard:8.2f} µs/request")
+    print(f"fast:     {fast:8.2f} µs/request")
+    print(f"절감:     {standard - fast:8.2f} µs/request ({(1 - fast / standard) * 100:.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,11 @@
 from config.env import load_env
+from config.settings import Settings, SettingsWatcher, get_settings, reload_settings, subscribe_settings
 
-__all__ = ["load_env"]
+__all__ = [
+    "load_env",
+    "Settings",
+    "SettingsWatcher",
+    "get_settings",
+    "reload_settings",
+    "subscribe_settings",
+]
@@ -1,6 +1,6 @@
-import os
 from pathlib import Path
-from dotenv import load_dotenv
+
+from config.settings import get_settings, init_settings
 
 _env_loaded = False
 
@@ -11,31 +11,78 @@ def load_env() -> None:
 
     - 환경 변수 로딩 책임은 config 패키지에 명시적으로 위치한다.
     - Service 및 Controller에서는 .env 파일을 직접 로드하지 않는다.
-    - 환경 변수 로딩 여부는 애플리케이션 전역에서 일관되게 보장된다.
+    - .env와 프로세스 환경 변수는 1회 파싱되어 불변 설정 스냅샷(config.settings)이 된다.
     """
     global _env_loaded
 
     if _env_loaded:
         return
 
-    env_path = Path(__file__).parent.parent / ".env"
-
-    if env_path.exists():
-        load_dotenv(dotenv_path=env_path)
+    init_settings(Path(__file__).parent.parent / ".env")
 
     _env_loaded = True
 
 
 def get_env(key: str, default: str | None = None) -> str | None:
-    """환경 변수 값을 가져온다."""
-    return os.getenv(key, default)
+    """설정값을 가져온다. (현재 설정 스냅샷에서 조회)"""
+    return get_settings().get(key, default)
 
 
 def get_kakao_client_id() -> str | None:
     """Kakao Client ID를 가져온다."""
-    return get_env("KAKAO_CLIENT_ID")
+    return get_settings().kakao.client_id
 
 
 def get_kakao_redirect_uri() -> str | None:
     """Kakao Redirect URI를 가져온다."""
-    return get_env("KAKAO_REDIRECT_URI")
+    return get_settings().kakao.redirect_uri
+
+
+def get_kakao_auth_base_url(default: str) -> str:
+    """Kakao 인증(authorize) URL을 가져온다. (로컬 대역 서버 사용 시 재정의)"""
+    return get_settings().kakao.auth_base_url or default
+
+
+def get_kakao_token_url(default: str) -> str:
+    """Kakao 토큰 발급 URL을 가져온다. (로컬 대역 서버 사용 시 재정의)"""
+    return get_settings().kakao.token_url or default
+
+
+def get_kakao_user_info_url(default: str) -> str:
+    """Kakao 사용자 정보 조회 URL을 가져온다. (로컬 대역 서버 사용 시 재정의)"""
+    return get_settings().kakao.user_info_url or default
+
+
+def get_kakao_jwks_url(default: str) -> str:
+    """Kakao OIDC 공개키(JWKS) URL 가져오기 (KAKAO_JWKS_URL이 없으면 기본값)"""
+    return get_settings().kakao.jwks_url or default
+
+
+def get_kakao_oidc_enabled() -> bool:
+    """OpenID Connect 모드 여부 (openid scope 요청 + id_token 로컬 검증). 기본값은 False."""
+    return get_settings().kakao.oidc_enabled
+
+
+def get_kakao_oauth_state_enabled() -> bool:
+    """인증 요청에 state / PKCE(S256)를 포함하고 콜백에서 검증할지 여부. 기본값은 False."""
+    return get_settings().kakao.state_enabled
+
+
+def get_fast_response_mode() -> bool:
+    """빠른 응답 모드 여부 (upstream 응답 재검증 생략 + orjson 직렬화). 기본값은 True."""
+    return get_settings().fast_response_mode
+
+
+def get_int_env(key: str, default: int) -> int:
+    """정수형 설정값을 가져온다. 값이 없거나 형식이 잘못되면 기본값을 사용한다."""
+    return get_settings().get_int(key, default)
+
+
+def get_float_env(key: str, default: float) -> float:
+    """실수형 설정값을 가져온다. 값이 없거나 형식이 잘못되면 기본값을 사용한다."""
+    return get_settings().get_float(key, default)
+
+
+def get_bool_env(key: str, default: bool = False) -> bool:
+    """불리언 설정값을 가져온다. (1/true/yes/on → True)"""
+    return get_settings().get_bool(key, default)
@@ -0,0 +1,308 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, Mapping
+
+from dotenv import dotenv_values
+
+logger = logging.getLogger(__name__)
+
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "no", "off"})
+
+
+class SettingsError(ValueError):
+    """설정값이 올바르지 않은 경우"""
+
+
+@dataclass(frozen=True)
+class KakaoSettings:
+    """Kakao OAuth 설정 (엔드포인트 URL이 None이면 Service 기본값을 사용한다)"""
+    client_id: str | None = None
+    redirect_uri: str | None = None
+    auth_base_url: str | None = None
+    token_url: str | None = None
+    user_info_url: str | None = None
+    jwks_url: str | None = None
+    oidc_enabled: bool = False
+    state_enabled: bool = False
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    불변 설정 스냅샷
+
+    - .env와 프로세스 환경 변수를 한 번 파싱해 만든다. (프로세스 환경 변수가 우선)
+    - 자주 쓰는 값은 타입이 지정된 속성으로, 나머지는 values / get_*()로 조회한다.
+    - 설정이 바뀌면 새 스냅샷으로 통째로 교체되므로 읽는 쪽은 잠금 없이 일관된 값을 본다.
+    """
+    values: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+    version: int = 0
+    loaded_at: float = 0.0
+    kakao: KakaoSettings = KakaoSettings()
+    fast_response_mode: bool = True
+    server_timing_enabled: bool = True
+
+    @classmethod
+    def parse(cls, values: Mapping[str, str], version: int = 0) -> "Settings":
+        """
+        설정값 mapping을 검증해 스냅샷을 만든다.
+
+        Raises:
+            SettingsError: 타입이 지정된 설정값의 형식이 올바르지 않은 경우
+        """
+        values = MappingProxyType(dict(values))
+        return cls(
+            values=values,
+            version=version,
+            loaded_at=time.time(),
+            kakao=KakaoSettings(
+                client_id=_optional(values, "KAKAO_CLIENT_ID"),
+                redirect_uri=_optional(values, "KAKAO_REDIRECT_URI"),
+                auth_base_url=_url(values, "KAKAO_AUTH_BASE_URL"),
+                token_url=_url(values, "KAKAO_TOKEN_URL"),
+                user_info_url=_url(values, "KAKAO_USER_INFO_URL"),
+                jwks_url=_url(values, "KAKAO_JWKS_URL"),
+                oidc_enabled=_bool(values, "KAKAO_OIDC_ENABLED", False),
+                state_enabled=_bool(values, "KAKAO_OAUTH_STATE_ENABLED", False),
+            ),
+            fast_response_mode=_bool(values, "FAST_RESPONSE_MODE", True),
+            server_timing_enabled=_bool(values, "SERVER_TIMING_ENABLED", True),
+        )
+
+    def get(self, key: str, default: str | None = None) -> str | None:
+        return self.values.get(key, default)
+
+    def get_int(self, key: str, default: int) -> int:
+        """값이 없거나 형식이 잘못되면 기본값을 사용한다."""
+        value = self.values.get(key)
+        if value is None or value.strip() == "":
+            return default
+        try:
+            return int(value)
+        except ValueError:
+            return default
+
+    def get_float(self, key: str, default: float) -> float:
+        """값이 없거나 형식이 잘못되면 기본값을 사용한다."""
+        value = self.values.get(key)
+        if value is None or value.strip() == "":
+            return default
+        try:
+            return float(value)
+        except ValueError:
+            return default
+
+    def get_bool(self, key: str, default: bool = False) -> bool:
+        """1/true/yes/on → True"""
+        value = self.values.get(key)
+        if value is None or value.strip() == "":
+            return default
+        return value.strip().lower() in _TRUE_VALUES
+
+
+def _optional(values: Mapping[str, str], key: str) -> str | None:
+    value = values.get(key)
+    return value if value else None
+
+
+def _url(values: Mapping[str, str], key: str) -> str | None:
+    value = _optional(values, key)
+    if value is not None and not value.startswith(("http://", "https://")):
+        raise SettingsError(f"{key}는 http(s) URL이어야 합니다: {value}")
+    return value
+
+
+def _bool(values: Mapping[str, str], key: str, default: bool) -> bool:
+    value = values.get(key)
+    if value is None or value.strip() == "":
+        return default
+    normalized = value.strip().lower()
+    if normalized in _TRUE_VALUES:
+        return True
+    if normalized in _FALSE_VALUES:
+        return False
+    raise SettingsError(f"{key}는 true/false 값이어야 합니다: {value}")
+
+
+SettingsListener = Callable[[Settings, Settings], None]
+
+_lock = threading.RLock()
+_current: Settings | None = None
+_env_path: Path | None = None
+# .env를 읽기 전의 프로세스 환경 변수. 재로드 시 .env보다 우선한다.
+_process_environ: dict[str, str] = {}
+_listeners: list[SettingsListener] = []
+
+
+def _read_values() -> dict[str, str]:
+    values: dict[str, str] = {}
+    if _env_path is not None and _env_path.exists():
+        values.update({key: value for key, value in dotenv_values(_env_path).items() if value is not None})
+    values.update(_process_environ)
+    return values
+
+
+def _sync_environ(previous: Mapping[str, str], values: Mapping[str, str]) -> None:
+    """.env에서 온 값을 os.environ에도 반영한다. (환경 변수를 직접 읽는 라이브러리용)"""
+    for key in previous.keys() - values.keys():
+        if key not in _process_environ:
+            os.environ.pop(key, None)
+    for key, value in values.items():
+        if key not in _process_environ:
+            os.environ[key] = value
+
+
+def init_settings(env_path: Path | None) -> Settings:
+    """
+    .env 파일과 현재 프로세스 환경 변수로 최초 스냅샷을 만든다. (load_env에서 1회 호출)
+
+    Raises:
+        SettingsError: 설정값의 형식이 올바르지 않은 경우
+    """
+    global _current, _env_path, _process_environ
+
+    with _lock:
+        _env_path = env_path
+        _process_environ = dict(os.environ)
+        values = _read_values()
+        _current = Settings.parse(values, version=1)
+        _sync_environ({}, values)
+        return _current
+
+
+def get_settings() -> Settings:
+    """현재 설정 스냅샷을 반환한다. (초기화 전이면 프로세스 환경 변수만으로 만든다)"""
+    global _current
+
+    settings = _current
+    if settings is None:
+        with _lock:
+            if _current is None:
+                _current = Settings.parse(os.environ, version=1)
+            settings = _current
+    return settings
+
+
+def reload_settings() -> bool:
+    """
+    .env를 다시 읽어 값이 바뀌었으면 새 스냅샷으로 교체하고 구독자에게 알린다.
+
+    형식이 잘못된 값이 있으면 기존 스냅샷을 유지한다.
+
+    Returns:
+        bool: 스냅샷이 교체되었는지 여부
+    """
+    global _current
+
+    with _lock:
+        previous = get_settings()
+        values = _read_values()
+        if values == dict(previous.values):
+            return False
+        try:
+            settings = Settings.parse(values, version=previous.version + 1)
+        except SettingsError:
+            logger.exception("변경된 설정값이 올바르지 않아 기존 설정을 유지합니다.")
+            return False
+        _sync_environ(previous.values, values)
+        _current = settings
+        listeners = list(_listeners)
+
+    logger.info("설정을 다시 읽었습니다. (version=%d)", settings.version)
+    for listener in listeners:
+        try:
+            listener(previous, settings)
+        except Exception:
+            logger.exception("설정 변경 구독자 처리 중 오류가 발생했습니다.")
+    return True
+
+
+def subscribe_settings(listener: SettingsListener) -> Callable[[], None]:
+    """
+    설정 스냅샷 교체 시 호출될 구독자를 등록한다.
+
+    Returns:
+        Callable[[], None]: 구독 해제 함수
+    """
+    _listeners.append(listener)
+    return lambda: _listeners.remove(listener) if listener in _listeners else None
+
+
+class SettingsWatcher:
+    """
+    .env 파일 변경 감시 (mtime / 크기 / inode 폴링)
+
+    편집기의 원자적 저장(임시 파일 + rename)도 inode 변화로 감지한다.
+    """
+
+    def __init__(self, interval: float = 2.0):
+        self._interval = interval
+        self._signature: tuple | None = None
+        self._task: asyncio.Task | None = None
+
+        self.checks = 0
+        self.reloads = 0
+
+    @staticmethod
+    def _stat_signature() -> tuple | None:
+        if _env_path is None:
+            return None
+        try:
+            stat = _env_path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def check(self) -> bool:
+        """파일이 바뀌었으면 설정을 다시 읽는다."""
+        self.checks += 1
+        signature = self._stat_signature()
+        if signature == self._signature:
+            return False
+
+        self._signature = signature
+        if reload_settings():
+            self.reloads += 1
+            return True
+        return False
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                self.check()
+            except Exception:
+                logger.exception(".env 변경 감시 중 오류가 발생했습니다.")
+
+    def start(self) -> None:
+        """감시 작업을 시작한다. (interval이 0 이하이면 감시하지 않는다)"""
+        if self._task is not None or self._interval <= 0:
+            return
+        self._signature = self._stat_signature()
+        self._task = asyncio.create_task(self._run(), name="settings-watcher")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> dict:
+        settings = get_settings()
+        return {
+            "version": settings.version,
+            "loaded_at": settings.loaded_at,
+            "watching": self._task is not None,
+            "checks": self.checks,
+            "reloads": self.reloads,
+        }
@@ -0,0 +1 @@
+# Infrastructure Package
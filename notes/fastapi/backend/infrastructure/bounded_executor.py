@@ -0,0 +1,139 @@
+import asyncio
+import contextvars
+import functools
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from metrics import REGISTRY
+
+T = TypeVar("T")
+
+
+class ExecutorSaturated(Exception):
+    """대기열이 가득 찼거나 최대 대기 시간을 넘겨 작업을 받아들일 수 없는 경우"""
+
+    def __init__(self, retry_after: float, reason: str):
+        super().__init__(f"executor saturated ({reason})")
+        self.retry_after = retry_after
+        self.reason = reason
+
+    @property
+    def retry_after_header(self) -> str:
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+class BoundedThreadPool:
+    """
+    크기와 대기열 상한이 있는 전용 스레드 풀
+
+    - Starlette 기본 threadpool(anyio, 동기 엔드포인트용)과 분리된 ThreadPoolExecutor에서 동기 함수를 실행한다.
+    - 실행 슬롯(max_workers)은 이벤트 루프 쪽 세마포어로 배분하므로 대기 중인 작업은 취소 가능하고 깊이를 측정할 수 있다.
+    - 대기열이 max_queue를 넘으면 즉시, max_wait 안에 슬롯을 얻지 못하면 대기 후 거절한다. (load shedding)
+    - 호출한 Task가 취소되어도 이미 시작된 스레드 작업은 끝까지 실행되며, 슬롯은 실제 종료 시점에 반환된다.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int, max_wait: float):
+        self._name = name
+        self._max_workers = max_workers
+        self._max_queue = max_queue
+        self._max_wait = max_wait
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._slots = asyncio.Semaphore(max_workers)
+        self._waiting = 0
+        self._running = 0
+        self._completed = 0
+        self._run_seconds_total = 0.0
+
+        self._queue_depth = REGISTRY.gauge(
+            "sync_executor_queue_depth", "스레드 슬롯을 기다리는 작업 수", ("executor",)
+        ).labels(name)
+        self._in_flight = REGISTRY.gauge(
+            "sync_executor_in_flight", "스레드에서 실행 중인 작업 수", ("executor",)
+        ).labels(name)
+        self._wait_seconds = REGISTRY.histogram(
+            "sync_executor_wait_seconds", "스레드 슬롯을 얻기까지 대기한 시간(초)", ("executor",)
+        ).labels(name)
+        self._run_seconds = REGISTRY.histogram(
+            "sync_executor_run_seconds", "스레드에서 작업을 실행한 시간(초)", ("executor",)
+        ).labels(name)
+        rejected = REGISTRY.counter(
+            "sync_executor_rejected_total", "거절된 작업 수", ("executor", "reason")
+        )
+        self._rejected_queue_full = rejected.labels(name, "queue_full")
+        self._rejected_timeout = rejected.labels(name, "timeout")
+
+    def _estimated_wait(self) -> float:
+        if not self._completed:
+            return self._max_wait
+        average = self._run_seconds_total / self._completed
+        return (self._waiting + 1) * average / self._max_workers
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    async def run(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        """
+        동기 함수를 전용 스레드 풀에서 실행하고 결과를 기다린다.
+
+        contextvars(Server-Timing 단계 등)는 호출한 Task의 것이 그대로 전달된다.
+
+        Raises:
+            ExecutorSaturated: 대기열이 가득 찼거나 max_wait를 초과한 경우
+        """
+        if self._slots.locked():
+            if self._waiting >= self._max_queue:
+                self._rejected_queue_full.inc()
+                raise ExecutorSaturated(self._estimated_wait(), "queue_full")
+
+        started = time.monotonic()
+        self._waiting += 1
+        self._queue_depth.set(self._waiting)
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self._max_wait)
+        except asyncio.TimeoutError:
+            self._rejected_timeout.inc()
+            raise ExecutorSaturated(self._estimated_wait(), "timeout")
+        finally:
+            self._waiting -= 1
+            self._queue_depth.set(self._waiting)
+        self._wait_seconds.observe(time.monotonic() - started)
+
+        loop = asyncio.get_running_loop()
+        call = functools.partial(contextvars.copy_context().run, fn, *args, **kwargs)
+        try:
+            future = self._executor.submit(call)
+        except BaseException:
+            self._slots.release()
+            raise
+
+        self._running += 1
+        self._in_flight.set(self._running)
+        submitted = time.perf_counter()
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release, submitted))
+        return await asyncio.wrap_future(future)
+
+    def _release(self, submitted: float) -> None:
+        # 슬롯이 비어 있을 때만 제출하므로 제출 시각을 실행 시작 시각으로 본다.
+        elapsed = time.perf_counter() - submitted
+        self._run_seconds.observe(elapsed)
+        self._run_seconds_total += elapsed
+        self._completed += 1
+        self._running -= 1
+        self._in_flight.set(self._running)
+        self._slots.release()
+
+    def shutdown(self, wait: bool = False) -> None:
+        """스레드 풀을 종료한다. 대기 중인 작업은 취소된다."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def stats(self) -> dict:
+        return {
+            "max_workers": self._max_workers,
+            "max_queue": self._max_queue,
+            "queue_depth": self._waiting,
+            "in_flight": self._running,
+            "completed": self._completed,
+        }
@@ -0,0 +1,21 @@
+from infrastructure.cache.cache import Cache
+from infrastructure.cache.cache_backend import CacheBackend
+from infrastructure.cache.encryption import encrypted_codec
+from infrastructure.cache.shared import (
+    close_shared_cache_backend,
+    get_shared_cache_backend,
+    get_shared_cache_stats,
+)
+from infrastructure.cache.sqlite_cache_backend import SQLiteCacheBackend
+from infrastructure.cache.ttl_lru_cache import TTLLRUCache
+
+__all__ = [
+    "Cache",
+    "CacheBackend",
+    "SQLiteCacheBackend",
+    "TTLLRUCache",
+    "close_shared_cache_backend",
+    "encrypted_codec",
+    "get_shared_cache_backend",
+    "get_shared_cache_stats",
+]
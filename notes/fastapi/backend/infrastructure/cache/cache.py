@@ -0,0 +1,183 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Generic, TypeVar
+
+from infrastructure.cache.cache_backend import CacheBackend
+from infrastructure.cache.ttl_lru_cache import TTLLRUCache
+from infrastructure.single_flight import SingleFlight
+
+V = TypeVar("V")
+
+
+class Cache(Generic[V]):
+    """
+    네임스페이스 단위 2단계 캐시 (프로세스 내 LRU + 선택적 공유 백엔드)
+
+    - shared가 없으면 프로세스 내 TTL LRU만 사용한다.
+    - shared가 있으면 로컬에 없는 값을 공유 백엔드에서 읽어 로컬에 채우므로,
+      다른 워커가 계산한 값도 재사용된다.
+    - get_or_compute는 같은 키의 계산을 프로세스 안에서는 single-flight로,
+      프로세스 간에는 lease로 하나만 수행하고 나머지는 결과를 기다린다. (캐시 스탬피드 방지)
+    - 계산이 실패하면 아무것도 저장하지 않는다.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        local: TTLLRUCache[V],
+        encode: Callable[[V], bytes],
+        decode: Callable[[bytes], V],
+        default_ttl: float,
+        shared: CacheBackend | None = None,
+        lease_ttl: float = 5.0,
+        poll_interval: float = 0.02,
+        max_poll_interval: float = 0.2,
+    ):
+        self._namespace = namespace
+        self._prefix = f"{namespace}:"
+        self._local = local
+        self._encode = encode
+        self._decode = decode
+        self._default_ttl = default_ttl
+        self._shared = shared
+        self._lease_ttl = lease_ttl
+        self._poll_interval = poll_interval
+        self._max_poll_interval = max_poll_interval
+        self._flight: SingleFlight[V] = SingleFlight()
+
+        self.local_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.computes = 0
+        self.lease_waits = 0
+        self.lease_timeouts = 0
+
+    def _shared_key(self, key: str) -> str:
+        return self._prefix + key
+
+    def _ttl(self, ttl: float | None) -> float:
+        return self._default_ttl if ttl is None else min(ttl, self._default_ttl)
+
+    async def get(self, key: str) -> V | None:
+        value = self._local.get(key)
+        if value is not None:
+            self.local_hits += 1
+            return value
+
+        if self._shared is not None:
+            value = await self._get_shared(key)
+            if value is not None:
+                self.shared_hits += 1
+                return value
+
+        self.misses += 1
+        return None
+
+    async def _get_shared(self, key: str) -> V | None:
+        entry = await self._shared.get_with_ttl(self._shared_key(key))
+        if entry is None:
+            return None
+        data, remaining = entry
+        try:
+            value = self._decode(data)
+        except ValueError:
+            # 복호화/역직렬화할 수 없는 항목(키 변경, 형식 변경)은 없는 것으로 본다.
+            return None
+        # 공유 항목보다 오래 남지 않도록 남은 TTL만큼만 로컬에 보관한다.
+        self._local.set(key, value, ttl=self._ttl(remaining))
+        return value
+
+    async def set(self, key: str, value: V, ttl: float | None = None) -> None:
+        ttl = self._ttl(ttl)
+        self._local.set(key, value, ttl=ttl)
+        if self._shared is not None:
+            await self._shared.set(self._shared_key(key), self._encode(value), ttl)
+
+    async def delete(self, key: str) -> None:
+        self._local.delete(key)
+        if self._shared is not None:
+            await self._shared.delete(self._shared_key(key))
+
+    def clear_local(self) -> None:
+        """이 프로세스의 로컬 항목만 비운다. (공유 항목은 TTL로 만료된다)"""
+        self._local.clear()
+
+    async def clear(self) -> None:
+        self._local.clear()
+        if self._shared is not None:
+            await self._shared.clear(self._prefix)
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[V]],
+        ttl: float | None = None,
+    ) -> V:
+        """
+        캐시된 값을 반환하고, 없으면 compute()로 계산해 저장한 뒤 반환한다.
+
+        Args:
+            key: 네임스페이스 안에서의 키
+            compute: 값을 계산하는 코루틴 함수
+            ttl: 값의 유효 시간(초). 기본 TTL을 넘을 수 없다.
+        """
+        value = self._local.get(key)
+        if value is not None:
+            self.local_hits += 1
+            return value
+
+        return await self._flight.do(key, lambda: self._load(key, compute, ttl))
+
+    async def _load(self, key: str, compute: Callable[[], Awaitable[V]], ttl: float | None) -> V:
+        if self._shared is None:
+            return await self._compute(key, compute, ttl)
+
+        value = await self._get_shared(key)
+        if value is not None:
+            self.shared_hits += 1
+            return value
+
+        shared_key = self._shared_key(key)
+        deadline = time.monotonic() + self._lease_ttl
+        delay = self._poll_interval
+        while not await self._shared.acquire_lease(shared_key, self._lease_ttl):
+            # 다른 프로세스가 계산 중이다. 결과가 저장되거나 lease가 만료될 때까지 기다린다.
+            self.lease_waits += 1
+            if time.monotonic() >= deadline:
+                self.lease_timeouts += 1
+                break
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self._max_poll_interval)
+
+            value = await self._get_shared(key)
+            if value is not None:
+                self.shared_hits += 1
+                return value
+
+        try:
+            return await self._compute(key, compute, ttl)
+        finally:
+            await self._shared.release_lease(shared_key)
+
+    async def _compute(self, key: str, compute: Callable[[], Awaitable[V]], ttl: float | None) -> V:
+        self.misses += 1
+        self.computes += 1
+        value = await compute()
+        await self.set(key, value, ttl)
+        return value
+
+    def stats(self) -> dict:
+        local = self._local.stats()
+        return {
+            "shared": self._shared is not None,
+            "local_entries": local["entries"],
+            "local_bytes": local["bytes"],
+            "local_evictions": local["evictions"],
+            "local_hits": self.local_hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "computes": self.computes,
+            "lease_waits": self.lease_waits,
+            "lease_timeouts": self.lease_timeouts,
+            "in_flight_shared": self._flight.shared,
+        }
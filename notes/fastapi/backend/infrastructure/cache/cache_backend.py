@@ -0,0 +1,52 @@
+from abc import ABC, abstractmethod
+
+
+class CacheBackend(ABC):
+    """
+    프로세스 간 공유 캐시 백엔드 Interface
+
+    - 값은 직렬화된 bytes로 저장하며 (역)직렬화는 Cache가 담당한다.
+    - lease는 같은 키의 계산을 여러 프로세스 중 하나만 수행하도록 하는 짧은 잠금이다.
+    """
+
+    @abstractmethod
+    async def get_with_ttl(self, key: str) -> tuple[bytes, float] | None:
+        """만료되지 않은 값과 남은 유효 시간(초) 조회"""
+        pass
+
+    async def get(self, key: str) -> bytes | None:
+        """만료되지 않은 값 조회"""
+        entry = await self.get_with_ttl(key)
+        return entry[0] if entry else None
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """ttl(초) 동안 유효한 값 저장"""
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """값 삭제"""
+        pass
+
+    @abstractmethod
+    async def clear(self, prefix: str) -> None:
+        """prefix로 시작하는 모든 값 삭제"""
+        pass
+
+    @abstractmethod
+    async def acquire_lease(self, key: str, ttl: float) -> bool:
+        """키 계산 lease 획득 시도 (다른 프로세스가 보유 중이면 False)"""
+        pass
+
+    @abstractmethod
+    async def release_lease(self, key: str) -> None:
+        """보유한 lease 해제"""
+        pass
+
+    async def close(self) -> None:
+        """백엔드 자원 정리"""
+        pass
+
+    def stats(self) -> dict:
+        return {}
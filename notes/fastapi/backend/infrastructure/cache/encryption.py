@@ -0,0 +1,42 @@
+import os
+from typing import Callable, TypeVar
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.hashes import SHA256
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+V = TypeVar("V")
+
+_NONCE_SIZE = 12
+
+
+def encrypted_codec(
+    encode: Callable[[V], bytes],
+    decode: Callable[[bytes], V],
+    secret: str,
+    context: str,
+) -> tuple[Callable[[V], bytes], Callable[[bytes], V]]:
+    """
+    공유 백엔드에 저장되는 값을 AES-GCM으로 암호화하는 (encode, decode) 쌍을 만든다.
+
+    키는 secret에서 context(네임스페이스)별로 HKDF로 유도하며, context는 인증 데이터로도 쓰여
+    다른 네임스페이스의 값을 옮겨 붙이면 복호화에 실패한다.
+    복호화할 수 없는 값(키 변경, 손상)은 ValueError를 던진다.
+    """
+    key = HKDF(algorithm=SHA256(), length=32, salt=None, info=f"cache:{context}".encode()).derive(secret.encode())
+    aead = AESGCM(key)
+    associated_data = context.encode()
+
+    def encrypt(value: V) -> bytes:
+        nonce = os.urandom(_NONCE_SIZE)
+        return nonce + aead.encrypt(nonce, encode(value), associated_data)
+
+    def decrypt(data: bytes) -> V:
+        try:
+            plaintext = aead.decrypt(data[:_NONCE_SIZE], data[_NONCE_SIZE:], associated_data)
+        except InvalidTag as e:
+            raise ValueError("캐시 값을 복호화할 수 없습니다.") from e
+        return decode(plaintext)
+
+    return encrypt, decrypt
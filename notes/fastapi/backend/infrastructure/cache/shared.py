@@ -0,0 +1,38 @@
+from config.env import get_env, get_float_env
+from infrastructure.cache.cache_backend import CacheBackend
+from infrastructure.cache.sqlite_cache_backend import SQLiteCacheBackend
+
+_backend: CacheBackend | None = None
+
+
+def get_shared_cache_backend() -> CacheBackend | None:
+    """
+    CACHE_BACKEND 설정에 맞는 프로세스 간 공유 캐시 백엔드를 반환한다.
+
+    - memory(기본): None (각 워커가 프로세스 내 캐시만 사용)
+    - sqlite: CACHE_SQLITE_PATH 파일을 여는 SQLite 백엔드 (같은 호스트의 워커끼리 공유)
+    """
+    global _backend
+
+    if _backend is None and (get_env("CACHE_BACKEND", "memory") or "memory").lower() == "sqlite":
+        _backend = SQLiteCacheBackend(
+            get_env("CACHE_SQLITE_PATH", "data/cache.sqlite3"),
+            purge_interval=get_float_env("CACHE_SQLITE_PURGE_INTERVAL", 60.0),
+        )
+
+    return _backend
+
+
+async def close_shared_cache_backend() -> None:
+    """공유 캐시 백엔드를 닫는다. (lifespan 종료 시 호출)"""
+    global _backend
+
+    if _backend is not None:
+        await _backend.close()
+
+    _backend = None
+
+
+def get_shared_cache_stats() -> dict:
+    """공유 캐시 백엔드 읽기/쓰기/lease 통계를 반환한다."""
+    return _backend.stats() if _backend is not None else {}
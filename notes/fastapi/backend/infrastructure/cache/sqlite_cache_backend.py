@@ -0,0 +1,168 @@
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from infrastructure.cache.cache_backend import CacheBackend
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    로컬 SQLite(WAL) 파일 기반 공유 캐시 백엔드
+
+    - 같은 파일을 여는 모든 워커 프로세스가 캐시를 공유한다. (외부 서비스 불필요)
+    - lease는 (키, 소유자, 만료 시각) 행으로 표현하며, 소유자가 죽어도 만료 후 다른 프로세스가 가져간다.
+    - 만료된 행은 읽을 때 발견하면 바로 지우고, purge_interval초(또는 purge_every회 쓰기)마다 한꺼번에 정리한다.
+      종료 시에도 한 번 정리해 만료된 값이 파일에 남아 있지 않게 한다.
+    - SQLite 호출은 블로킹이므로 스레드에서 실행해 이벤트 루프를 막지 않는다.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        busy_timeout: float = 5.0,
+        purge_every: int = 1000,
+        purge_interval: float = 60.0,
+    ):
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._owner = f"{os.getpid()}:{id(self)}"
+        self._purge_every = purge_every
+        self._purge_interval = purge_interval
+        self._writes = 0
+        self._purged_at = time.time()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self._path, timeout=busy_timeout, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache_leases (
+                key TEXT PRIMARY KEY,
+                owner TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_entries_expires_at ON cache_entries (expires_at)"
+        )
+
+        self.reads = 0
+        self.writes = 0
+        self.leases_acquired = 0
+        self.leases_contended = 0
+
+    def _get_with_ttl(self, key: str) -> tuple[bytes, float] | None:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and row[1] <= now:
+                self._conn.execute("DELETE FROM cache_entries WHERE key = ? AND expires_at <= ?", (key, now))
+                row = None
+            self._purge_if_due(now)
+        return (row[0], row[1] - now) if row else None
+
+    def _set(self, key: str, value: bytes, ttl: float) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, now + ttl),
+            )
+            self._writes += 1
+            if self._writes % self._purge_every == 0:
+                self._purge(now)
+            else:
+                self._purge_if_due(now)
+
+    def _purge_if_due(self, now: float) -> None:
+        if now - self._purged_at >= self._purge_interval:
+            self._purge(now)
+
+    def _purge(self, now: float) -> None:
+        """만료된 값과 lease를 지운다. (호출 측에서 _lock을 잡고 호출한다)"""
+        self._conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+        self._conn.execute("DELETE FROM cache_leases WHERE expires_at <= ?", (now,))
+        self._purged_at = now
+
+    def _execute(self, sql: str, params: tuple = ()) -> None:
+        with self._lock:
+            self._conn.execute(sql, params)
+
+    def _acquire_lease(self, key: str, ttl: float) -> bool:
+        now = time.time()
+        with self._lock:
+            # 만료된 lease는 덮어쓰고, 유효한 lease가 있으면 아무 행도 바뀌지 않는다.
+            cursor = self._conn.execute(
+                """
+                INSERT INTO cache_leases (key, owner, expires_at) VALUES (?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at
+                WHERE cache_leases.expires_at <= ?
+                """,
+                (key, self._owner, now + ttl, now),
+            )
+            return cursor.rowcount > 0
+
+    async def get_with_ttl(self, key: str) -> tuple[bytes, float] | None:
+        self.reads += 1
+        return await asyncio.to_thread(self._get_with_ttl, key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        self.writes += 1
+        await asyncio.to_thread(self._set, key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self._execute, "DELETE FROM cache_entries WHERE key = ?", (key,))
+
+    async def clear(self, prefix: str) -> None:
+        await asyncio.to_thread(
+            self._execute,
+            "DELETE FROM cache_entries WHERE substr(key, 1, ?) = ?",
+            (len(prefix), prefix),
+        )
+
+    async def acquire_lease(self, key: str, ttl: float) -> bool:
+        acquired = await asyncio.to_thread(self._acquire_lease, key, ttl)
+        if acquired:
+            self.leases_acquired += 1
+        else:
+            self.leases_contended += 1
+        return acquired
+
+    async def release_lease(self, key: str) -> None:
+        await asyncio.to_thread(
+            self._execute,
+            "DELETE FROM cache_leases WHERE key = ? AND owner = ?",
+            (key, self._owner),
+        )
+
+    async def close(self) -> None:
+        with self._lock:
+            self._purge(time.time())
+            self._conn.close()
+
+    def stats(self) -> dict:
+        return {
+            "reads": self.reads,
+            "writes": self.writes,
+            "leases_acquired": self.leases_acquired,
+            "leases_contended": self.leases_contended,
+        }
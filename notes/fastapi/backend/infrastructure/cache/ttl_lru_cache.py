@@ -0,0 +1,109 @@
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Hashable, TypeVar
+
+V = TypeVar("V")
+
+
+def _default_sizeof(value: Any) -> int:
+    return sys.getsizeof(value)
+
+
+class TTLLRUCache(Generic[V]):
+    """
+    TTL 만료와 LRU 축출을 지원하는 프로세스 내 캐시
+
+    - 항목 수(max_entries)와 대략적인 메모리 사용량(max_bytes) 두 가지 상한을 가진다.
+    - 항목별 TTL은 기본 TTL을 넘을 수 없다.
+    - 단일 이벤트 루프에서 사용하는 것을 전제로 하며 별도의 락을 두지 않는다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int,
+        default_ttl: float,
+        sizeof: Callable[[V], int] = _default_sizeof,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._default_ttl = default_ttl
+        self._sizeof = sizeof
+        self._clock = clock
+        # key -> (expires_at, size, value). 앞쪽이 가장 오래 사용되지 않은 항목이다.
+        self._entries: OrderedDict[Hashable, tuple[float, int, V]] = OrderedDict()
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, size, value = entry
+        if expires_at <= self._clock():
+            self._remove(key, size)
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: V, ttl: float | None = None) -> None:
+        ttl = self._default_ttl if ttl is None else min(ttl, self._default_ttl)
+        if ttl <= 0:
+            return
+
+        size = self._sizeof(value)
+        if size > self._max_bytes:
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous[1]
+
+        self._entries[key] = (self._clock() + ttl, size, value)
+        self._bytes += size
+
+        while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+            _, (_, evicted_size, _) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+            self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._remove(key, entry[1])
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def _remove(self, key: Hashable, size: int) -> None:
+        del self._entries[key]
+        self._bytes -= size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        """캐시 적중/미스/축출 통계를 반환한다."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self._max_entries,
+            "max_bytes": self._max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
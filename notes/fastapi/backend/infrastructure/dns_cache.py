@@ -0,0 +1,171 @@
+import asyncio
+import ipaddress
+import socket
+import time
+import typing
+
+import httpcore
+from httpcore import AsyncNetworkBackend, AsyncNetworkStream
+
+
+class DNSCache:
+    """
+    프로세스 내 DNS 조회 캐시
+
+    - 호스트별 조회 결과(IP 목록)를 ttl초 동안 재사용한다.
+    - 같은 호스트의 동시 조회는 한 번만 수행한다. (single-flight)
+    - 조회가 실패하면 만료 후 stale_ttl초 이내의 이전 결과를 대신 사용한다.
+    - 조회는 이벤트 루프의 getaddrinfo(기본 executor)로 수행해 루프를 막지 않는다.
+    """
+
+    def __init__(self, ttl: float = 60.0, stale_ttl: float = 300.0):
+        self._ttl = ttl
+        self._stale_ttl = stale_ttl
+        # host → (IP 목록, 조회 시각)
+        self._entries: dict[str, tuple[list[str], float]] = {}
+        self._in_flight: dict[str, asyncio.Future] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.stale_served = 0
+
+    async def resolve(self, host: str, port: int) -> list[str]:
+        """
+        호스트의 IP 주소 목록을 반환한다.
+
+        Raises:
+            OSError: 조회에 실패했고 사용할 수 있는 이전 결과도 없는 경우
+        """
+        entry = self._entries.get(host)
+        if entry is not None and time.monotonic() - entry[1] < self._ttl:
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        in_flight = self._in_flight.get(host)
+        if in_flight is not None:
+            return await asyncio.shield(in_flight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[host] = future
+        try:
+            addresses = await self._lookup(host, port)
+        except OSError as e:
+            self.errors += 1
+            if entry is not None and time.monotonic() - entry[1] < self._ttl + self._stale_ttl:
+                self.stale_served += 1
+                addresses = entry[0]
+            else:
+                self._fail(future, e)
+                raise
+        except BaseException:
+            # 조회를 시작한 요청이 취소되면 같은 호스트를 기다리던 요청도 실패로 끝낸다.
+            self._fail(future, OSError(f"DNS 조회가 취소되었습니다: {host}"))
+            raise
+        else:
+            self._entries[host] = (addresses, time.monotonic())
+        finally:
+            del self._in_flight[host]
+
+        future.set_result(addresses)
+        return addresses
+
+    @staticmethod
+    def _fail(future: asyncio.Future, error: BaseException) -> None:
+        future.set_exception(error)
+        # 기다리는 쪽이 없어도 "exception was never retrieved" 경고가 나지 않도록 한다.
+        future.exception()
+
+    async def _lookup(self, host: str, port: int) -> list[str]:
+        infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        # 반환 순서(RFC 6724 우선순위)를 유지하며 중복만 제거한다.
+        return list(dict.fromkeys(info[4][0] for info in infos))
+
+    def invalidate(self, host: str) -> None:
+        """연결에 실패한 호스트의 조회 결과를 버린다."""
+        self._entries.pop(host, None)
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "ttl": self._ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "stale_served": self.stale_served,
+        }
+
+
+def _is_ip_address(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
+
+
+class CachingNetworkBackend(AsyncNetworkBackend):
+    """
+    DNS 캐시를 거쳐 TCP 연결을 여는 httpcore 네트워크 백엔드
+
+    조회한 IP로 차례로 연결을 시도하며, 모두 실패하면 캐시를 버리고 마지막 오류를 전파한다.
+    DNS 조회와 모든 연결 시도는 connect 타임아웃 하나를 공유한다.
+    TLS SNI와 인증서 검증에는 httpcore가 원래 호스트명을 사용하므로 영향이 없다.
+    """
+
+    def __init__(self, backend: AsyncNetworkBackend, dns_cache: DNSCache):
+        self._backend = backend
+        self._dns_cache = dns_cache
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: typing.Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> AsyncNetworkStream:
+        if _is_ip_address(host):
+            return await self._backend.connect_tcp(
+                host, port, timeout=timeout, local_address=local_address, socket_options=socket_options
+            )
+
+        # DNS 조회와 주소별 연결 시도가 connect 타임아웃 하나를 나눠 쓴다. (주소 수만큼 늘어나지 않는다)
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        try:
+            addresses = await asyncio.wait_for(self._dns_cache.resolve(host, port), timeout=timeout)
+        except asyncio.TimeoutError as e:
+            raise httpcore.ConnectTimeout(f"DNS 조회 시간이 초과되었습니다: {host}") from e
+        except OSError as e:
+            raise httpcore.ConnectError(str(e)) from e
+
+        # socket_options는 일회성 iterable일 수 있으므로 재시도를 위해 목록으로 고정한다.
+        socket_options = list(socket_options) if socket_options is not None else None
+        last_error: Exception | None = None
+        for address in addresses:
+            remaining = deadline - time.monotonic() if deadline is not None else None
+            if remaining is not None and remaining <= 0:
+                last_error = httpcore.ConnectTimeout(f"연결 시간이 초과되었습니다: {host}")
+                break
+            try:
+                return await self._backend.connect_tcp(
+                    address, port, timeout=remaining, local_address=local_address, socket_options=socket_options
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                last_error = e
+
+        self._dns_cache.invalidate(host)
+        raise last_error or httpcore.ConnectError(f"연결할 주소가 없습니다: {host}")
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: typing.Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(path, timeout=timeout, socket_options=socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
@@ -0,0 +1,48 @@
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, Iterable, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+_DONE = object()
+
+
+async def bounded_fan_out(
+    items: Iterable[K],
+    fn: Callable[[K], Awaitable[V]],
+    concurrency: int,
+) -> AsyncIterator[tuple[K, V | Exception]]:
+    """
+    items 각각에 대해 fn을 최대 concurrency개씩 동시에 실행하고, 끝나는 순서대로 (item, 결과)를 내보낸다.
+
+    - 작업자 Task는 concurrency개만 만들고 items를 차례로 가져가므로 입력 크기와 무관하게 동시 실행 수가 제한된다.
+    - fn이 던진 예외는 전파하지 않고 결과 자리에 담아 내보낸다. (한 항목의 실패가 전체를 멈추지 않는다)
+    - 소비하는 쪽이 중간에 멈추면(클라이언트 연결 종료 등) 남은 작업은 취소된다.
+    """
+    pending = iter(items)
+    results: asyncio.Queue = asyncio.Queue()
+
+    async def worker() -> None:
+        try:
+            for item in pending:
+                try:
+                    result = await fn(item)
+                except Exception as e:
+                    result = e
+                await results.put((item, result))
+        finally:
+            await results.put(_DONE)
+
+    workers = [asyncio.create_task(worker()) for _ in range(max(1, concurrency))]
+    try:
+        remaining = len(workers)
+        while remaining:
+            result = await results.get()
+            if result is _DONE:
+                remaining -= 1
+                continue
+            yield result
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
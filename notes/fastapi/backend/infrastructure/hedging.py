@@ -0,0 +1,78 @@
+import asyncio
+from typing import Awaitable, Callable, TypeVar
+
+from infrastructure.latency_tracker import LatencyTracker
+
+T = TypeVar("T")
+
+
+class HedgedRequester:
+    """
+    멱등 요청용 hedging 실행기
+
+    첫 요청이 관측 지연의 q 백분위(적응형 지연) 안에 끝나지 않으면 같은 요청을 한 번 더 보내고,
+    먼저 성공한 쪽의 결과를 사용한다. 남은 요청은 취소한다.
+    관측 표본이 부족한 동안(기동 직후)은 initial_delay를 기다린다.
+    """
+
+    def __init__(
+        self,
+        tracker: LatencyTracker,
+        percentile: float = 0.95,
+        min_delay: float = 0.02,
+        max_delay: float = 1.0,
+        initial_delay: float = 0.2,
+    ):
+        self._tracker = tracker
+        self._percentile = percentile
+        self._min_delay = min_delay
+        self._max_delay = max_delay
+        self._initial_delay = initial_delay
+
+        self.requests = 0
+        self.hedges_fired = 0
+        self.hedge_wins = 0
+
+    def delay(self) -> float:
+        """두 번째 요청을 보내기까지 기다릴 시간(초)"""
+        observed = self._tracker.percentile(self._percentile)
+        if observed is None:
+            observed = self._initial_delay
+        return min(max(observed, self._min_delay), self._max_delay)
+
+    async def run(self, fn: Callable[[], Awaitable[T]]) -> T:
+        self.requests += 1
+        primary = asyncio.ensure_future(fn())
+        pending: set[asyncio.Future] = {primary}
+
+        try:
+            done, _ = await asyncio.wait(pending, timeout=self.delay())
+            if done:
+                return primary.result()
+
+            self.hedges_fired += 1
+            hedge = asyncio.ensure_future(fn())
+            pending.add(hedge)
+
+            error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def stats(self) -> dict:
+        return {
+            "requests": self.requests,
+            "hedges_fired": self.hedges_fired,
+            "hedge_wins": self.hedge_wins,
+            "hedge_delay": self.delay(),
+        }
@@ -0,0 +1,257 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from importlib.util import find_spec
+from typing import Iterable
+
+import httpcore
+import httpx
+
+from config.env import get_bool_env, get_float_env, get_int_env
+from infrastructure.dns_cache import CachingNetworkBackend, DNSCache
+from infrastructure.pooled_transport import PooledTransport
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class HttpClientConfig:
+    """공유 HTTP 클라이언트 설정 (커넥션 풀 / keep-alive / 타임아웃)"""
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+    connect_timeout: float = 3.0
+    read_timeout: float = 5.0
+    write_timeout: float = 5.0
+    pool_timeout: float = 2.0
+    # 프로세스 내 DNS 캐시 (조회 결과 재사용, 조회 실패 시 이전 결과 사용)
+    dns_cache_enabled: bool = True
+    dns_cache_ttl: float = 60.0
+    dns_cache_stale_ttl: float = 300.0
+    # 기동 시 upstream 호스트의 DNS 조회와 커넥션 수립을 미리 수행한다.
+    prewarm_enabled: bool = False
+    prewarm_connections: int = 2
+    prewarm_timeout: float = 5.0
+    # 사전 준비가 끝날 때까지 준비 상태(readiness)를 미룬다. False이면 백그라운드로 수행한다.
+    prewarm_gate_readiness: bool = True
+
+    @classmethod
+    def from_env(cls) -> "HttpClientConfig":
+        """환경 변수(HTTP_CLIENT_*)에서 설정을 읽는다. 값이 없으면 기본값을 사용한다."""
+        default = cls()
+        return cls(
+            max_connections=get_int_env("HTTP_CLIENT_MAX_CONNECTIONS", default.max_connections),
+            max_keepalive_connections=get_int_env(
+                "HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS", default.max_keepalive_connections
+            ),
+            keepalive_expiry=get_float_env("HTTP_CLIENT_KEEPALIVE_EXPIRY", default.keepalive_expiry),
+            http2=get_bool_env("HTTP_CLIENT_HTTP2", default.http2),
+            connect_timeout=get_float_env("HTTP_CLIENT_CONNECT_TIMEOUT", default.connect_timeout),
+            read_timeout=get_float_env("HTTP_CLIENT_READ_TIMEOUT", default.read_timeout),
+            write_timeout=get_float_env("HTTP_CLIENT_WRITE_TIMEOUT", default.write_timeout),
+            pool_timeout=get_float_env("HTTP_CLIENT_POOL_TIMEOUT", default.pool_timeout),
+            dns_cache_enabled=get_bool_env("HTTP_CLIENT_DNS_CACHE_ENABLED", default.dns_cache_enabled),
+            dns_cache_ttl=get_float_env("HTTP_CLIENT_DNS_CACHE_TTL", default.dns_cache_ttl),
+            dns_cache_stale_ttl=get_float_env("HTTP_CLIENT_DNS_CACHE_STALE_TTL", default.dns_cache_stale_ttl),
+            prewarm_enabled=get_bool_env("HTTP_CLIENT_PREWARM_ENABLED", default.prewarm_enabled),
+            prewarm_connections=get_int_env("HTTP_CLIENT_PREWARM_CONNECTIONS", default.prewarm_connections),
+            prewarm_timeout=get_float_env("HTTP_CLIENT_PREWARM_TIMEOUT", default.prewarm_timeout),
+            prewarm_gate_readiness=get_bool_env(
+                "HTTP_CLIENT_PREWARM_GATE_READINESS", default.prewarm_gate_readiness
+            ),
+        )
+
+
+_client: httpx.AsyncClient | None = None
+_transport: PooledTransport | None = None
+_config: HttpClientConfig | None = None
+_dns_cache: DNSCache | None = None
+_prewarm_task: asyncio.Task | None = None
+_prewarm_report: dict | None = None
+
+
+def build_http_client(
+    config: HttpClientConfig,
+    dns_cache: DNSCache | None = None,
+) -> tuple[httpx.AsyncClient, PooledTransport]:
+    """
+    설정값으로 커넥션 풀을 공유하는 AsyncClient와 Transport를 생성한다.
+
+    dns_cache가 주어지면 커넥션 풀이 DNS 캐시를 거치는 네트워크 백엔드로 연결을 연다.
+    """
+    http2 = config.http2
+    if http2 and find_spec("h2") is None:
+        logger.warning("HTTP_CLIENT_HTTP2가 설정되었지만 h2 패키지가 없어 HTTP/1.1로 동작합니다.")
+        http2 = False
+
+    limits = httpx.Limits(
+        max_connections=config.max_connections,
+        max_keepalive_connections=config.max_keepalive_connections,
+        keepalive_expiry=config.keepalive_expiry,
+    )
+    timeout = httpx.Timeout(
+        connect=config.connect_timeout,
+        read=config.read_timeout,
+        write=config.write_timeout,
+        pool=config.pool_timeout,
+    )
+    network_backend = CachingNetworkBackend(httpcore.AnyIOBackend(), dns_cache) if dns_cache is not None else None
+    transport = PooledTransport(limits=limits, http2=http2, network_backend=network_backend)
+    client = httpx.AsyncClient(transport=transport, timeout=timeout)
+    return client, transport
+
+
+def _get_dns_cache(config: HttpClientConfig) -> DNSCache | None:
+    global _dns_cache
+
+    if config.dns_cache_enabled and _dns_cache is None:
+        _dns_cache = DNSCache(ttl=config.dns_cache_ttl, stale_ttl=config.dns_cache_stale_ttl)
+    return _dns_cache if config.dns_cache_enabled else None
+
+
+async def start_http_client(config: HttpClientConfig | None = None) -> httpx.AsyncClient:
+    """
+    애플리케이션 수명 동안 사용할 공유 HTTP 클라이언트를 생성한다.
+
+    FastAPI lifespan 시작 시 1회 호출된다. 이미 생성되어 있으면 기존 클라이언트를 반환한다.
+    """
+    global _client, _transport, _config
+
+    if _client is not None and not _client.is_closed:
+        return _client
+
+    _config = config or HttpClientConfig.from_env()
+    # TLS 컨텍스트 생성(CA 번들 로드)은 수백 ms가 걸리는 동기 작업이므로 이벤트 루프 밖에서 수행한다.
+    _client, _transport = await asyncio.to_thread(build_http_client, _config, _get_dns_cache(_config))
+    return _client
+
+
+def get_http_client_config() -> HttpClientConfig:
+    """공유 HTTP 클라이언트 설정을 반환한다."""
+    return _config or HttpClientConfig.from_env()
+
+
+async def prewarm_http_client(urls: Iterable[str]) -> dict:
+    """
+    upstream 호스트의 DNS 조회와 커넥션 수립(TLS 핸드셰이크 포함)을 미리 수행한다.
+
+    호스트(origin)마다 prewarm_connections개의 HEAD 요청을 동시에 보내 keep-alive 커넥션을 풀에 남긴다.
+    실패해도 예외를 던지지 않고 보고서에 기록한다. (첫 요청이 평소처럼 연결을 맺는다)
+
+    Returns:
+        dict: 전체 소요 시간과 호스트별 DNS 조회 / 연결 시간, 준비된 커넥션 수
+    """
+    global _prewarm_report
+
+    config = get_http_client_config()
+    client = get_http_client()
+    origins = list(dict.fromkeys(str(httpx.URL(url).copy_with(path="/", query=None, fragment=None)) for url in urls))
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(_prewarm_origin(client, config, origin) for origin in origins))
+    report = {
+        "seconds": round(time.perf_counter() - started, 4),
+        "origins": dict(zip(origins, results)),
+    }
+    _prewarm_report = report
+    logger.info("upstream 커넥션 사전 준비 완료 (%.3f초): %s", report["seconds"], report["origins"])
+    return report
+
+
+async def _prewarm_origin(client: httpx.AsyncClient, config: HttpClientConfig, origin: str) -> dict:
+    result: dict = {}
+    url = httpx.URL(origin)
+
+    if _dns_cache is not None:
+        started = time.perf_counter()
+        try:
+            addresses = await _dns_cache.resolve(url.host, url.port or (443 if url.scheme == "https" else 80))
+        except OSError as e:
+            result["error"] = f"DNS: {e}"
+            return result
+        result["dns_seconds"] = round(time.perf_counter() - started, 4)
+        result["addresses"] = addresses
+
+    started = time.perf_counter()
+    responses = await asyncio.gather(
+        *(client.head(origin, timeout=config.prewarm_timeout) for _ in range(config.prewarm_connections)),
+        return_exceptions=True,
+    )
+    result["connect_seconds"] = round(time.perf_counter() - started, 4)
+    result["connections"] = sum(1 for response in responses if isinstance(response, httpx.Response))
+    errors = [response for response in responses if isinstance(response, Exception)]
+    if errors:
+        result["error"] = f"{type(errors[0]).__name__}: {errors[0]}"
+    return result
+
+
+def start_prewarm(urls: Iterable[str]) -> asyncio.Task:
+    """준비 상태를 미루지 않고 백그라운드에서 커넥션 사전 준비를 수행한다."""
+    global _prewarm_task
+
+    _prewarm_task = asyncio.create_task(prewarm_http_client(list(urls)), name="http-client-prewarm")
+    return _prewarm_task
+
+
+async def close_http_client() -> None:
+    """공유 HTTP 클라이언트를 닫고 커넥션 풀을 정리한다. (lifespan 종료 시 호출)"""
+    global _client, _transport, _prewarm_task
+
+    if _prewarm_task is not None:
+        _prewarm_task.cancel()
+        try:
+            await _prewarm_task
+        except asyncio.CancelledError:
+            pass
+        _prewarm_task = None
+
+    if _client is not None:
+        await _client.aclose()
+
+    _client = None
+    _transport = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    공유 HTTP 클라이언트를 반환한다.
+
+    lifespan 밖(스크립트, 테스트 등)에서 호출되면 기본 설정으로 지연 생성한다.
+    """
+    global _client, _transport, _config
+
+    if _client is None or _client.is_closed:
+        _config = _config or HttpClientConfig.from_env()
+        _client, _transport = build_http_client(_config, _get_dns_cache(_config))
+
+    return _client
+
+
+def get_http_pool_stats() -> dict:
+    """커넥션 풀 사용 현황을 반환한다. (풀 크기 산정용)"""
+    config = _config or HttpClientConfig.from_env()
+    stats = {
+        "started": _client is not None and not _client.is_closed,
+        "http2": config.http2,
+        "max_connections": config.max_connections,
+        "max_keepalive_connections": config.max_keepalive_connections,
+        "keepalive_expiry": config.keepalive_expiry,
+        "connections": 0,
+        "active_connections": 0,
+        "idle_connections": 0,
+        "http2_connections": 0,
+        "requests_in_flight": 0,
+    }
+
+    if _dns_cache is not None:
+        stats["dns_cache"] = _dns_cache.stats()
+    if _prewarm_report is not None:
+        stats["prewarm"] = _prewarm_report
+
+    if _transport is None:
+        return stats
+
+    stats.update(_transport.stats())
+    return stats
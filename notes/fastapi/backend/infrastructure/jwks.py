@@ -0,0 +1,164 @@
+import asyncio
+import logging
+import random
+import time
+from typing import Awaitable, Callable
+
+from infrastructure.jwt import JWTError, RSAPublicKey, rsa_public_key_from_jwk
+
+logger = logging.getLogger(__name__)
+
+
+class JWKSUnavailableError(JWTError):
+    """공개키를 한 번도 가져오지 못해 검증할 수 없는 경우"""
+
+
+class JWKSCache:
+    """
+    공개키 집합(JWKS) 캐시
+
+    - 최초 조회 시 1회 가져오고, 백그라운드 작업이 refresh_interval마다 갱신한다.
+    - 모르는 kid가 들어오면 키 교체(rotation)로 보고 즉시 다시 가져온다.
+      단, 위조 kid로 upstream을 두드리지 못하도록 min_refresh_interval 안에서는 다시 가져오지 않는다.
+    - 동시에 들어온 갱신 요청은 하나의 fetch를 공유한다.
+    - 갱신에 실패하면 기존 키를 계속 사용한다.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], Awaitable[dict]],
+        refresh_interval: float = 3600.0,
+        min_refresh_interval: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._fetch = fetch
+        self._refresh_interval = refresh_interval
+        self._min_refresh_interval = min_refresh_interval
+        self._clock = clock
+        self._keys: dict[str, RSAPublicKey] = {}
+        self._fetched_at: float | None = None
+        self._attempted_at: float | None = None
+        self._inflight: asyncio.Future | None = None
+        self._task: asyncio.Task | None = None
+
+        self.fetches = 0
+        self.fetch_failures = 0
+        self.rotations = 0
+        self.unknown_kid = 0
+
+    async def get_key(self, kid: str | None) -> RSAPublicKey:
+        """
+        kid에 해당하는 공개키를 반환한다.
+
+        Raises:
+            JWKSUnavailableError: JWKS를 가져오지 못한 경우
+            JWTError: 키를 찾을 수 없는 경우
+        """
+        key = self._lookup(kid)
+        if key is not None:
+            return key
+
+        if self._fetched_at is None or self._can_refresh():
+            if self._fetched_at is not None:
+                self.unknown_kid += 1
+            await self.refresh()
+            key = self._lookup(kid)
+            if key is not None:
+                return key
+
+        if self._fetched_at is None:
+            raise JWKSUnavailableError("공개키(JWKS)를 가져올 수 없습니다.")
+        raise JWTError(f"알 수 없는 서명 키입니다: kid={kid}")
+
+    def _lookup(self, kid: str | None) -> RSAPublicKey | None:
+        if kid is None:
+            # kid가 없는 토큰은 키가 하나뿐일 때만 허용한다.
+            return next(iter(self._keys.values())) if len(self._keys) == 1 else None
+        return self._keys.get(kid)
+
+    def _can_refresh(self) -> bool:
+        return self._attempted_at is None or self._clock() - self._attempted_at >= self._min_refresh_interval
+
+    async def refresh(self) -> None:
+        """JWKS를 다시 가져온다. (진행 중인 fetch가 있으면 그 결과를 기다린다)"""
+        if self._inflight is not None:
+            await asyncio.shield(self._inflight)
+            return
+
+        self._inflight = asyncio.get_running_loop().create_future()
+        try:
+            await self._refresh()
+        finally:
+            self._inflight.set_result(None)
+            self._inflight = None
+
+    async def _refresh(self) -> None:
+        self._attempted_at = self._clock()
+        self.fetches += 1
+        try:
+            jwks = await self._fetch()
+            keys = {}
+            for jwk in jwks.get("keys", []):
+                if jwk.get("use", "sig") != "sig" or jwk.get("alg", "RS256") != "RS256":
+                    continue
+                try:
+                    keys[jwk.get("kid")] = rsa_public_key_from_jwk(jwk)
+                except JWTError:
+                    continue
+        except Exception:
+            self.fetch_failures += 1
+            logger.exception("JWKS를 가져오지 못했습니다. 기존 키를 계속 사용합니다.")
+            return
+
+        if not keys:
+            self.fetch_failures += 1
+            logger.warning("JWKS에 사용할 수 있는 RS256 키가 없습니다. 기존 키를 계속 사용합니다.")
+            return
+
+        if self._keys and keys.keys() != self._keys.keys():
+            self.rotations += 1
+        self._keys = keys
+        self._fetched_at = self._clock()
+
+    async def _run(self) -> None:
+        while True:
+            await self.refresh()
+            # 워커 간 갱신 시점이 겹치지 않도록 주기에 지터를 적용한다.
+            await asyncio.sleep(self._refresh_interval * random.uniform(0.8, 1.2))
+
+    def start(self) -> None:
+        """백그라운드 갱신 작업을 시작한다."""
+        if self._task is None and self._refresh_interval > 0:
+            self._task = asyncio.create_task(self._run(), name="jwks-refresher")
+
+    def cancel(self) -> None:
+        """백그라운드 갱신 작업을 취소한다. (종료를 기다리지 않는다)"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def stop(self) -> None:
+        """백그라운드 갱신 작업을 중지한다."""
+        task = self._task
+        self.cancel()
+        if task is not None:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def clear(self) -> None:
+        """보관 중인 키를 버린다. (JWKS URL이 바뀐 경우 다음 조회 때 새로 가져온다)"""
+        self._keys = {}
+        self._fetched_at = None
+        self._attempted_at = None
+
+    def stats(self) -> dict:
+        return {
+            "keys": len(self._keys),
+            "age": self._clock() - self._fetched_at if self._fetched_at is not None else None,
+            "fetches": self.fetches,
+            "fetch_failures": self.fetch_failures,
+            "rotations": self.rotations,
+            "unknown_kid": self.unknown_kid,
+        }
@@ -0,0 +1,81 @@
+import base64
+import json
+from dataclasses import dataclass
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey, RSAPublicNumbers
+
+
+class JWTError(ValueError):
+    """JWT 형식 또는 서명이 올바르지 않은 경우"""
+
+
+@dataclass(frozen=True)
+class DecodedJWT:
+    """서명 검증 전의 JWS Compact 토큰"""
+    header: dict
+    claims: dict
+    signing_input: bytes
+    signature: bytes
+
+
+def base64url_decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+def base64url_encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def rsa_public_key_from_jwk(jwk: dict) -> RSAPublicKey:
+    """
+    JWK(kty=RSA)에서 RSA 공개키를 만든다.
+
+    Raises:
+        JWTError: RSA 키가 아니거나 n / e가 없거나 올바르지 않은 경우
+    """
+    if jwk.get("kty") != "RSA":
+        raise JWTError(f"지원하지 않는 키 유형입니다: {jwk.get('kty')}")
+    try:
+        n = int.from_bytes(base64url_decode(jwk["n"]), "big")
+        e = int.from_bytes(base64url_decode(jwk["e"]), "big")
+        return RSAPublicNumbers(e, n).public_key()
+    except (KeyError, ValueError) as e:
+        raise JWTError("JWK에 RSA 공개키 값이 없습니다.") from e
+
+
+def decode_jwt(token: str) -> DecodedJWT:
+    """
+    JWS Compact 토큰을 헤더/클레임/서명으로 나눈다. (서명은 검증하지 않는다)
+
+    Raises:
+        JWTError: 형식이 올바르지 않은 경우
+    """
+    try:
+        header_segment, claims_segment, signature_segment = token.split(".")
+        header = json.loads(base64url_decode(header_segment))
+        claims = json.loads(base64url_decode(claims_segment))
+        signature = base64url_decode(signature_segment)
+    except ValueError as e:
+        raise JWTError("JWT 형식이 올바르지 않습니다.") from e
+
+    if not isinstance(header, dict) or not isinstance(claims, dict):
+        raise JWTError("JWT 형식이 올바르지 않습니다.")
+
+    return DecodedJWT(
+        header=header,
+        claims=claims,
+        signing_input=f"{header_segment}.{claims_segment}".encode("ascii"),
+        signature=signature,
+    )
+
+
+def verify_rs256(signing_input: bytes, signature: bytes, key: RSAPublicKey) -> bool:
+    """RS256(RSASSA-PKCS1-v1_5 + SHA-256) 서명을 검증한다."""
+    try:
+        key.verify(signature, signing_input, padding.PKCS1v15(), hashes.SHA256())
+    except InvalidSignature:
+        return False
+    return True
@@ -0,0 +1,86 @@
+from collections import deque
+
+
+class LatencyTracker:
+    """
+    최근 지연 시간(초) 표본으로 백분위수를 추정하는 슬라이딩 윈도 추적기
+
+    매 조회마다 정렬하지 않도록 recompute_every 건마다 정렬된 스냅샷을 갱신한다.
+    타임아웃된 호출은 실제 지연이 최소한 그 타임아웃 이상이었으므로 사용한 타임아웃 값을 표본으로 기록한다.
+    """
+
+    def __init__(
+        self,
+        window: int = 512,
+        min_samples: int = 50,
+        recompute_every: int = 32,
+        max_consecutive_timeouts: int = 3,
+    ):
+        self._samples: deque[float] = deque(maxlen=window)
+        self._min_samples = min_samples
+        self._recompute_every = recompute_every
+        self._max_consecutive_timeouts = max_consecutive_timeouts
+        self._since_recompute = 0
+        self._sorted: list[float] = []
+        self.consecutive_timeouts = 0
+        self.timeouts = 0
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+        self._since_recompute += 1
+        self.consecutive_timeouts = 0
+
+    def record_timeout(self, timeout: float) -> None:
+        """타임아웃된 호출을 사용한 타임아웃 값의 표본으로 기록한다. (다음 계산에 즉시 반영)"""
+        self._samples.append(timeout)
+        self._since_recompute = self._recompute_every
+        self.consecutive_timeouts += 1
+        self.timeouts += 1
+
+    def percentile(self, q: float) -> float | None:
+        """q(0~1) 백분위 지연(초). 표본이 부족하면 None."""
+        if len(self._samples) < self._min_samples:
+            return None
+
+        self._refresh()
+        index = min(int(q * len(self._sorted)), len(self._sorted) - 1)
+        return self._sorted[index]
+
+    def _refresh(self) -> None:
+        if self._since_recompute >= self._recompute_every or not self._sorted:
+            self._sorted = sorted(self._samples)
+            self._since_recompute = 0
+
+    def adaptive_timeout(
+        self,
+        default: float,
+        q: float = 0.99,
+        multiplier: float = 3.0,
+        floor: float = 0.5,
+    ) -> float:
+        """
+        관측된 지연으로 요청 타임아웃을 계산한다.
+
+        q 백분위 지연 × multiplier를 [하한, default] 범위로 제한한다. 표본이 부족하면 default.
+        하한은 floor와 윈도 안의 최대 지연(타임아웃 표본 포함) 중 큰 값이므로,
+        upstream이 최근 실제로 필요로 한 시간보다 짧아지지 않는다.
+        타임아웃이 max_consecutive_timeouts번 연속되면 성공 표본이 다시 쌓일 때까지 default를 사용한다.
+        """
+        if self.consecutive_timeouts >= self._max_consecutive_timeouts:
+            return default
+
+        observed = self.percentile(q)
+        if observed is None:
+            return default
+        lower = max(floor, self._sorted[-1])
+        return min(max(observed * multiplier, lower), default)
+
+    def stats(self) -> dict:
+        return {
+            "samples": len(self._samples),
+            "p50": self.percentile(0.50),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "timeouts": self.timeouts,
+            "consecutive_timeouts": self.consecutive_timeouts,
+        }
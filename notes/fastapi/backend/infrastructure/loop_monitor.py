@@ -0,0 +1,184 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass
+
+from config.env import get_bool_env, get_float_env, get_int_env
+from metrics import REGISTRY
+
+logger = logging.getLogger("loop_monitor")
+
+_LAG_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+@dataclass(frozen=True)
+class LoopMonitorConfig:
+    """이벤트 루프 지연 모니터 설정"""
+    enabled: bool = True
+    # 지연 측정 주기(초)
+    interval: float = 0.1
+    # 이 시간(초) 이상 루프가 멈추면 블로킹으로 보고 스택을 캡처한다.
+    threshold: float = 0.1
+    capture_stacks: bool = True
+    max_reports: int = 20
+    # asyncio 디버그 모드 (느린 콜백 경고, 개발 환경용)
+    asyncio_debug: bool = False
+
+    @classmethod
+    def from_env(cls) -> "LoopMonitorConfig":
+        default = cls()
+        return cls(
+            enabled=get_bool_env("LOOP_MONITOR_ENABLED", default.enabled),
+            interval=get_float_env("LOOP_MONITOR_INTERVAL", default.interval),
+            threshold=get_float_env("LOOP_MONITOR_THRESHOLD", default.threshold),
+            capture_stacks=get_bool_env("LOOP_MONITOR_CAPTURE_STACKS", default.capture_stacks),
+            max_reports=get_int_env("LOOP_MONITOR_MAX_REPORTS", default.max_reports),
+            asyncio_debug=get_bool_env("LOOP_MONITOR_ASYNCIO_DEBUG", default.asyncio_debug),
+        )
+
+
+class EventLoopMonitor:
+    """
+    이벤트 루프 지연 모니터 및 블로킹 호출 탐지기
+
+    - 루프 안의 작업이 interval마다 깨어나 예정보다 늦은 시간(lag)을 메트릭으로 기록한다.
+    - 별도 감시 스레드가 루프의 heartbeat를 확인하고, threshold 이상 멈춰 있으면
+      그 순간 루프 스레드에서 실행 중인 코드의 스택과 현재 Task를 캡처한다.
+      (동기 HTTP 호출, time.sleep, 무거운 CPU 작업 등 요청 경로의 블로킹 지점을 찾는 용도)
+    """
+
+    def __init__(self, config: LoopMonitorConfig | None = None):
+        self._config = config or LoopMonitorConfig.from_env()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopping = threading.Event()
+        self._last_beat = time.monotonic()
+        # 진행 중인 멈춤에 대해 감시 스레드가 캡처한 보고 (루프가 재개되면 마무리된다)
+        self._pending_report: dict | None = None
+        self._reports: deque[dict] = deque(maxlen=self._config.max_reports)
+
+        self.max_lag = 0.0
+        self.last_lag = 0.0
+        self.blocked = 0
+
+        self._lag_seconds = REGISTRY.histogram(
+            "event_loop_lag_seconds", "이벤트 루프 예약 대비 지연 시간(초)", buckets=_LAG_BUCKETS
+        )
+        self._lag_last = REGISTRY.gauge("event_loop_lag_last_seconds", "최근 측정한 이벤트 루프 지연 시간(초)")
+        self._blocked_total = REGISTRY.counter(
+            "event_loop_blocked_total", "임계값 이상 이벤트 루프가 멈춘 횟수"
+        )
+
+    def start(self) -> None:
+        """현재 이벤트 루프에서 지연 측정 작업과 감시 스레드를 시작한다."""
+        if not self._config.enabled or self._task is not None:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        if self._config.asyncio_debug:
+            self._loop.set_debug(True)
+            self._loop.slow_callback_duration = self._config.threshold
+
+        self._last_beat = time.monotonic()
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._run(), name="event-loop-monitor")
+        if self._config.capture_stacks:
+            self._watchdog = threading.Thread(target=self._watch, name="event-loop-watchdog", daemon=True)
+            self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+
+    async def _run(self) -> None:
+        interval = self._config.interval
+        while True:
+            scheduled = time.monotonic()
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            self._last_beat = now
+            self._record(max(0.0, now - scheduled - interval))
+
+    def _record(self, lag: float) -> None:
+        self.last_lag = lag
+        self.max_lag = max(self.max_lag, lag)
+        self._lag_seconds.observe(lag)
+        self._lag_last.set(lag)
+
+        if lag < self._config.threshold:
+            return
+
+        self.blocked += 1
+        self._blocked_total.inc()
+        report = self._pending_report or {"captured": False}
+        self._pending_report = None
+        report = {**report, "lag": round(lag, 4), "at": time.time()}
+        self._reports.append(report)
+
+        if report["captured"]:
+            logger.warning(
+                "이벤트 루프가 %.3f초 멈췄습니다. (task=%s)\n%s",
+                lag,
+                report.get("task"),
+                "".join(report["stack"]),
+            )
+        else:
+            logger.warning("이벤트 루프가 %.3f초 멈췄습니다.", lag)
+
+    def _watch(self) -> None:
+        """감시 스레드: heartbeat가 끊기면 루프 스레드의 현재 스택을 캡처한다."""
+        poll = min(self._config.interval, self._config.threshold) / 2
+        stalled_since: float | None = None
+
+        while not self._stopping.wait(poll):
+            since_beat = time.monotonic() - self._last_beat
+            if since_beat < self._config.interval + self._config.threshold:
+                stalled_since = None
+                continue
+
+            if stalled_since == self._last_beat:
+                # 같은 멈춤은 한 번만 캡처한다.
+                continue
+            stalled_since = self._last_beat
+            self._pending_report = self._capture(since_beat - self._config.interval)
+
+    def _capture(self, blocked_for: float) -> dict:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        task = asyncio.current_task(self._loop) if self._loop is not None else None
+        return {
+            "captured": frame is not None,
+            "blocked_for_at_capture": round(blocked_for, 4),
+            "task": task.get_name() if task is not None else None,
+            "stack": traceback.format_stack(frame) if frame is not None else [],
+        }
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self._config.enabled,
+            "running": self._task is not None,
+            "interval": self._config.interval,
+            "threshold": self._config.threshold,
+            "last_lag": self.last_lag,
+            "max_lag": self.max_lag,
+            "blocked": self.blocked,
+        }
+
+    def reports(self) -> list[dict]:
+        """최근 블로킹 보고 (스택 포함)"""
+        return list(self._reports)
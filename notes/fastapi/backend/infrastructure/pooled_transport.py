@@ -0,0 +1,142 @@
+import ssl
+import typing
+
+import httpcore
+import httpx
+
+# httpcore 예외 → httpx 예외 (구체적인 예외가 먼저 오도록 정렬)
+_EXCEPTIONS: tuple[tuple[type[Exception], type[httpx.HTTPError]], ...] = (
+    (httpcore.PoolTimeout, httpx.PoolTimeout),
+    (httpcore.ConnectTimeout, httpx.ConnectTimeout),
+    (httpcore.ReadTimeout, httpx.ReadTimeout),
+    (httpcore.WriteTimeout, httpx.WriteTimeout),
+    (httpcore.TimeoutException, httpx.TimeoutException),
+    (httpcore.ConnectError, httpx.ConnectError),
+    (httpcore.ReadError, httpx.ReadError),
+    (httpcore.WriteError, httpx.WriteError),
+    (httpcore.NetworkError, httpx.NetworkError),
+    (httpcore.ProxyError, httpx.ProxyError),
+    (httpcore.UnsupportedProtocol, httpx.UnsupportedProtocol),
+    (httpcore.LocalProtocolError, httpx.LocalProtocolError),
+    (httpcore.RemoteProtocolError, httpx.RemoteProtocolError),
+    (httpcore.ProtocolError, httpx.ProtocolError),
+)
+
+
+def _map_exception(exc: Exception) -> Exception:
+    for source, target in _EXCEPTIONS:
+        if isinstance(exc, source):
+            return target(str(exc))
+    return exc
+
+
+class _ResponseStream(httpx.AsyncByteStream):
+    """httpcore 응답 본문을 httpx 스트림으로 감싸고, 닫힐 때 진행 중 요청 수를 줄인다."""
+
+    def __init__(self, stream: typing.AsyncIterable[bytes], on_close: typing.Callable[[], None]):
+        self._stream = stream
+        self._on_close = on_close
+        self._closed = False
+
+    async def __aiter__(self) -> typing.AsyncIterator[bytes]:
+        try:
+            async for chunk in self._stream:
+                yield chunk
+        except Exception as e:
+            mapped = _map_exception(e)
+            if mapped is e:
+                raise
+            raise mapped from e
+
+    async def aclose(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if hasattr(self._stream, "aclose"):
+                await self._stream.aclose()
+        finally:
+            self._on_close()
+
+
+class PooledTransport(httpx.AsyncBaseTransport):
+    """
+    httpcore 커넥션 풀을 공개 생성자로 직접 만들어 쓰는 httpx Transport
+
+    httpx.AsyncHTTPTransport는 네트워크 백엔드 지정 옵션과 풀 현황을 공개하지 않는다.
+    이 Transport는 httpcore.AsyncConnectionPool(network_backend=...)로 풀을 만들어
+    DNS 캐시 백엔드를 끼워 넣고, 풀 현황은 공개 API(connections)와 자체 카운터로 집계한다.
+    프록시 환경 변수는 사용하지 않는다. (httpx도 transport를 직접 지정하면 무시한다)
+    """
+
+    def __init__(
+        self,
+        limits: httpx.Limits,
+        http2: bool = False,
+        network_backend: httpcore.AsyncNetworkBackend | None = None,
+        ssl_context: ssl.SSLContext | None = None,
+    ):
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=ssl_context or httpx.create_ssl_context(verify=True, trust_env=True),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http1=True,
+            http2=http2,
+            network_backend=network_backend,
+        )
+        # 요청을 보낸 뒤 응답 본문이 닫히기 전까지의 요청 수 (커넥션 대기 포함)
+        self._in_flight = 0
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path,
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions,
+        )
+
+        self._in_flight += 1
+        try:
+            response = await self._pool.handle_async_request(core_request)
+        except Exception as e:
+            self._release()
+            mapped = _map_exception(e)
+            if mapped is e:
+                raise
+            raise mapped from e
+        except BaseException:
+            self._release()
+            raise
+
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=_ResponseStream(response.stream, self._release),
+            extensions=response.extensions,
+        )
+
+    def stats(self) -> dict:
+        """커넥션 수(전체/사용 중/유휴/HTTP/2)와 진행 중 요청 수를 반환한다."""
+        connections = self._pool.connections
+        idle = sum(1 for connection in connections if connection.is_idle())
+        active = len(connections) - idle
+        return {
+            "connections": len(connections),
+            "active_connections": active,
+            "idle_connections": idle,
+            "http2_connections": sum(1 for connection in connections if "HTTP/2" in connection.info()),
+            "requests_in_flight": self._in_flight,
+        }
+
+    async def aclose(self) -> None:
+        await self._pool.aclose()
@@ -0,0 +1,72 @@
+import hashlib
+from dataclasses import dataclass
+from typing import Callable, Hashable
+
+from fastapi import Response
+
+
+@dataclass(frozen=True)
+class PrecomputedResponse:
+    """미리 직렬화된 응답 본문과 ETag"""
+    body: bytes
+    etag: str
+    media_type: str = "application/json"
+
+
+def build_etag(body: bytes) -> str:
+    """응답 본문으로 strong ETag를 생성한다."""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match 헤더가 현재 ETag와 일치하는지 확인한다. (weak 비교, '*' 지원)"""
+    if not if_none_match:
+        return False
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+
+    return False
+
+
+class PrecomputedResponseCache:
+    """
+    설정 세대(key)별로 1개의 직렬화 결과를 보관하는 응답 캐시
+
+    key가 바뀌면(예: client_id / redirect_uri 변경) 기존 본문을 버리고 다시 직렬화한다.
+    """
+
+    def __init__(self, cache_control: str):
+        self._cache_control = cache_control
+        self._key: Hashable | None = None
+        self._payload: PrecomputedResponse | None = None
+
+    def get(self, key: Hashable, serialize: Callable[[], bytes]) -> PrecomputedResponse:
+        payload = self._payload
+        if payload is not None and self._key == key:
+            return payload
+
+        body = serialize()
+        payload = PrecomputedResponse(body=body, etag=build_etag(body))
+        self._key = key
+        self._payload = payload
+        return payload
+
+    def invalidate(self) -> None:
+        self._key = None
+        self._payload = None
+
+    def respond(self, payload: PrecomputedResponse, if_none_match: str | None) -> Response:
+        """If-None-Match가 일치하면 304, 아니면 캐시된 본문으로 응답한다."""
+        headers = {"ETag": payload.etag, "Cache-Control": self._cache_control}
+
+        if etag_matches(if_none_match, payload.etag):
+            return Response(status_code=304, headers=headers)
+
+        return Response(content=payload.body, media_type=payload.media_type, headers=headers)
@@ -0,0 +1,129 @@
+import asyncio
+import math
+import time
+from collections import deque
+
+from metrics import REGISTRY
+
+
+class RateLimitExceeded(Exception):
+    """대기열이 가득 찼거나 최대 대기 시간을 넘겨 요청을 받아들일 수 없는 경우"""
+
+    def __init__(self, retry_after: float, reason: str):
+        super().__init__(f"rate limit exceeded ({reason})")
+        self.retry_after = retry_after
+        self.reason = reason
+
+    @property
+    def retry_after_header(self) -> str:
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+class AsyncTokenBucket:
+    """
+    대기열 상한이 있는 비동기 토큰 버킷
+
+    - 초당 rate개씩 토큰이 채워지며 최대 burst개까지 쌓인다.
+    - 토큰이 없으면 FIFO 대기열에서 기다리며, 대기열이 max_queue를 넘으면 즉시 거절한다. (load shedding)
+    - max_wait 안에 토큰을 얻지 못한 요청도 거절한다.
+    """
+
+    def __init__(self, name: str, rate: float, burst: int, max_queue: int, max_wait: float):
+        self._rate = rate
+        self._burst = burst
+        self._max_queue = max_queue
+        self._max_wait = max_wait
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._waiters: deque[asyncio.Future] = deque()
+        self._wake_task: asyncio.Task | None = None
+
+        self._queue_depth = REGISTRY.gauge(
+            "kakao_rate_limiter_queue_depth", "토큰 대기 중인 upstream 요청 수", ("limiter",)
+        ).labels(name)
+        self._wait_seconds = REGISTRY.histogram(
+            "kakao_rate_limiter_wait_seconds", "토큰 획득까지 대기한 시간(초)", ("limiter",)
+        ).labels(name)
+        rejected = REGISTRY.counter(
+            "kakao_rate_limiter_rejected_total", "거절된 upstream 요청 수", ("limiter", "reason")
+        )
+        self._rejected_queue_full = rejected.labels(name, "queue_full")
+        self._rejected_timeout = rejected.labels(name, "timeout")
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+    def _estimated_wait(self) -> float:
+        return (len(self._waiters) + 1 - self._tokens) / self._rate
+
+    async def acquire(self) -> None:
+        """
+        토큰 1개를 획득한다.
+
+        Raises:
+            RateLimitExceeded: 대기열이 가득 찼거나 max_wait를 초과한 경우
+        """
+        self._refill()
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            self._wait_seconds.observe(0.0)
+            return
+
+        if len(self._waiters) >= self._max_queue:
+            self._rejected_queue_full.inc()
+            raise RateLimitExceeded(self._estimated_wait(), "queue_full")
+
+        started = time.monotonic()
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._queue_depth.set(len(self._waiters))
+        self._ensure_wake_task()
+
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout=self._max_wait)
+        except asyncio.TimeoutError:
+            # 타임아웃과 동시에 토큰을 배정받았다면 그대로 사용한다.
+            if not (waiter.done() and not waiter.cancelled()):
+                self._rejected_timeout.inc()
+                raise RateLimitExceeded(self._estimated_wait(), "timeout")
+        finally:
+            if not waiter.done():
+                waiter.cancel()
+                self._waiters.remove(waiter)
+            self._queue_depth.set(len(self._waiters))
+
+        self._wait_seconds.observe(time.monotonic() - started)
+
+    def _ensure_wake_task(self) -> None:
+        if self._wake_task is None or self._wake_task.done():
+            self._wake_task = asyncio.create_task(self._wake_waiters())
+
+    async def _wake_waiters(self) -> None:
+        while self._waiters:
+            self._refill()
+            while self._waiters and self._tokens >= 1:
+                waiter = self._waiters.popleft()
+                if waiter.done():
+                    continue
+                self._tokens -= 1
+                waiter.set_result(None)
+            self._queue_depth.set(len(self._waiters))
+            if self._waiters:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+    def drain(self) -> None:
+        """upstream이 429를 반환했을 때 쌓인 토큰을 비워 요청 속도를 늦춘다."""
+        self._refill()
+        self._tokens = min(self._tokens, 0.0)
+
+    def stats(self) -> dict:
+        self._refill()
+        return {
+            "rate": self._rate,
+            "burst": self._burst,
+            "tokens": self._tokens,
+            "queue_depth": len(self._waiters),
+            "max_queue": self._max_queue,
+        }
@@ -0,0 +1,23 @@
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json으로 동작한다.
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """JSON 직렬화 (orjson 우선, 없으면 표준 json)"""
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson 기반 JSON 응답 (애플리케이션 기본 응답 클래스)"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,83 @@
+import random
+import time
+from dataclasses import dataclass
+
+from config.env import get_float_env, get_int_env
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    멱등 upstream 호출 재시도 정책
+
+    재시도 간격은 지수 백오프에 full jitter를 적용한다: uniform(0, min(max_delay, base_delay × 2^n))
+    """
+    max_attempts: int = 3
+    base_delay: float = 0.05
+    max_delay: float = 1.0
+    retry_on_status: frozenset[int] = frozenset({500, 502, 503, 504})
+
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        default = cls()
+        return cls(
+            max_attempts=get_int_env("KAKAO_RETRY_MAX_ATTEMPTS", default.max_attempts),
+            base_delay=get_float_env("KAKAO_RETRY_BASE_DELAY", default.base_delay),
+            max_delay=get_float_env("KAKAO_RETRY_MAX_DELAY", default.max_delay),
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """attempt번째 시도가 실패한 뒤 기다릴 시간(초)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** (attempt - 1))))
+
+
+class RetryBudget:
+    """
+    전역 재시도 예산
+
+    요청 1건마다 ratio만큼 예산이 쌓이고 재시도 1회마다 1만큼 소모된다.
+    트래픽이 적을 때를 위해 초당 min_per_second만큼 추가로 적립되며, 최대 max_balance까지만 쌓인다.
+    upstream 장애 시 재시도가 전체 요청의 ratio 비율을 넘지 않아 장애를 증폭시키지 않는다.
+    """
+
+    def __init__(self, ratio: float = 0.1, min_per_second: float = 1.0, max_balance: float = 100.0):
+        self._ratio = ratio
+        self._min_per_second = min_per_second
+        self._max_balance = max_balance
+        self._balance = max_balance
+        self._updated_at = time.monotonic()
+
+        self.spent = 0
+        self.exhausted = 0
+
+    @classmethod
+    def from_env(cls) -> "RetryBudget":
+        return cls(
+            ratio=get_float_env("KAKAO_RETRY_BUDGET_RATIO", 0.1),
+            min_per_second=get_float_env("KAKAO_RETRY_BUDGET_MIN_PER_SECOND", 1.0),
+            max_balance=get_float_env("KAKAO_RETRY_BUDGET_MAX_BALANCE", 100.0),
+        )
+
+    def _accrue(self, amount: float) -> None:
+        now = time.monotonic()
+        amount += (now - self._updated_at) * self._min_per_second
+        self._updated_at = now
+        self._balance = min(self._max_balance, self._balance + amount)
+
+    def record_request(self) -> None:
+        """최초 시도 1건을 기록하고 예산을 적립한다."""
+        self._accrue(self._ratio)
+
+    def try_spend(self) -> bool:
+        """재시도 1회 분량의 예산을 소모한다. 예산이 없으면 False."""
+        self._accrue(0.0)
+        if self._balance < 1:
+            self.exhausted += 1
+            return False
+        self._balance -= 1
+        self.spent += 1
+        return True
+
+    def stats(self) -> dict:
+        self._accrue(0.0)
+        return {"balance": self._balance, "spent": self.spent, "exhausted": self.exhausted}
@@ -0,0 +1,112 @@
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from config.settings import get_settings
+from infrastructure.responses import dumps
+
+logger = logging.getLogger("server_timing")
+
+# 운영 중에도 켜고 끌 수 있는 전역 스위치 (초기값: SERVER_TIMING_ENABLED)
+_enabled = get_settings().server_timing_enabled
+
+
+def set_server_timing_enabled(enabled: bool) -> None:
+    """Server-Timing 헤더/타이밍 기록을 런타임에 켜거나 끈다."""
+    global _enabled
+    _enabled = enabled
+
+
+def is_server_timing_enabled() -> bool:
+    return _enabled
+
+
+class ServerTimingRecorder:
+    """요청 1건의 단계별 소요 시간(ms) 기록"""
+
+    __slots__ = ("phases",)
+
+    def __init__(self):
+        self.phases: list[tuple[str, float]] = []
+
+    def add(self, name: str, duration_ms: float) -> None:
+        self.phases.append((name, duration_ms))
+
+    def header_value(self, total_ms: float) -> str:
+        parts = [f"{name};dur={duration:.1f}" for name, duration in self.phases]
+        parts.append(f"total;dur={total_ms:.1f}")
+        return ", ".join(parts)
+
+
+_current: ContextVar[ServerTimingRecorder | None] = ContextVar("server_timing_recorder", default=None)
+
+
+@contextmanager
+def timing_phase(name: str) -> Iterator[None]:
+    """
+    현재 요청의 한 단계 소요 시간을 기록한다.
+
+    Server-Timing이 꺼져 있거나 요청 컨텍스트 밖이면 아무 것도 하지 않는다.
+    """
+    recorder = _current.get()
+    if recorder is None:
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        recorder.add(name, (time.perf_counter() - started) * 1000)
+
+
+class ServerTimingMiddleware:
+    """
+    응답에 Server-Timing 헤더를 추가하고 구조화된 타이밍 로그를 남기는 순수 ASGI 미들웨어
+
+    단계(phase)는 Controller/Service에서 timing_phase()로 기록한다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not _enabled:
+            await self.app(scope, receive, send)
+            return
+
+        recorder = ServerTimingRecorder()
+        token = _current.set(recorder)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                total_ms = (time.perf_counter() - started) * 1000
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", recorder.header_value(total_ms).encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            if recorder.phases:
+                route = scope.get("route")
+                logger.info(
+                    dumps(
+                        {
+                            "event": "server_timing",
+                            "method": scope["method"],
+                            "route": getattr(route, "path", scope["path"]),
+                            "status": status_code,
+                            "total_ms": round((time.perf_counter() - started) * 1000, 3),
+                            "phases": {name: round(duration, 3) for name, duration in recorder.phases},
+                        }
+                    ).decode()
+                )
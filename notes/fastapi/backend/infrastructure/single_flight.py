@@ -0,0 +1,48 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """
+    같은 키의 동시 비동기 호출을 하나로 합치는 single-flight 계층
+
+    - 첫 호출자가 fn()을 공유 작업(Task)으로 시작하고, 이후 호출자는 같은 작업의 결과를 기다린다.
+    - 호출자는 공유 작업을 shield해서 기다리므로 어느 호출자(첫 호출자 포함)가 취소되어도
+      작업은 계속 실행되어 나머지 호출자가 결과를 받는다.
+    - 결과는 보관하지 않는다. 뒤늦게 도착한 중복 호출은 Cache(get_or_compute)가 처리한다.
+    """
+
+    def __init__(self):
+        self._in_flight: dict[Hashable, asyncio.Future[T]] = {}
+
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.shared += 1
+        else:
+            self.calls += 1
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+
+        # 이 호출자가 취소되어도 공유 작업은 취소하지 않는다. (다른 대기자가 같은 작업을 기다린다)
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Future[T]) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # 대기자가 모두 취소된 경우에도 "exception was never retrieved" 경고가 나지 않도록 꺼낸다.
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": len(self._in_flight),
+            "calls": self.calls,
+            "shared": self.shared,
+        }
@@ -0,0 +1,151 @@
+import builtins
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+logger = logging.getLogger("startup")
+
+
+def _process_age() -> float | None:
+    """프로세스 생성 후 경과 시간(초). Linux(/proc)에서만 계산한다."""
+    try:
+        with open("/proc/self/stat") as f:
+            # comm 필드에 공백이 있을 수 있으므로 마지막 ')' 이후를 나눈다.
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return uptime - int(fields[19]) / os.sysconf("SC_CLK_TCK")
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+class ImportTimer:
+    """
+    모듈별 import 시간 측정기 (python -X importtime과 같은 누적/자체 시간)
+
+    builtins.__import__를 감싸 처음 로드되는 모듈만 기록한다.
+    기동 스레드의 import만 측정하며, 측정이 끝나면 uninstall()로 원래 함수를 복원한다.
+    """
+
+    def __init__(self):
+        self._original = builtins.__import__
+        self._thread_id = threading.get_ident()
+        # 진행 중인 import별 하위 import 누적 시간
+        self._stack: list[float] = []
+        # 모듈 이름 -> (누적 시간, 자체 시간)
+        self.records: dict[str, tuple[float, float]] = {}
+
+    def install(self) -> None:
+        builtins.__import__ = self._import
+
+    def uninstall(self) -> None:
+        if builtins.__import__ is self._import:
+            builtins.__import__ = self._original
+
+    @staticmethod
+    def _pending_module(name: str, globals: dict | None, fromlist, level: int) -> str | None:
+        """이번 import로 새로 로드될 모듈 이름 (이미 모두 로드되어 있으면 None)"""
+        if level > 0:
+            package = (globals or {}).get("__package__") or ""
+            base = package.rsplit(".", level - 1)[0] if level > 1 else package
+            name = f"{base}.{name}" if name else base
+
+        module = sys.modules.get(name)
+        if module is None:
+            return name
+
+        # from 패키지 import 하위모듈 형태는 하위 모듈이 새로 로드될 수 있다.
+        for item in fromlist or ():
+            if item != "*" and f"{name}.{item}" not in sys.modules and not hasattr(module, item):
+                return f"{name}.{item}"
+        return None
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if threading.get_ident() != self._thread_id:
+            return self._original(name, globals, locals, fromlist, level)
+
+        module_name = self._pending_module(name, globals, fromlist, level)
+        if module_name is None:
+            return self._original(name, globals, locals, fromlist, level)
+
+        self._stack.append(0.0)
+        started = time.perf_counter()
+        try:
+            return self._original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - started
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+            self.records.setdefault(module_name, (elapsed, elapsed - children))
+
+    def top(self, limit: int, key: str = "cumulative") -> list[dict]:
+        index = 0 if key == "cumulative" else 1
+        ranked = sorted(self.records.items(), key=lambda item: item[1][index], reverse=True)[:limit]
+        return [
+            {"module": name, "cumulative_ms": round(cumulative * 1000, 2), "self_ms": round(own * 1000, 2)}
+            for name, (cumulative, own) in ranked
+        ]
+
+
+class StartupProfile:
+    """
+    기동 시간 프로파일
+
+    - 프로세스 생성부터 주요 단계(import, 앱 구성, lifespan 시작, 워밍업)까지의 시간을 기록한다.
+    - STARTUP_PROFILE이 켜져 있으면 모듈별 import 시간도 측정한다.
+    """
+
+    def __init__(self):
+        self._origin = time.perf_counter()
+        self._process_age_at_origin = _process_age()
+        self._phases: dict[str, float] = {}
+        self._marks: dict[str, float] = {}
+        self._import_timer: ImportTimer | None = None
+
+    def start_import_timer(self) -> None:
+        """모듈별 import 시간 측정을 시작한다."""
+        if self._import_timer is None:
+            self._import_timer = ImportTimer()
+            self._import_timer.install()
+
+    def stop_import_timer(self) -> None:
+        if self._import_timer is not None:
+            self._import_timer.uninstall()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """블록 실행 시간을 단계 이름으로 기록한다."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._phases[name] = time.perf_counter() - started
+
+    def mark(self, name: str) -> None:
+        """기동 기준 시각부터 현재까지의 경과 시간을 기록한다."""
+        self._marks[name] = time.perf_counter() - self._origin
+
+    def report(self, limit: int = 20) -> dict:
+        report = {
+            "process_age_at_profile_start": self._process_age_at_origin,
+            "phases_ms": {name: round(value * 1000, 2) for name, value in self._phases.items()},
+            "marks_ms": {name: round(value * 1000, 2) for name, value in self._marks.items()},
+        }
+        if self._import_timer is not None:
+            report["imports"] = {
+                "modules": len(self._import_timer.records),
+                "slowest_cumulative": self._import_timer.top(limit, "cumulative"),
+                "slowest_self": self._import_timer.top(limit, "self"),
+            }
+        return report
+
+    def log_report(self, limit: int = 20) -> None:
+        logger.info("기동 시간 프로파일: %s", self.report(limit))
+
+
+startup_profile = StartupProfile()
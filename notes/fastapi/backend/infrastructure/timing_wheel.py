@@ -0,0 +1,116 @@
+import math
+import time
+from typing import Callable, Generic, TypeVar
+
+V = TypeVar("V")
+
+
+class TimingWheel(Generic[V]):
+    """
+    해시 타이밍 휠 기반 만료 맵
+
+    - 항목은 만료 tick에 해당하는 슬롯에 등록되며, 시간이 흐르면 지나간 슬롯만 비운다.
+      만료 처리 비용은 만료된 항목 수에 비례하고 전체 항목을 훑지 않는다.
+    - 슬롯 수는 max_ttl / tick으로 정해지며, 긴 휴지 뒤에도 한 바퀴 이상 돌지 않는다.
+    - 항목 수가 max_entries에 이르면 가장 오래 전에 넣은 항목부터 밀어낸다.
+    - 만료 시각은 tick 단위로 올림되므로 항목은 ttl 이상, ttl + tick 미만 동안 유지된다.
+    - 스레드 안전하지 않다. (이벤트 루프 스레드에서만 사용한다)
+    """
+
+    def __init__(
+        self,
+        tick: float,
+        max_ttl: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._tick = tick
+        self._max_ttl = max_ttl
+        self._max_entries = max_entries
+        self._clock = clock
+        self._slots: list[set[str]] = [set() for _ in range(math.ceil(max_ttl / tick) + 1)]
+        # key → (값, 만료 tick). dict 삽입 순서가 곧 오래된 순서다.
+        self._entries: dict[str, tuple[V, int]] = {}
+        self._current_tick = self._tick_of(clock())
+
+        self.expired = 0
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _tick_of(self, now: float) -> int:
+        return int(now // self._tick)
+
+    def advance(self) -> int:
+        """
+        현재 시각까지 지나간 슬롯의 만료 항목을 제거한다.
+
+        Returns:
+            int: 제거한 항목 수
+        """
+        target = self._tick_of(self._clock())
+        if target <= self._current_tick:
+            return 0
+
+        size = len(self._slots)
+        # 한 바퀴 이상 지났으면 모든 슬롯을 한 번씩만 확인한다.
+        first = max(self._current_tick + 1, target - size + 1)
+        removed = 0
+        for tick in range(first, target + 1):
+            slot = self._slots[tick % size]
+            if not slot:
+                continue
+            remaining = set()
+            for key in slot:
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                if entry[1] <= target:
+                    del self._entries[key]
+                    removed += 1
+                else:
+                    remaining.add(key)
+            self._slots[tick % size] = remaining
+
+        self._current_tick = target
+        self.expired += removed
+        return removed
+
+    def put(self, key: str, value: V, ttl: float) -> None:
+        """항목을 넣는다. (ttl은 max_ttl로 제한된다)"""
+        self.advance()
+        self._discard(key)
+
+        while len(self._entries) >= self._max_entries:
+            oldest = next(iter(self._entries))
+            self._discard(oldest)
+            self.evicted += 1
+
+        expires_at = self._tick_of(self._clock() + min(ttl, self._max_ttl)) + 1
+        self._entries[key] = (value, expires_at)
+        self._slots[expires_at % len(self._slots)].add(key)
+
+    def pop(self, key: str) -> V | None:
+        """만료되지 않은 항목을 꺼내고 제거한다. (없으면 None)"""
+        self.advance()
+        entry = self._discard(key)
+        if entry is None or entry[1] <= self._current_tick:
+            return None
+        return entry[0]
+
+    def _discard(self, key: str) -> tuple[V, int] | None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._slots[entry[1] % len(self._slots)].discard(key)
+        return entry
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "slots": len(self._slots),
+            "tick": self._tick,
+            "expired": self.expired,
+            "evicted": self.evicted,
+        }
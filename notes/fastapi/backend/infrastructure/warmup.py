@@ -0,0 +1,105 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+from infrastructure.responses import FastJSONResponse
+
+logger = logging.getLogger(__name__)
+
+
+class WarmupGate:
+    """
+    백그라운드 워밍업 상태
+
+    지연 기동 모드에서 lifespan은 워밍업 작업을 예약만 하고 바로 요청을 받기 시작한다.
+    워밍업이 끝나기 전에 들어온 요청은 WarmupGateMiddleware에서 완료를 기다린다.
+    """
+
+    def __init__(self):
+        self._ready = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.error: BaseException | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set() and self.error is None
+
+    @property
+    def done(self) -> bool:
+        return self._ready.is_set()
+
+    def reset(self) -> None:
+        self._ready = asyncio.Event()
+        self._task = None
+        self.error = None
+
+    async def run(self, warm_up: Callable[[], Awaitable[None]]) -> None:
+        """워밍업을 실행하고 완료(또는 실패)를 알린다."""
+        try:
+            await warm_up()
+        except Exception as e:
+            self.error = e
+            logger.exception("백그라운드 워밍업이 실패했습니다.")
+            raise
+        finally:
+            self._ready.set()
+
+    def start(self, warm_up: Callable[[], Awaitable[None]]) -> None:
+        """워밍업을 백그라운드 작업으로 시작한다."""
+        self._task = asyncio.create_task(self.run(warm_up), name="startup-warmup")
+        # 실패는 error로 보고하므로 작업 예외는 여기서 소비한다.
+        self._task.add_done_callback(lambda task: task.cancelled() or task.exception())
+
+    async def wait(self, timeout: float) -> bool:
+        """
+        워밍업 완료를 기다린다.
+
+        Returns:
+            bool: 제한 시간 안에 워밍업이 성공했는지 여부
+        """
+        if not self._ready.is_set():
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return False
+        return self.error is None
+
+    async def stop(self) -> None:
+        """진행 중인 워밍업 작업을 취소한다."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+
+class WarmupGateMiddleware:
+    """
+    워밍업 전 요청을 잠시 대기시키는 순수 ASGI 미들웨어
+
+    - bypass_paths(/health 등)는 워밍업과 무관하게 바로 처리한다.
+    - 그 외 요청은 워밍업 완료를 최대 timeout초 기다리고, 실패하거나 시간이 지나면 503(Retry-After)을 반환한다.
+    """
+
+    def __init__(self, app, gate: WarmupGate, bypass_paths: frozenset[str], timeout: float = 10.0):
+        self.app = app
+        self.gate = gate
+        self.bypass_paths = bypass_paths
+        self.timeout = timeout
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or self.gate.ready or scope["path"] in self.bypass_paths:
+            await self.app(scope, receive, send)
+            return
+
+        if not await self.gate.wait(self.timeout):
+            response = FastJSONResponse(
+                status_code=503,
+                content={"detail": "서버를 준비하는 중입니다. 잠시 후 다시 시도해 주세요."},
+                headers={"Retry-After": "1"},
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
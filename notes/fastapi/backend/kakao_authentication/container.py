@@ -0,0 +1,220 @@
+import importlib
+from contextlib import contextmanager
+from typing import Iterator
+
+import httpx
+
+from config.env import get_env
+from kakao_authentication.exceptions import KakaoOAuthConfigurationError
+from kakao_authentication.repository import (
+    InMemoryKakaoTokenStore,
+    KakaoTokenStoreInterface,
+    OAuthStateStoreInterface,
+    SQLiteKakaoTokenStore,
+    SQLiteLoginAuditStore,
+    SQLiteOAuthStateStore,
+)
+from kakao_authentication.service import (
+    KakaoOAuthServiceInterface,
+    KakaoOAuthServiceImpl,
+    ThreadPoolKakaoOAuthService,
+)
+from kakao_authentication.service.kakao_token_refresh_service import KakaoTokenRefreshService
+from kakao_authentication.service.login_audit_service import LoginAuditConfig, LoginAuditService
+
+
+def build_kakao_token_store() -> KakaoTokenStoreInterface:
+    """KAKAO_TOKEN_STORE(memory | sqlite) 설정에 맞는 토큰 저장소를 생성한다."""
+    backend = (get_env("KAKAO_TOKEN_STORE", "memory") or "memory").lower()
+
+    if backend == "sqlite":
+        return SQLiteKakaoTokenStore(get_env("KAKAO_TOKEN_STORE_SQLITE_PATH", "data/kakao_tokens.sqlite3"))
+
+    return InMemoryKakaoTokenStore()
+
+
+def build_oauth_state_store() -> OAuthStateStoreInterface | None:
+    """
+    KAKAO_OAUTH_STATE_STORE(memory | sqlite) 설정에 맞는 state 저장소를 생성한다.
+
+    memory이면 None을 반환하며, Service가 자체 TTL 설정으로 메모리 저장소를 만든다.
+    """
+    backend = (get_env("KAKAO_OAUTH_STATE_STORE", "memory") or "memory").lower()
+
+    if backend == "sqlite":
+        return SQLiteOAuthStateStore(get_env("KAKAO_OAUTH_STATE_SQLITE_PATH", "data/oauth_state.sqlite3"))
+
+    return None
+
+
+def build_login_audit_service() -> LoginAuditService:
+    """로그인 감사 로그 Service를 생성한다. LOGIN_AUDIT_ENABLED=false이면 저장소 파일을 열지 않는다."""
+    config = LoginAuditConfig.from_env()
+    if not config.enabled:
+        return LoginAuditService(None, config)
+    return LoginAuditService(
+        SQLiteLoginAuditStore(get_env("LOGIN_AUDIT_SQLITE_PATH", "data/login_audit.sqlite3")), config
+    )
+
+
+def build_kakao_oauth_service(http_client: httpx.AsyncClient | None = None) -> KakaoOAuthServiceInterface:
+    """
+    KAKAO_OAUTH_SERVICE_IMPL("패키지.모듈:클래스") 설정에 맞는 Service 구현체를 생성한다.
+
+    설정이 없으면 기본 비동기 구현체(KakaoOAuthServiceImpl)를 사용한다.
+    지정한 클래스가 비동기 계약(KakaoOAuthServiceInterface)을 따르지 않는 동기 구현체이면
+    ThreadPoolKakaoOAuthService로 감싸 전용 스레드 풀에서 실행한다.
+
+    Raises:
+        KakaoOAuthConfigurationError: 지정한 클래스를 찾을 수 없는 경우
+    """
+    target = get_env("KAKAO_OAUTH_SERVICE_IMPL")
+    if not target:
+        return KakaoOAuthServiceImpl(http_client=http_client, state_store=build_oauth_state_store())
+
+    module_name, _, class_name = target.partition(":")
+    try:
+        service_class = getattr(importlib.import_module(module_name), class_name)
+    except (ImportError, AttributeError, ValueError) as e:
+        raise KakaoOAuthConfigurationError(f"KAKAO_OAUTH_SERVICE_IMPL을 불러올 수 없습니다: {target}") from e
+
+    service = service_class()
+    if isinstance(service, KakaoOAuthServiceInterface):
+        return service
+    return ThreadPoolKakaoOAuthService(service)
+
+
+class KakaoAuthenticationContainer:
+    """
+    Kakao Authentication 의존성 컨테이너
+
+    - Service 구현체는 애플리케이션 시작 시 1회 생성되어 프로세스 전역에서 재사용된다.
+    - 생성 시점에 설정을 검증하여, 설정 누락은 요청마다 500이 아니라 기동 실패로 드러난다.
+    - 토큰 갱신 Service와 로그인 감사 로그 Service는 처음 필요할 때 생성하며, 토큰 갱신 Service는
+      get_service()가 반환하는 구현체(override 포함)를 사용한다.
+    - 백그라운드 작업(토큰 선제 갱신, 감사 로그 저장, 구현체 자체 작업)은 start()/shutdown()으로 관리한다.
+    - 구현체의 수명 주기와 통계는 Interface 메서드로만 다루므로 구현체 종류를 구분하지 않는다.
+    - 테스트에서는 override()로 다른 구현체를 주입할 수 있다.
+    """
+
+    def __init__(self):
+        self._service: KakaoOAuthServiceInterface | None = None
+        self._override: KakaoOAuthServiceInterface | None = None
+        self._token_refresh_service: KakaoTokenRefreshService | None = None
+        self._login_audit_service: LoginAuditService | None = None
+
+    def init(self, http_client: httpx.AsyncClient | None = None) -> KakaoOAuthServiceInterface:
+        """
+        Service 구현체를 생성하고 설정을 검증한다.
+
+        Raises:
+            KakaoOAuthConfigurationError: 필수 환경 변수가 설정되지 않은 경우
+        """
+        service = build_kakao_oauth_service(http_client)
+        service.validate_config()
+        self._service = service
+        return service
+
+    def start(self) -> None:
+        """백그라운드 작업(토큰 선제 갱신, 로그인 감사 로그 저장, 구현체 자체 작업)을 시작한다."""
+        self.get_token_refresh_service().start()
+        self.get_login_audit_service().start()
+        if self._service is not None:
+            self._service.start()
+
+    async def shutdown(self) -> None:
+        """백그라운드 작업을 중지하고 컨테이너가 보유한 인스턴스를 해제한다."""
+        if self._login_audit_service is not None:
+            await self._login_audit_service.stop()
+        if self._token_refresh_service is not None:
+            await self._token_refresh_service.stop()
+        if self._service is not None:
+            await self._service.stop()
+
+        self._token_refresh_service = None
+        self._login_audit_service = None
+        self._service = None
+
+    def reload_config(self) -> bool:
+        """
+        Service 설정값을 다시 읽는다.
+
+        Returns:
+            bool: 설정 변경으로 Service 캐시가 무효화되었는지 여부
+        """
+        if self._service is not None:
+            return self._service.reload_config()
+        return False
+
+    def get_service_stats(self, group: str) -> dict:
+        """
+        Service 통계 그룹(KakaoOAuthServiceInterface.get_stats)을 반환한다.
+
+        메트릭 수집 시 호출되므로 Service가 아직 없으면 생성하지 않는다.
+        """
+        service = self._override or self._service
+        if service is not None:
+            return service.get_stats(group)
+        return {}
+
+    def get_token_refresh_counters(self) -> dict:
+        """토큰 갱신 Service의 누적 카운터를 반환한다. (Service가 아직 없으면 생성하지 않는다)"""
+        if self._token_refresh_service is not None:
+            return self._token_refresh_service.get_counters()
+        return {}
+
+    def get_login_audit_counters(self) -> dict:
+        """로그인 감사 로그 Service의 누적 카운터를 반환한다. (Service가 아직 없으면 생성하지 않는다)"""
+        if self._login_audit_service is not None:
+            return self._login_audit_service.get_counters()
+        return {}
+
+    def get_upstream_urls(self) -> list[str]:
+        """Service가 호출하는 Kakao 엔드포인트 URL을 반환한다. (커넥션 사전 준비 대상)"""
+        return self.get_service().get_upstream_urls()
+
+    def get_service(self) -> KakaoOAuthServiceInterface:
+        """
+        의존성 그래프에 주입할 Service 인스턴스를 반환한다.
+
+        lifespan 밖(스크립트 등)에서 호출되면 최초 1회 지연 생성한다.
+        """
+        if self._override is not None:
+            return self._override
+
+        if self._service is None:
+            return self.init()
+
+        return self._service
+
+    def get_token_refresh_service(self) -> KakaoTokenRefreshService:
+        """토큰 보관/갱신 Service 인스턴스를 반환한다. (get_service()의 구현체로 토큰을 갱신한다)"""
+        if self._token_refresh_service is None:
+            self._token_refresh_service = KakaoTokenRefreshService(build_kakao_token_store(), self.get_service())
+
+        return self._token_refresh_service
+
+    def get_login_audit_service(self) -> LoginAuditService:
+        """로그인 감사 로그 Service 인스턴스를 반환한다."""
+        if self._login_audit_service is None:
+            self._login_audit_service = build_login_audit_service()
+
+        return self._login_audit_service
+
+    @contextmanager
+    def override(self, service: KakaoOAuthServiceInterface) -> Iterator[KakaoOAuthServiceInterface]:
+        """
+        테스트용: with 블록 동안 지정한 Service 구현체를 주입한다.
+
+        블록 안에서 요청한 토큰 갱신 Service는 주입한 구현체로 새로 만들며, 블록이 끝나면 이전 인스턴스로 되돌린다.
+        """
+        previous = (self._override, self._token_refresh_service)
+        self._override = service
+        self._token_refresh_service = None
+        try:
+            yield service
+        finally:
+            self._override, self._token_refresh_service = previous
+
+
+kakao_authentication_container = KakaoAuthenticationContainer()
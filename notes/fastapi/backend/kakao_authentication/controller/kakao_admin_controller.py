@@ -0,0 +1,51 @@
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+
+from authentication.dependencies import require_admin_token
+from config.env import get_int_env
+from infrastructure.responses import dumps
+from kakao_authentication.controller.kakao_oauth_controller import get_kakao_oauth_service
+from kakao_authentication.schemas.kakao_oauth import KakaoUserProfileResult, KakaoUserProfilesRequest
+from kakao_authentication.service import KakaoOAuthServiceInterface
+
+router = APIRouter(
+    prefix="/kakao-authentication/admin",
+    tags=["Kakao Authentication Admin"],
+    dependencies=[Depends(require_admin_token)],
+)
+
+
+async def _ndjson(results: AsyncIterator[KakaoUserProfileResult]) -> AsyncIterator[bytes]:
+    async for result in results:
+        yield dumps(result.model_dump()) + b"\n"
+
+
+@router.post("/user-profiles", response_class=StreamingResponse)
+async def resolve_user_profiles(
+    request: KakaoUserProfilesRequest,
+    service: KakaoOAuthServiceInterface = Depends(get_kakao_oauth_service),
+):
+    """
+    회원번호 일괄 프로필 조회 (관리자 전용, X-Admin-Token 헤더 필요)
+
+    Kakao 어드민 키로 여러 회원번호의 사용자 정보를 동시에 조회하고,
+    조회가 끝나는 순서대로 한 줄에 하나씩 NDJSON(KakaoUserProfileResult)으로 반환합니다.
+    실패한 회원번호도 status_code와 error를 담은 줄로 반환됩니다.
+
+    Args:
+        request: 조회할 회원번호 목록 (최대 KAKAO_BULK_PROFILE_MAX_IDS개)
+
+    Returns:
+        StreamingResponse: application/x-ndjson 스트림
+    """
+    max_ids = get_int_env("KAKAO_BULK_PROFILE_MAX_IDS", 1000)
+    if len(request.user_ids) > max_ids:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 조회할 수 있는 회원번호는 최대 {max_ids}개입니다."
+        )
+
+    results = service.resolve_user_profiles(request.user_ids)
+    return StreamingResponse(_ndjson(results), media_type="application/x-ndjson")
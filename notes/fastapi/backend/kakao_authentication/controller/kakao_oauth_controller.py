@@ -1,55 +1,189 @@
-from fastapi import APIRouter, Depends, Query
+import hashlib
+import time
 
-from kakao_authentication.service import KakaoOAuthServiceInterface, KakaoOAuthServiceImpl
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+
+from authentication.dependencies import get_current_user, get_session_service, set_session_cookie
+from authentication.exceptions import SessionRevokedError
+from authentication.schemas.session import SessionUser
+from authentication.service import SessionService
+from config.env import get_int_env
+from config.settings import get_settings
+from infrastructure.precomputed_response import PrecomputedResponseCache
+from infrastructure.responses import FastJSONResponse
+from infrastructure.server_timing import timing_phase
+from kakao_authentication.container import kakao_authentication_container
+from kakao_authentication.service import KakaoOAuthServiceInterface
+from kakao_authentication.service.kakao_token_refresh_service import KakaoTokenRefreshService
+from kakao_authentication.service.login_audit_service import LoginAuditService
 from kakao_authentication.schemas.kakao_oauth import (
     KakaoAuthUrlResponse,
     KakaoAuthCompleteResponse,
+    KakaoUserInfoResponse,
 )
 
 router = APIRouter(prefix="/kakao-authentication", tags=["Kakao Authentication"])
 
+# 인증 URL 응답은 설정값이 바뀌기 전까지 동일하므로 직렬화 결과(bytes)와 ETag를 재사용한다.
+_auth_url_response_cache = PrecomputedResponseCache(
+    cache_control=f"public, max-age={get_int_env('KAKAO_AUTH_URL_CACHE_MAX_AGE', 300)}",
+)
+
 
 def get_kakao_oauth_service() -> KakaoOAuthServiceInterface:
-    """Kakao OAuth Service 의존성 주입"""
-    return KakaoOAuthServiceImpl()
+    """Kakao OAuth Service 의존성 주입 (컨테이너가 보유한 프로세스 단일 인스턴스)"""
+    return kakao_authentication_container.get_service()
+
+
+def get_kakao_token_refresh_service() -> KakaoTokenRefreshService:
+    """Kakao 토큰 보관/갱신 Service 의존성 주입"""
+    return kakao_authentication_container.get_token_refresh_service()
+
+
+def get_login_audit_service() -> LoginAuditService:
+    """로그인 감사 로그 Service 의존성 주입"""
+    return kakao_authentication_container.get_login_audit_service()
 
 
 @router.get("/request-oauth-link", response_model=KakaoAuthUrlResponse)
 async def request_oauth_link(
+    if_none_match: str | None = Header(None),
     service: KakaoOAuthServiceInterface = Depends(get_kakao_oauth_service),
 ):
     """
     Kakao OAuth 인증 URL 생성
 
     사용자가 Kakao 인증을 요청할 때 인증 URL을 생성하여 반환합니다.
+    동일 설정에 대해서는 미리 직렬화된 응답을 반환하며, If-None-Match가 일치하면 304를 반환합니다.
+    state 검증을 사용하면 요청마다 다른 1회용 URL(state, PKCE)을 반환하며 캐시하지 않습니다.
 
     Returns:
         KakaoAuthUrlResponse: 인증 URL 및 관련 정보
     """
-    return service.generate_auth_url()
+    if get_settings().kakao.state_enabled:
+        auth_url_response = await service.create_authorization_request()
+        return FastJSONResponse(content=auth_url_response.model_dump(), headers={"Cache-Control": "no-store"})
+
+    auth_url_response = service.generate_auth_url()
+    # auth_url에는 client_id / redirect_uri가 포함되므로 설정이 바뀌면 캐시 키도 바뀐다.
+    payload = _auth_url_response_cache.get(
+        auth_url_response.auth_url,
+        lambda: auth_url_response.model_dump_json().encode(),
+    )
+    return _auth_url_response_cache.respond(payload, if_none_match)
 
 
 @router.get("/request-access-token-after-redirection", response_model=KakaoAuthCompleteResponse)
 async def request_access_token_after_redirection(
     code: str = Query(..., description="Kakao 인증 후 발급된 인가 코드"),
+    state: str | None = Query(None, description="인증 요청 때 발급된 state (state 검증 사용 시 필수)"),
     service: KakaoOAuthServiceInterface = Depends(get_kakao_oauth_service),
+    token_refresh_service: KakaoTokenRefreshService = Depends(get_kakao_token_refresh_service),
+    session_service: SessionService = Depends(get_session_service),
+    login_audit_service: LoginAuditService = Depends(get_login_audit_service),
 ):
     """
     인가 코드로 액세스 토큰 요청 및 사용자 정보 조회
 
     Kakao 인증 후 리다이렉트로 받은 인가 코드를 사용하여
     액세스 토큰을 발급받고 사용자 정보를 조회하여 반환합니다.
+    OIDC 모드에서는 사용자 정보 API 대신 id_token을 로컬에서 검증합니다.
+    발급된 토큰은 저장되어 만료 전에 리프레시 토큰으로 갱신됩니다.
+    로그인 성공은 감사 로그로 기록됩니다. (디스크 쓰기는 백그라운드에서 배치로 수행)
+    응답에는 이후 요청을 식별할 자체 세션 쿠키가 함께 설정됩니다.
+    같은 인가 코드의 중복 콜백은 같은 토큰 교환 결과를 받으므로 세션도 같은 세션을 받으며,
+    토큰 저장과 감사 로그는 세션을 처음 만든 요청에서만 수행됩니다.
 
     Args:
         code: Kakao 인증 후 발급된 인가 코드
+        state: 인증 요청 때 발급된 state
 
     Returns:
         KakaoAuthCompleteResponse: 토큰 정보 및 사용자 정보
     """
-    token_response = await service.request_access_token(code)
-    user_info_response = await service.get_user_info(token_response.access_token)
+    token_response = await service.request_access_token(code, state=state)
+    settings = get_settings()
+    # OIDC 모드: 토큰 응답의 id_token으로 사용자를 확인하고 /v2/user/me 호출을 생략한다.
+    # 설정값이 아니라 Service가 OIDC 검증을 지원하는지로 판단한다. (미지원 구현체는 사용자 정보 API로 확인)
+    if service.oidc_enabled and token_response.id_token:
+        user_info_response = await service.verify_id_token(token_response.id_token)
+    else:
+        user_info_response = await service.get_user_info(
+            token_response.access_token,
+            expires_in=token_response.expires_in,
+        )
+
+    with timing_phase("session"):
+        # 세션은 교환 결과(액세스 토큰)에 묶이므로 중복 콜백은 새 세션 대신 같은 세션을 받는다.
+        try:
+            session = await session_service.create_session(
+                SessionUser(
+                    user_id=user_info_response.id,
+                    nickname=user_info_response.nickname,
+                    email=user_info_response.email,
+                    profile_image_url=user_info_response.profile_image_url,
+                ),
+                login_key=hashlib.sha256(token_response.access_token.encode()).hexdigest(),
+            )
+        except SessionRevokedError:
+            # 로그아웃한 로그인의 콜백이 다시 들어온 경우: 세션을 되살리지 않고 새 로그인을 요구한다.
+            raise HTTPException(
+                status_code=401,
+                detail="이미 로그아웃된 로그인입니다. 다시 로그인해 주세요.",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+    if session.created:
+        await token_refresh_service.register(user_info_response.id, token_response)
+        with timing_phase("audit"):
+            await login_audit_service.record(user_info_response.id, token_response.scope)
+
+    with timing_phase("serialize"):
+        # 빠른 응답 모드: upstream 응답으로 만든 모델을 response_model로 다시 검증하지 않고 바로 직렬화한다.
+        if settings.fast_response_mode:
+            response = FastJSONResponse(
+                content={
+                    "token": token_response.model_dump(),
+                    "user_info": user_info_response.model_dump(),
+                }
+            )
+        else:
+            # 표준 모드: 응답 모델 검증과 직렬화를 이 단계 안에서 수행해 serialize 시간에 포함시킨다.
+            complete_response = KakaoAuthCompleteResponse(
+                token=token_response,
+                user_info=user_info_response,
+            )
+            response = Response(content=complete_response.model_dump_json(), media_type="application/json")
+
+    set_session_cookie(response, session_service, session)
+    return response
+
+
+@router.get("/user-info", response_model=KakaoUserInfoResponse)
+async def current_kakao_user_info(
+    user: SessionUser = Depends(get_current_user),
+    service: KakaoOAuthServiceInterface = Depends(get_kakao_oauth_service),
+    token_refresh_service: KakaoTokenRefreshService = Depends(get_kakao_token_refresh_service),
+):
+    """
+    로그인한 사용자의 최신 Kakao 사용자 정보 조회
+
+    세션 사용자의 저장된 Kakao 액세스 토큰(만료 전에 선제 갱신됨)으로 사용자 정보를 조회합니다.
 
-    return KakaoAuthCompleteResponse(
-        token=token_response,
-        user_info=user_info_response,
+    Returns:
+        KakaoUserInfoResponse: Kakao 사용자 정보
+
+    Raises:
+        HTTPException: 세션이 없거나 저장된 Kakao 토큰이 없는(만료/폐기된) 경우 (401)
+    """
+    token = await token_refresh_service.get_token(user.user_id)
+    if token is None:
+        raise HTTPException(
+            status_code=401,
+            detail="Kakao 로그인이 만료되었습니다. 다시 로그인해 주세요.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return await service.get_user_info(
+        token.access_token,
+        expires_in=int(token.access_token_expires_at - time.time()),
     )
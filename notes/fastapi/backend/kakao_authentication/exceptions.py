@@ -0,0 +1,3 @@
+class KakaoOAuthConfigurationError(RuntimeError):
+    """Kakao OAuth 필수 설정(환경 변수)이 누락되었거나 잘못된 경우"""
+    pass
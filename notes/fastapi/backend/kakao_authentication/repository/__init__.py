@@ -0,0 +1,31 @@
+from kakao_authentication.repository.kakao_token_store_interface import (
+    KakaoTokenStoreInterface,
+    StoredKakaoToken,
+)
+from kakao_authentication.repository.in_memory_kakao_token_store import InMemoryKakaoTokenStore
+from kakao_authentication.repository.sqlite_kakao_token_store import SQLiteKakaoTokenStore
+from kakao_authentication.repository.login_audit_store_interface import (
+    LoginAuditRecord,
+    LoginAuditStoreInterface,
+)
+from kakao_authentication.repository.sqlite_login_audit_store import SQLiteLoginAuditStore
+from kakao_authentication.repository.oauth_state_store_interface import (
+    OAuthStateStoreInterface,
+    StoredOAuthState,
+)
+from kakao_authentication.repository.in_memory_oauth_state_store import InMemoryOAuthStateStore
+from kakao_authentication.repository.sqlite_oauth_state_store import SQLiteOAuthStateStore
+
+__all__ = [
+    "KakaoTokenStoreInterface",
+    "StoredKakaoToken",
+    "InMemoryKakaoTokenStore",
+    "SQLiteKakaoTokenStore",
+    "LoginAuditRecord",
+    "LoginAuditStoreInterface",
+    "SQLiteLoginAuditStore",
+    "OAuthStateStoreInterface",
+    "StoredOAuthState",
+    "InMemoryOAuthStateStore",
+    "SQLiteOAuthStateStore",
+]
@@ -0,0 +1,66 @@
+import heapq
+
+from kakao_authentication.repository.kakao_token_store_interface import (
+    KakaoTokenStoreInterface,
+    StoredKakaoToken,
+)
+
+
+class InMemoryKakaoTokenStore(KakaoTokenStoreInterface):
+    """
+    프로세스 메모리 기반 토큰 저장소
+
+    갱신 대상 조회는 refresh_at 기준 최소 힙으로 처리하며,
+    덮어쓰기/삭제된 항목은 조회 시점에 지연 제거한다.
+    """
+
+    def __init__(self):
+        self._tokens: dict[int, StoredKakaoToken] = {}
+        self._schedule: list[tuple[float, int]] = []
+
+    async def save(self, token: StoredKakaoToken) -> None:
+        self._tokens[token.user_id] = token
+        heapq.heappush(self._schedule, (token.refresh_at, token.user_id))
+
+    async def get(self, user_id: int) -> StoredKakaoToken | None:
+        return self._tokens.get(user_id)
+
+    async def delete(self, user_id: int) -> None:
+        self._tokens.pop(user_id, None)
+
+    async def compare_and_swap(
+        self,
+        user_id: int,
+        expected_refresh_at: float,
+        token: StoredKakaoToken | None,
+    ) -> bool:
+        current = self._tokens.get(user_id)
+        if current is None or current.refresh_at != expected_refresh_at:
+            return False
+        if token is None:
+            del self._tokens[user_id]
+        else:
+            await self.save(token)
+        return True
+
+    async def find_due_for_refresh(self, now: float, limit: int) -> list[StoredKakaoToken]:
+        due: list[StoredKakaoToken] = []
+        seen: set[int] = set()
+
+        while self._schedule and self._schedule[0][0] <= now and len(due) < limit:
+            refresh_at, user_id = heapq.heappop(self._schedule)
+            token = self._tokens.get(user_id)
+            # 삭제되었거나 더 최신 일정으로 덮어쓴 항목은 버린다.
+            if token is None or token.refresh_at != refresh_at or user_id in seen:
+                continue
+            seen.add(user_id)
+            due.append(token)
+
+        # 조회만으로 일정이 사라지지 않도록 되돌려 둔다. (갱신 후 save 시 새 일정이 추가된다)
+        for token in due:
+            heapq.heappush(self._schedule, (token.refresh_at, token.user_id))
+
+        return due
+
+    async def count(self) -> int:
+        return len(self._tokens)
@@ -0,0 +1,28 @@
+from infrastructure.timing_wheel import TimingWheel
+from kakao_authentication.repository.oauth_state_store_interface import (
+    OAuthStateStoreInterface,
+    StoredOAuthState,
+)
+
+
+class InMemoryOAuthStateStore(OAuthStateStoreInterface):
+    """
+    프로세스 메모리 기반 state 저장소
+
+    만료는 해시 타이밍 휠로 처리하므로 전체 항목을 훑지 않으며,
+    max_entries를 넘으면 가장 오래된 state부터 밀어낸다.
+    """
+
+    def __init__(self, max_ttl: float, max_entries: int, tick: float = 1.0):
+        self._wheel: TimingWheel[StoredOAuthState] = TimingWheel(tick, max_ttl, max_entries)
+
+    async def save(self, state: str, record: StoredOAuthState, ttl: float) -> None:
+        self._wheel.put(state, record, ttl)
+
+    async def consume(self, state: str) -> StoredOAuthState | None:
+        return self._wheel.pop(state)
+
+    def stats(self) -> dict:
+        self._wheel.advance()
+        stats = self._wheel.stats()
+        return {"backend": "memory", "live": stats.pop("entries"), **stats}
@@ -0,0 +1,66 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class StoredKakaoToken:
+    """저장된 Kakao 토큰 (만료 시각은 epoch 초 단위)"""
+    user_id: int
+    access_token: str
+    token_type: str
+    access_token_expires_at: float
+    refresh_at: float
+    refresh_token: str | None = None
+    refresh_token_expires_at: float | None = None
+    scope: str | None = None
+
+
+class KakaoTokenStoreInterface(ABC):
+    """Kakao 토큰 저장소 Interface"""
+
+    @abstractmethod
+    async def save(self, token: StoredKakaoToken) -> None:
+        """사용자 토큰 저장 (같은 user_id는 덮어쓴다)"""
+        pass
+
+    @abstractmethod
+    async def get(self, user_id: int) -> StoredKakaoToken | None:
+        """사용자 토큰 조회"""
+        pass
+
+    @abstractmethod
+    async def delete(self, user_id: int) -> None:
+        """사용자 토큰 삭제"""
+        pass
+
+    @abstractmethod
+    async def compare_and_swap(
+        self,
+        user_id: int,
+        expected_refresh_at: float,
+        token: StoredKakaoToken | None,
+    ) -> bool:
+        """
+        저장된 토큰의 refresh_at이 expected_refresh_at과 같을 때만 token으로 바꾼다. (None이면 삭제)
+
+        여러 워커가 같은 토큰을 갱신하지 않도록 갱신 대상을 선점하고,
+        선점 이후 다른 곳에서 덮어쓴 토큰을 갱신 결과로 되돌리지 않는 데 사용한다.
+
+        Returns:
+            bool: 교체(또는 삭제)했으면 True
+        """
+        pass
+
+    @abstractmethod
+    async def find_due_for_refresh(self, now: float, limit: int) -> list[StoredKakaoToken]:
+        """갱신 예정 시각(refresh_at)이 지난 토큰을 오래된 순으로 조회"""
+        pass
+
+    @abstractmethod
+    async def count(self) -> int:
+        """저장된 토큰 수"""
+        pass
+
+    async def close(self) -> None:
+        """저장소 자원 정리"""
+        pass
@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class LoginAuditRecord:
+    """로그인 성공 기록 1건 (로그인 시각은 epoch 초 단위)"""
+    user_id: int
+    logged_in_at: float
+    scope: str | None = None
+
+
+class LoginAuditStoreInterface(ABC):
+    """로그인 감사 로그 저장소 Interface"""
+
+    @abstractmethod
+    async def write_batch(self, records: list[LoginAuditRecord]) -> None:
+        """기록 여러 건을 하나의 트랜잭션으로 저장 (전부 저장되거나 전부 실패한다)"""
+        pass
+
+    @abstractmethod
+    async def count(self) -> int:
+        """저장된 기록 수"""
+        pass
+
+    async def close(self) -> None:
+        """저장소 자원 정리"""
+        pass
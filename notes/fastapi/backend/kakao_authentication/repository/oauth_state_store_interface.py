@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class StoredOAuthState:
+    """인증 요청 1건에 묶인 검증 정보 (생성 시각은 epoch 초 단위)"""
+    code_verifier: str
+    nonce: str | None
+    created_at: float
+
+
+class OAuthStateStoreInterface(ABC):
+    """OAuth state / PKCE 1회용 값 저장소 Interface"""
+
+    @abstractmethod
+    async def save(self, state: str, record: StoredOAuthState, ttl: float) -> None:
+        """state에 검증 정보를 ttl초 동안 저장"""
+        pass
+
+    @abstractmethod
+    async def consume(self, state: str) -> StoredOAuthState | None:
+        """만료되지 않은 state의 검증 정보를 꺼내고 삭제 (1회용, 없으면 None)"""
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """저장소 통계 (live: 현재 보관 중인 state 수)"""
+        pass
+
+    async def close(self) -> None:
+        """저장소 자원 정리"""
+        pass
@@ -0,0 +1,127 @@
+import asyncio
+import sqlite3
+import threading
+from pathlib import Path
+
+from kakao_authentication.repository.kakao_token_store_interface import (
+    KakaoTokenStoreInterface,
+    StoredKakaoToken,
+)
+
+_COLUMNS = (
+    "user_id, access_token, token_type, access_token_expires_at, refresh_at, "
+    "refresh_token, refresh_token_expires_at, scope"
+)
+
+
+class SQLiteKakaoTokenStore(KakaoTokenStoreInterface):
+    """
+    로컬 SQLite 파일 기반 토큰 저장소
+
+    - 프로세스 재시작 후에도 토큰이 유지된다.
+    - WAL 모드를 사용해 여러 워커 프로세스가 같은 파일을 공유할 수 있다.
+    - SQLite 호출은 블로킹이므로 스레드에서 실행해 이벤트 루프를 막지 않는다.
+    """
+
+    def __init__(self, path: str | Path):
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self._path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS kakao_tokens (
+                user_id INTEGER PRIMARY KEY,
+                access_token TEXT NOT NULL,
+                token_type TEXT NOT NULL,
+                access_token_expires_at REAL NOT NULL,
+                refresh_at REAL NOT NULL,
+                refresh_token TEXT,
+                refresh_token_expires_at REAL,
+                scope TEXT
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_kakao_tokens_refresh_at ON kakao_tokens (refresh_at)"
+        )
+
+    def _execute(self, sql: str, params: tuple = ()) -> list[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _execute_rowcount(self, sql: str, params: tuple = ()) -> int:
+        with self._lock:
+            return self._conn.execute(sql, params).rowcount
+
+    @staticmethod
+    def _to_row(token: StoredKakaoToken) -> tuple:
+        return (
+            token.user_id,
+            token.access_token,
+            token.token_type,
+            token.access_token_expires_at,
+            token.refresh_at,
+            token.refresh_token,
+            token.refresh_token_expires_at,
+            token.scope,
+        )
+
+    async def save(self, token: StoredKakaoToken) -> None:
+        await asyncio.to_thread(
+            self._execute,
+            f"INSERT OR REPLACE INTO kakao_tokens ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            self._to_row(token),
+        )
+
+    async def compare_and_swap(
+        self,
+        user_id: int,
+        expected_refresh_at: float,
+        token: StoredKakaoToken | None,
+    ) -> bool:
+        # 단일 UPDATE/DELETE 문의 조건으로 비교하므로 여러 프로세스가 동시에 호출해도 한 곳만 성공한다.
+        if token is None:
+            changed = await asyncio.to_thread(
+                self._execute_rowcount,
+                "DELETE FROM kakao_tokens WHERE user_id = ? AND refresh_at = ?",
+                (user_id, expected_refresh_at),
+            )
+        else:
+            changed = await asyncio.to_thread(
+                self._execute_rowcount,
+                "UPDATE kakao_tokens SET access_token = ?, token_type = ?, access_token_expires_at = ?, "
+                "refresh_at = ?, refresh_token = ?, refresh_token_expires_at = ?, scope = ? "
+                "WHERE user_id = ? AND refresh_at = ?",
+                (*self._to_row(token)[1:], user_id, expected_refresh_at),
+            )
+        return changed == 1
+
+    async def get(self, user_id: int) -> StoredKakaoToken | None:
+        rows = await asyncio.to_thread(
+            self._execute,
+            f"SELECT {_COLUMNS} FROM kakao_tokens WHERE user_id = ?",
+            (user_id,),
+        )
+        return StoredKakaoToken(*rows[0]) if rows else None
+
+    async def delete(self, user_id: int) -> None:
+        await asyncio.to_thread(self._execute, "DELETE FROM kakao_tokens WHERE user_id = ?", (user_id,))
+
+    async def find_due_for_refresh(self, now: float, limit: int) -> list[StoredKakaoToken]:
+        rows = await asyncio.to_thread(
+            self._execute,
+            f"SELECT {_COLUMNS} FROM kakao_tokens WHERE refresh_at <= ? ORDER BY refresh_at LIMIT ?",
+            (now, limit),
+        )
+        return [StoredKakaoToken(*row) for row in rows]
+
+    async def count(self) -> int:
+        rows = await asyncio.to_thread(self._execute, "SELECT COUNT(*) FROM kakao_tokens")
+        return rows[0][0]
+
+    async def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,70 @@
+import asyncio
+import sqlite3
+import threading
+from pathlib import Path
+
+from kakao_authentication.repository.login_audit_store_interface import (
+    LoginAuditRecord,
+    LoginAuditStoreInterface,
+)
+
+
+class SQLiteLoginAuditStore(LoginAuditStoreInterface):
+    """
+    로컬 SQLite 파일 기반 로그인 감사 로그 저장소
+
+    - 기록은 추가만 하며(append-only), WAL 모드로 여러 워커 프로세스가 같은 파일에 쓸 수 있다.
+    - 감사 기록이므로 synchronous=FULL로 커밋마다 fsync한다. 배치 단위로 커밋(group commit)하므로
+      fsync 비용은 로그인 건수가 아니라 배치 수에 비례한다.
+    - 저장된 기록 수는 열 때 AUTOINCREMENT 시퀀스에서 한 번 읽고, 이후에는 커밋한 배치 건수로 추적한다.
+      (다른 워커가 쓴 기록은 포함되지 않는다) 통계 조회가 테이블을 훑거나 쓰기 잠금을 기다리지 않는다.
+    - SQLite 호출은 블로킹이므로 스레드에서 실행해 이벤트 루프를 막지 않는다.
+    """
+
+    def __init__(self, path: str | Path):
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self._path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=FULL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS login_audit (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER NOT NULL,
+                logged_in_at REAL NOT NULL,
+                scope TEXT
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_login_audit_user_id ON login_audit (user_id, logged_in_at)"
+        )
+        # 추가만 하는 테이블이므로 AUTOINCREMENT 시퀀스가 곧 기록 수다. (COUNT(*) 전체 스캔 없이 읽는다)
+        row = self._conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'login_audit'").fetchone()
+        self._records = row[0] if row else 0
+
+    def _write_batch(self, records: list[LoginAuditRecord]) -> None:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                inserted = self._conn.executemany(
+                    "INSERT INTO login_audit (user_id, logged_in_at, scope) VALUES (?, ?, ?)",
+                    [(record.user_id, record.logged_in_at, record.scope) for record in records],
+                ).rowcount
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            self._records += inserted
+
+    async def write_batch(self, records: list[LoginAuditRecord]) -> None:
+        await asyncio.to_thread(self._write_batch, records)
+
+    async def count(self) -> int:
+        return self._records
+
+    async def close(self) -> None:
+        with self._lock:
+            self._conn.close()
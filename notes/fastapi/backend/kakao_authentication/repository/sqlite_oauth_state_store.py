@@ -0,0 +1,91 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from kakao_authentication.repository.oauth_state_store_interface import (
+    OAuthStateStoreInterface,
+    StoredOAuthState,
+)
+
+
+class SQLiteOAuthStateStore(OAuthStateStoreInterface):
+    """
+    로컬 SQLite 파일 기반 state 저장소
+
+    - WAL 모드를 사용해 같은 호스트의 워커 프로세스가 state를 공유한다. (인증 요청과 콜백이 다른 워커로 가도 검증된다)
+    - consume은 DELETE ... RETURNING 한 문장으로 처리해 같은 state가 두 번 소비되지 않는다.
+    - 만료 항목은 purge_interval마다 expires_at 인덱스 범위로만 삭제하며 전체 테이블을 훑지 않는다.
+    - 보관 중인 state 수는 저장/소비/삭제 건수로 추적한다. (이 프로세스가 처리한 건수이므로 워커별 값을 합산해야 전체 수가 된다)
+    - SQLite 호출은 블로킹이므로 스레드에서 실행해 이벤트 루프를 막지 않는다.
+    """
+
+    def __init__(self, path: str | Path, purge_interval: float = 5.0):
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._purge_interval = purge_interval
+        self._last_purge = 0.0
+        self._live = 0
+        self._expired = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self._path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS oauth_states (
+                state TEXT PRIMARY KEY,
+                code_verifier TEXT NOT NULL,
+                nonce TEXT,
+                created_at REAL NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_oauth_states_expires_at ON oauth_states (expires_at)"
+        )
+
+    def _save(self, state: str, record: StoredOAuthState, ttl: float) -> None:
+        now = time.time()
+        with self._lock:
+            # state는 무작위 값이라 충돌하지 않으므로 저장 1건을 보관 1건으로 센다.
+            self._conn.execute(
+                "INSERT OR REPLACE INTO oauth_states (state, code_verifier, nonce, created_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (state, record.code_verifier, record.nonce, record.created_at, now + ttl),
+            )
+            self._live += 1
+            if now - self._last_purge >= self._purge_interval:
+                self._last_purge = now
+                purged = self._conn.execute(
+                    "DELETE FROM oauth_states WHERE expires_at <= ?", (now,)
+                ).rowcount
+                self._expired += purged
+                self._live -= purged
+
+    async def save(self, state: str, record: StoredOAuthState, ttl: float) -> None:
+        await asyncio.to_thread(self._save, state, record, ttl)
+
+    def _consume(self, state: str) -> StoredOAuthState | None:
+        with self._lock:
+            row = self._conn.execute(
+                "DELETE FROM oauth_states WHERE state = ? AND expires_at > ? "
+                "RETURNING code_verifier, nonce, created_at",
+                (state, time.time()),
+            ).fetchone()
+            if row is None:
+                return None
+            self._live -= 1
+            return StoredOAuthState(*row)
+
+    async def consume(self, state: str) -> StoredOAuthState | None:
+        return await asyncio.to_thread(self._consume, state)
+
+    def stats(self) -> dict:
+        return {"backend": "sqlite", "live": self._live, "expired": self._expired}
+
+    async def close(self) -> None:
+        with self._lock:
+            self._conn.close()
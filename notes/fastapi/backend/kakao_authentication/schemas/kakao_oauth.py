@@ -25,6 +25,7 @@ class KakaoTokenResponse(BaseModel):
     expires_in: int = Field(..., description="액세스 토큰 만료 시간(초)")
     refresh_token_expires_in: Optional[int] = Field(None, description="리프레시 토큰 만료 시간(초)")
     scope: Optional[str] = Field(None, description="인가된 scope")
+    id_token: Optional[str] = Field(None, description="OIDC ID 토큰 (openid scope 요청 시)")
 
 
 class KakaoUserInfoResponse(BaseModel):
@@ -39,3 +40,16 @@ class KakaoAuthCompleteResponse(BaseModel):
     """Kakao 인증 완료 응답 (토큰 + 사용자 정보)"""
     token: KakaoTokenResponse = Field(..., description="토큰 정보")
     user_info: KakaoUserInfoResponse = Field(..., description="사용자 정보")
+
+
+class KakaoUserProfilesRequest(BaseModel):
+    """회원번호 일괄 프로필 조회 요청"""
+    user_ids: list[int] = Field(..., min_length=1, description="조회할 Kakao 회원번호 목록")
+
+
+class KakaoUserProfileResult(BaseModel):
+    """회원번호 1건의 프로필 조회 결과 (NDJSON 한 줄)"""
+    user_id: int = Field(..., description="회원번호")
+    user_info: Optional[KakaoUserInfoResponse] = Field(None, description="사용자 정보 (실패 시 None)")
+    status_code: int = Field(200, description="조회 결과 상태 코드")
+    error: Optional[str] = Field(None, description="실패 사유")
@@ -1,4 +1,11 @@
 from kakao_authentication.service.kakao_oauth_service_interface import KakaoOAuthServiceInterface
 from kakao_authentication.service.kakao_oauth_service_impl import KakaoOAuthServiceImpl
+from kakao_authentication.service.sync_kakao_oauth_service_interface import SyncKakaoOAuthServiceInterface
+from kakao_authentication.service.thread_pool_kakao_oauth_service import ThreadPoolKakaoOAuthService
 
-__all__ = ["KakaoOAuthServiceInterface", "KakaoOAuthServiceImpl"]
+__all__ = [
+    "KakaoOAuthServiceInterface",
+    "KakaoOAuthServiceImpl",
+    "SyncKakaoOAuthServiceInterface",
+    "ThreadPoolKakaoOAuthService",
+]
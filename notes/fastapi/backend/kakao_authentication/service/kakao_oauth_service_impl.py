@@ -1,15 +1,67 @@
+import asyncio
+import hashlib
+import logging
+import secrets
+import time
+from typing import AsyncIterator, Awaitable, TypeVar
 from urllib.parse import urlencode
 import httpx
 from fastapi import HTTPException
-
-from config.env import get_kakao_client_id, get_kakao_redirect_uri
+from pydantic import BaseModel
+
+from config.env import (
+    get_bool_env,
+    get_fast_response_mode,
+    get_env,
+    get_float_env,
+    get_int_env,
+    get_kakao_auth_base_url,
+    get_kakao_client_id,
+    get_kakao_jwks_url,
+    get_kakao_oauth_state_enabled,
+    get_kakao_oidc_enabled,
+    get_kakao_redirect_uri,
+    get_kakao_token_url,
+    get_kakao_user_info_url,
+)
+from infrastructure.cache import Cache, TTLLRUCache, encrypted_codec, get_shared_cache_backend
+from infrastructure.fan_out import bounded_fan_out
+from infrastructure.hedging import HedgedRequester
+from infrastructure.http_client import get_http_client
+from infrastructure.jwks import JWKSCache, JWKSUnavailableError
+from infrastructure.jwt import JWTError, base64url_encode, decode_jwt, verify_rs256
+from infrastructure.latency_tracker import LatencyTracker
+from infrastructure.rate_limiter import AsyncTokenBucket, RateLimitExceeded
+from infrastructure.retry import RetryBudget, RetryPolicy
+from infrastructure.server_timing import timing_phase
+from metrics.upstream import UpstreamMetrics
+from kakao_authentication.exceptions import KakaoOAuthConfigurationError
+from kakao_authentication.repository import (
+    InMemoryOAuthStateStore,
+    OAuthStateStoreInterface,
+    StoredOAuthState,
+)
 from kakao_authentication.service.kakao_oauth_service_interface import KakaoOAuthServiceInterface
 from kakao_authentication.schemas.kakao_oauth import (
     KakaoAuthUrlResponse,
     KakaoTokenResponse,
     KakaoUserInfoResponse,
+    KakaoUserProfileResult,
 )
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+logger = logging.getLogger(__name__)
+
+
+def to_user_profile_result(user_id: int, outcome: KakaoUserInfoResponse | Exception) -> KakaoUserProfileResult:
+    """회원번호 1건의 조회 결과(사용자 정보 또는 예외)를 일괄 조회 응답 항목으로 변환한다."""
+    if isinstance(outcome, HTTPException):
+        return KakaoUserProfileResult(user_id=user_id, status_code=outcome.status_code, error=str(outcome.detail))
+    if isinstance(outcome, Exception):
+        return KakaoUserProfileResult(user_id=user_id, status_code=500, error=type(outcome).__name__)
+    return KakaoUserProfileResult.model_construct(user_id=user_id, user_info=outcome, status_code=200, error=None)
+
 
 class KakaoOAuthServiceImpl(KakaoOAuthServiceInterface):
     """Kakao OAuth Service 구현체"""
@@ -17,10 +69,444 @@ class KakaoOAuthServiceImpl(KakaoOAuthServiceInterface):
     KAKAO_AUTH_BASE_URL = "https://kauth.kakao.com/oauth/authorize"
     KAKAO_TOKEN_URL = "https://kauth.kakao.com/oauth/token"
     KAKAO_USER_INFO_URL = "https://kapi.kakao.com/v2/user/me"
-
-    def __init__(self):
+    KAKAO_OIDC_ISSUER = "https://kauth.kakao.com"
+    KAKAO_JWKS_URL = "https://kauth.kakao.com/.well-known/jwks.json"
+
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient | None = None,
+        state_store: OAuthStateStoreInterface | None = None,
+    ):
         self._client_id = get_kakao_client_id()
         self._redirect_uri = get_kakao_redirect_uri()
+        self._fast_response_mode = get_fast_response_mode()
+        # Kakao 엔드포인트는 환경 변수로 재정의할 수 있다. (로컬 대역 서버 부하 테스트용)
+        self._auth_base_url = get_kakao_auth_base_url(self.KAKAO_AUTH_BASE_URL)
+        self._token_url = get_kakao_token_url(self.KAKAO_TOKEN_URL)
+        self._user_info_url = get_kakao_user_info_url(self.KAKAO_USER_INFO_URL)
+        # 주입된 클라이언트가 없으면 애플리케이션 공유 클라이언트(keep-alive 풀)를 사용한다.
+        self._http_client = http_client
+        # 인증 URL 응답은 설정값(client_id, redirect_uri)이 바뀌기 전까지 동일하므로 1회만 생성한다.
+        self._auth_url_response: KakaoAuthUrlResponse | None = None
+        # CACHE_BACKEND=sqlite이면 아래 캐시는 같은 호스트의 워커 프로세스끼리 공유된다.
+        shared_cache = get_shared_cache_backend()
+        # 같은 액세스 토큰의 반복 조회는 upstream 호출 없이 응답한다. (키: 토큰 해시)
+        user_info_cache_ttl = get_float_env("KAKAO_USER_INFO_CACHE_TTL", 60.0)
+        self._user_info_cache: Cache[KakaoUserInfoResponse] = Cache(
+            "kakao_user_info",
+            local=TTLLRUCache(
+                max_entries=get_int_env("KAKAO_USER_INFO_CACHE_MAX_ENTRIES", 10000),
+                max_bytes=get_int_env("KAKAO_USER_INFO_CACHE_MAX_BYTES", 16 * 1024 * 1024),
+                default_ttl=user_info_cache_ttl,
+                sizeof=lambda user_info: 256 + len(user_info.model_dump_json()),
+            ),
+            encode=lambda user_info: user_info.model_dump_json().encode(),
+            decode=KakaoUserInfoResponse.model_validate_json,
+            default_ttl=user_info_cache_ttl,
+            shared=shared_cache,
+        )
+        # 같은 인가 코드의 동시/중복 교환은 한 번만 upstream으로 보내고 결과를 잠시 공유한다.
+        # (워커가 달라도 인가 코드는 한 번만 소모된다)
+        # 교환 결과에는 access/refresh/id 토큰이 들어 있으므로 공유 백엔드에는 CACHE_SECRET_KEY로 암호화해 저장하고,
+        # 키가 없으면 공유하지 않는다. (프로세스 내 중복 제거만 수행)
+        token_exchange_dedup_ttl = get_float_env("KAKAO_TOKEN_EXCHANGE_DEDUP_TTL", 10.0)
+        encode_token, decode_token = (lambda token: token.model_dump_json().encode()), KakaoTokenResponse.model_validate_json
+        token_exchange_shared = shared_cache
+        if shared_cache is not None:
+            cache_secret = get_env("CACHE_SECRET_KEY")
+            if cache_secret:
+                encode_token, decode_token = encrypted_codec(
+                    encode_token, decode_token, cache_secret, "kakao_token_exchange"
+                )
+            else:
+                logger.warning("CACHE_SECRET_KEY가 설정되지 않아 인가 코드 교환 결과를 워커 간에 공유하지 않습니다.")
+                token_exchange_shared = None
+        self._token_exchange_cache: Cache[KakaoTokenResponse] = Cache(
+            "kakao_token_exchange",
+            local=TTLLRUCache(max_entries=1024, max_bytes=4 * 1024 * 1024, default_ttl=token_exchange_dedup_ttl),
+            encode=encode_token,
+            decode=decode_token,
+            default_ttl=token_exchange_dedup_ttl,
+            shared=token_exchange_shared,
+        )
+        # state / PKCE: 인증 요청마다 1회용 state와 code_verifier를 발급하고 콜백에서 한 번만 소비한다.
+        self._state_ttl = get_float_env("KAKAO_OAUTH_STATE_TTL", 600.0)
+        self._state_store = state_store or InMemoryOAuthStateStore(
+            max_ttl=self._state_ttl,
+            max_entries=get_int_env("KAKAO_OAUTH_STATE_MAX_ENTRIES", 100000),
+        )
+        self._state_counters = {"issued": 0, "consumed": 0, "rejected": 0}
+        # 어드민 키 일괄 프로필 조회: 회원번호별 결과를 잠시 기억하고 동시 upstream 호출 수를 제한한다.
+        profile_cache_ttl = get_float_env("KAKAO_PROFILE_CACHE_TTL", 300.0)
+        self._profile_cache: Cache[KakaoUserInfoResponse] = Cache(
+            "kakao_user_profile",
+            local=TTLLRUCache(
+                max_entries=get_int_env("KAKAO_PROFILE_CACHE_MAX_ENTRIES", 10000),
+                max_bytes=get_int_env("KAKAO_PROFILE_CACHE_MAX_BYTES", 16 * 1024 * 1024),
+                default_ttl=profile_cache_ttl,
+                sizeof=lambda user_info: 256 + len(user_info.model_dump_json()),
+            ),
+            encode=lambda user_info: user_info.model_dump_json().encode(),
+            decode=KakaoUserInfoResponse.model_validate_json,
+            default_ttl=profile_cache_ttl,
+            shared=shared_cache,
+        )
+        self._bulk_profile_concurrency = get_int_env("KAKAO_BULK_PROFILE_CONCURRENCY", 16)
+        # 엔드포인트별 관측 지연으로 적응형 타임아웃과 hedging 지연을 계산한다.
+        self._token_latency = LatencyTracker()
+        self._user_info_latency = LatencyTracker()
+        self._profile_latency = LatencyTracker()
+        # 클라이언트 측 속도 제한 (Kakao 429 방지 및 부하 차단, opt-in)
+        self._rate_limit_enabled = get_bool_env("KAKAO_RATE_LIMIT_ENABLED", False)
+        self._rate_limiters = self._build_rate_limiters()
+        # 일시적 실패(5xx, 연결 오류)에 대한 재시도는 멱등 호출에만 적용하며 전역 예산으로 제한한다.
+        self._retry_policy = RetryPolicy.from_env()
+        self._retry_budget = RetryBudget.from_env()
+        self._token_metrics = UpstreamMetrics("token")
+        self._user_info_metrics = UpstreamMetrics("user_info")
+        self._profile_metrics = UpstreamMetrics("user_profile")
+        self._adaptive_timeout_enabled = get_bool_env("KAKAO_ADAPTIVE_TIMEOUT_ENABLED", False)
+        self._adaptive_timeout_multiplier = get_float_env("KAKAO_ADAPTIVE_TIMEOUT_MULTIPLIER", 3.0)
+        self._adaptive_timeout_floor = get_float_env("KAKAO_ADAPTIVE_TIMEOUT_FLOOR", 0.5)
+        # 사용자 정보 조회(GET)는 멱등이므로 느린 응답에 대해 hedging 요청을 보낼 수 있다. (opt-in)
+        self._user_info_hedging_enabled = get_bool_env("KAKAO_USER_INFO_HEDGING_ENABLED", False)
+        self._user_info_hedger = HedgedRequester(
+            self._user_info_latency,
+            percentile=get_float_env("KAKAO_HEDGE_PERCENTILE", 0.95),
+            min_delay=get_float_env("KAKAO_HEDGE_MIN_DELAY", 0.02),
+            max_delay=get_float_env("KAKAO_HEDGE_MAX_DELAY", 1.0),
+            initial_delay=get_float_env("KAKAO_HEDGE_INITIAL_DELAY", 0.2),
+        )
+        # OIDC 모드: openid scope로 받은 id_token을 로컬에서 검증해 사용자 정보 조회(/v2/user/me)를 생략한다.
+        self._oidc_enabled = get_kakao_oidc_enabled()
+        self._oidc_issuer = get_env("KAKAO_OIDC_ISSUER") or self.KAKAO_OIDC_ISSUER
+        self._jwks_url = get_kakao_jwks_url(self.KAKAO_JWKS_URL)
+        self._id_token_leeway = get_float_env("KAKAO_ID_TOKEN_LEEWAY", 60.0)
+        self._jwks = JWKSCache(
+            self._fetch_jwks,
+            refresh_interval=get_float_env("KAKAO_JWKS_REFRESH_INTERVAL", 3600.0),
+            min_refresh_interval=get_float_env("KAKAO_JWKS_MIN_REFRESH_INTERVAL", 30.0),
+        )
+        # start() ~ stop() 사이에만 OIDC 설정 변경에 따라 JWKS 갱신 작업을 켜고 끈다.
+        self._started = False
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        return self._http_client or get_http_client()
+
+    @staticmethod
+    def _build_rate_limiters() -> dict[str, AsyncTokenBucket]:
+        """
+        호출 종류별 토큰 버킷을 만든다.
+
+        - login: 사용자 로그인 경로(인가 코드 교환, 사용자 정보 조회)
+        - background: 토큰 선제 갱신
+        - admin: 어드민 키 일괄 프로필 조회
+        버킷은 프로세스마다 따로 있으므로 기본 속도는 앱 전체 한도를 워커 수로 나눈 값이다.
+        background / admin은 별도 버킷이라 로그인 경로의 토큰을 소모하지 않는다.
+        """
+        app_quota = get_float_env("KAKAO_RATE_LIMIT_APP_QUOTA_RPS", 100.0)
+        workers = max(1, get_int_env("KAKAO_RATE_LIMIT_WORKERS", 1))
+        rate = get_float_env("KAKAO_RATE_LIMIT_RPS", app_quota / workers)
+        max_queue = get_int_env("KAKAO_RATE_LIMIT_MAX_QUEUE", 500)
+        max_wait = get_float_env("KAKAO_RATE_LIMIT_MAX_WAIT", 2.0)
+
+        limiters = {
+            "login": AsyncTokenBucket(
+                "login",
+                rate=rate,
+                burst=get_int_env("KAKAO_RATE_LIMIT_BURST", 50),
+                max_queue=max_queue,
+                max_wait=max_wait,
+            )
+        }
+        for name in ("background", "admin"):
+            limited_rate = get_float_env(f"KAKAO_RATE_LIMIT_{name.upper()}_RPS", rate * 0.1)
+            limiters[name] = AsyncTokenBucket(
+                name,
+                rate=limited_rate,
+                burst=max(1, int(limited_rate)),
+                max_queue=max_queue,
+                max_wait=max_wait,
+            )
+        return limiters
+
+    @property
+    def oidc_enabled(self) -> bool:
+        return self._oidc_enabled
+
+    def start(self) -> None:
+        """백그라운드 작업(OIDC 모드의 JWKS 갱신)을 시작한다."""
+        self._started = True
+        if self._oidc_enabled:
+            self._jwks.start()
+
+    async def stop(self) -> None:
+        """백그라운드 작업을 중지하고 state 저장소를 닫는다."""
+        self._started = False
+        await self._jwks.stop()
+        await self._state_store.close()
+
+    def validate_config(self) -> None:
+        """
+        필수 설정값 검증 (애플리케이션 시작 시 1회 호출)
+
+        Raises:
+            KakaoOAuthConfigurationError: 필수 환경 변수가 설정되지 않은 경우
+        """
+        if not self._client_id:
+            raise KakaoOAuthConfigurationError("KAKAO_CLIENT_ID 환경 변수가 설정되지 않았습니다.")
+
+        if not self._redirect_uri:
+            raise KakaoOAuthConfigurationError("KAKAO_REDIRECT_URI 환경 변수가 설정되지 않았습니다.")
+
+    def reload_config(self) -> bool:
+        """
+        설정 스냅샷에서 client_id / redirect_uri, Kakao 엔드포인트 URL 및 OIDC 설정을 다시 읽는다.
+
+        Returns:
+            bool: 설정값이 변경되어 캐시가 무효화되었는지 여부
+        """
+        # 응답 생성 방식은 캐시 내용과 무관하므로 항상 반영한다.
+        self._fast_response_mode = get_fast_response_mode()
+
+        config = (
+            get_kakao_client_id(),
+            get_kakao_redirect_uri(),
+            get_kakao_auth_base_url(self.KAKAO_AUTH_BASE_URL),
+            get_kakao_token_url(self.KAKAO_TOKEN_URL),
+            get_kakao_user_info_url(self.KAKAO_USER_INFO_URL),
+            get_kakao_jwks_url(self.KAKAO_JWKS_URL),
+            get_kakao_oidc_enabled(),
+        )
+        current = (
+            self._client_id,
+            self._redirect_uri,
+            self._auth_base_url,
+            self._token_url,
+            self._user_info_url,
+            self._jwks_url,
+            self._oidc_enabled,
+        )
+
+        if config == current:
+            return False
+
+        (
+            self._client_id,
+            self._redirect_uri,
+            self._auth_base_url,
+            self._token_url,
+            self._user_info_url,
+            self._jwks_url,
+            self._oidc_enabled,
+        ) = config
+        if self._jwks_url != current[5]:
+            self._jwks.clear()
+        # 실행 중이면 OIDC 모드 전환에 맞춰 JWKS 갱신 작업을 시작/중지한다.
+        if self._started:
+            if self._oidc_enabled:
+                self._jwks.start()
+            else:
+                self._jwks.cancel()
+        self._auth_url_response = None
+        self._user_info_cache.clear_local()
+        self._profile_cache.clear_local()
+        return True
+
+    def get_stats(self, group: str) -> dict:
+        get_group_stats = {
+            "cache": self.get_cache_stats,
+            "upstream": self.get_upstream_stats,
+            "endpoints": self.get_endpoint_stats,
+            "rate_limiters": self.get_rate_limiter_stats,
+            "retry_budget": self.get_retry_budget_stats,
+            "jwks": self.get_jwks_stats,
+            "oauth_state": self.get_oauth_state_stats,
+        }.get(group)
+        return get_group_stats() if get_group_stats is not None else {}
+
+    def get_upstream_stats(self) -> dict:
+        """upstream 엔드포인트별 관측 지연, 적응형 타임아웃, hedging 통계와 요청 제어 상태를 반환한다."""
+        return {
+            **self.get_endpoint_stats(),
+            "default_read_timeout": self._get_http_client().timeout.read,
+            "rate_limiter": {"enabled": self._rate_limit_enabled, **self.get_rate_limiter_stats()},
+            "retry_budget": self.get_retry_budget_stats(),
+            "jwks": self.get_jwks_stats(),
+        }
+
+    def get_endpoint_stats(self) -> dict:
+        """upstream 엔드포인트별 관측 지연, 적응형 타임아웃, hedging 통계를 반환한다."""
+        return {
+            "token": {
+                **self._token_latency.stats(),
+                "timeout": self._request_timeout(self._token_latency).read,
+            },
+            "user_info": {
+                **self._user_info_latency.stats(),
+                "timeout": self._request_timeout(self._user_info_latency).read,
+                "hedging_enabled": self._user_info_hedging_enabled,
+                **self._user_info_hedger.stats(),
+            },
+            "user_profile": {
+                **self._profile_latency.stats(),
+                "timeout": self._request_timeout(self._profile_latency).read,
+                "concurrency": self._bulk_profile_concurrency,
+            },
+        }
+
+    def get_rate_limiter_stats(self) -> dict:
+        """요청 종류(login/background/admin)별 rate limiter 통계를 반환한다."""
+        return {name: limiter.stats() for name, limiter in self._rate_limiters.items()}
+
+    def get_retry_budget_stats(self) -> dict:
+        return self._retry_budget.stats()
+
+    def get_jwks_stats(self) -> dict:
+        return {"oidc_enabled": self._oidc_enabled, **self._jwks.stats()}
+
+    def _request_timeout(self, tracker: LatencyTracker) -> httpx.Timeout:
+        """적응형 타임아웃이 켜져 있으면 관측 지연으로 read 타임아웃을 줄인다."""
+        timeout = self._get_http_client().timeout
+        if not self._adaptive_timeout_enabled or timeout.read is None:
+            return timeout
+
+        read = tracker.adaptive_timeout(
+            default=timeout.read,
+            multiplier=self._adaptive_timeout_multiplier,
+            floor=self._adaptive_timeout_floor,
+        )
+        return httpx.Timeout(connect=timeout.connect, read=read, write=timeout.write, pool=timeout.pool)
+
+    async def _send(
+        self,
+        tracker: LatencyTracker,
+        metrics: UpstreamMetrics,
+        method: str,
+        url: str,
+        idempotent: bool = False,
+        limiter: str = "login",
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        upstream 요청을 보내고 지연을 기록한다.
+
+        - 멱등 호출(idempotent=True)은 5xx / 연결 오류 / 타임아웃 시 재시도 정책과 전역 예산에 따라 재시도한다.
+        - 속도 제한이 켜져 있으면 limiter 이름의 토큰 버킷을 거치며,
+          대기열이 가득 차면 upstream 호출 없이 503(Retry-After)으로 응답한다.
+        - Kakao가 429를 반환하면 토큰 버킷을 비우고 503(Retry-After)으로 변환한다.
+        - 타임아웃은 504, 연결 오류는 502로 변환한다.
+        """
+        self._retry_budget.record_request()
+        rate_limiter = self._rate_limiters[limiter]
+        attempt = 0
+
+        while True:
+            attempt += 1
+            can_retry = idempotent and attempt < self._retry_policy.max_attempts
+            try:
+                response = await self._send_once(tracker, metrics, rate_limiter, method, url, **kwargs)
+            except httpx.TransportError as e:
+                if can_retry and self._try_spend_retry(metrics):
+                    await asyncio.sleep(self._retry_policy.backoff(attempt))
+                    continue
+                if isinstance(e, httpx.TimeoutException):
+                    raise HTTPException(
+                        status_code=504,
+                        detail="Kakao 서버 응답 시간이 초과되었습니다."
+                    )
+                raise HTTPException(
+                    status_code=502,
+                    detail="Kakao 서버에 연결할 수 없습니다."
+                )
+
+            if response.status_code in self._retry_policy.retry_on_status and can_retry:
+                if self._try_spend_retry(metrics):
+                    await response.aclose()
+                    await asyncio.sleep(self._retry_policy.backoff(attempt))
+                    continue
+
+            break
+
+        if response.status_code == 429:
+            # 앱 단위 한도는 모든 호출 종류가 공유하므로 모든 버킷을 비운다.
+            for bucket in self._rate_limiters.values():
+                bucket.drain()
+            raise HTTPException(
+                status_code=503,
+                detail="Kakao API 요청 한도를 초과했습니다. 잠시 후 다시 시도해 주세요.",
+                headers={"Retry-After": response.headers.get("Retry-After", "1")},
+            )
+        return response
+
+    def _try_spend_retry(self, metrics: UpstreamMetrics) -> bool:
+        if self._retry_budget.try_spend():
+            metrics.retries.inc()
+            return True
+        metrics.retry_budget_exhausted.inc()
+        return False
+
+    async def _send_once(
+        self,
+        tracker: LatencyTracker,
+        metrics: UpstreamMetrics,
+        rate_limiter: AsyncTokenBucket,
+        method: str,
+        url: str,
+        **kwargs,
+    ) -> httpx.Response:
+        """속도 제한을 거쳐 upstream 요청 1회를 보내고 지연을 기록한다."""
+        if self._rate_limit_enabled:
+            try:
+                await rate_limiter.acquire()
+            except RateLimitExceeded as e:
+                raise HTTPException(
+                    status_code=503,
+                    detail="Kakao 로그인 요청이 많아 잠시 후 다시 시도해 주세요.",
+                    headers={"Retry-After": e.retry_after_header},
+                )
+
+        metrics.attempts.inc()
+        timeout = self._request_timeout(tracker)
+        started = time.perf_counter()
+        try:
+            response = await self._get_http_client().request(method, url, timeout=timeout, **kwargs)
+        except httpx.PoolTimeout:
+            # 로컬 커넥션 풀 대기 시간 초과는 upstream 지연과 무관하므로 지연 표본에 넣지 않는다.
+            metrics.observe_timeout(time.perf_counter() - started)
+            raise
+        except httpx.TimeoutException:
+            elapsed = time.perf_counter() - started
+            # 타임아웃도 표본으로 기록해야 적응형 타임아웃이 느려진 upstream에 맞춰 다시 늘어난다.
+            tracker.record_timeout(max(elapsed, timeout.read or 0.0))
+            metrics.observe_timeout(elapsed)
+            raise
+        except httpx.HTTPError:
+            metrics.observe_error(time.perf_counter() - started)
+            raise
+        elapsed = time.perf_counter() - started
+        tracker.record(elapsed)
+        metrics.observe(response.status_code, elapsed)
+        return response
+
+    def get_cache_stats(self) -> dict:
+        """Service 내부 캐시 통계를 반환한다."""
+        return {
+            "user_info": self._user_info_cache.stats(),
+            "token_exchange": self._token_exchange_cache.stats(),
+            "user_profile": self._profile_cache.stats(),
+        }
+
+    def get_upstream_urls(self) -> list[str]:
+        """서버에서 호출하는 Kakao 엔드포인트 URL (커넥션 사전 준비 대상)"""
+        urls = [self._token_url, self._user_info_url]
+        if self._oidc_enabled:
+            urls.append(self._jwks_url)
+        return urls
+
+    def get_oauth_state_stats(self) -> dict:
+        """state 저장소(보관 중인 state 수 등)와 발급/소비/거절 횟수를 반환한다."""
+        return {**self._state_store.stats(), **self._state_counters}
 
     def generate_auth_url(self) -> KakaoAuthUrlResponse:
         """
@@ -32,6 +518,9 @@ class KakaoOAuthServiceImpl(KakaoOAuthServiceInterface):
         Raises:
             HTTPException: 필수 환경 변수가 설정되지 않은 경우
         """
+        if self._auth_url_response is not None:
+            return self._auth_url_response
+
         if not self._client_id:
             raise HTTPException(
                 status_code=500,
@@ -49,22 +538,103 @@ class KakaoOAuthServiceImpl(KakaoOAuthServiceInterface):
             "redirect_uri": self._redirect_uri,
             "response_type": "code",
         }
+        if self._oidc_enabled:
+            params["scope"] = "openid"
 
-        auth_url = f"{self.KAKAO_AUTH_BASE_URL}?{urlencode(params)}"
+        auth_url = f"{self._auth_base_url}?{urlencode(params)}"
 
-        return KakaoAuthUrlResponse(
+        self._auth_url_response = KakaoAuthUrlResponse(
             auth_url=auth_url,
             client_id=self._client_id,
             redirect_uri=self._redirect_uri,
             response_type="code",
         )
+        return self._auth_url_response
+
+    async def create_authorization_request(self) -> KakaoAuthUrlResponse:
+        """
+        state / PKCE(S256)가 포함된 1회용 Kakao 인증 URL 생성
+
+        설정값으로 만든 공통 URL(generate_auth_url)은 재사용하고, 요청마다 state와 code_challenge
+        (OIDC 모드에서는 nonce)만 덧붙인다. 검증 정보는 KAKAO_OAUTH_STATE_TTL 동안 보관된다.
+
+        Returns:
+            KakaoAuthUrlResponse: 인증 URL 및 관련 정보
+
+        Raises:
+            HTTPException: 필수 환경 변수가 설정되지 않은 경우
+        """
+        base = self.generate_auth_url()
+        state = secrets.token_urlsafe(32)
+        code_verifier = secrets.token_urlsafe(48)
+        nonce = secrets.token_urlsafe(16) if self._oidc_enabled else None
+        await self._state_store.save(state, StoredOAuthState(code_verifier, nonce, time.time()), self._state_ttl)
+        self._state_counters["issued"] += 1
+
+        params = {
+            "state": state,
+            "code_challenge": base64url_encode(hashlib.sha256(code_verifier.encode()).digest()),
+            "code_challenge_method": "S256",
+        }
+        if nonce is not None:
+            params["nonce"] = nonce
+
+        return KakaoAuthUrlResponse.model_construct(
+            auth_url=f"{base.auth_url}&{urlencode(params)}",
+            client_id=base.client_id,
+            redirect_uri=base.redirect_uri,
+            response_type=base.response_type,
+        )
+
+    async def _consume_state(self, state: str | None) -> StoredOAuthState:
+        if not state:
+            self._state_counters["rejected"] += 1
+            raise HTTPException(
+                status_code=400,
+                detail="state가 제공되지 않았습니다."
+            )
 
-    async def request_access_token(self, code: str) -> KakaoTokenResponse:
+        record = await self._state_store.consume(state)
+        if record is None:
+            self._state_counters["rejected"] += 1
+            raise HTTPException(
+                status_code=400,
+                detail="유효하지 않거나 만료된 state입니다."
+            )
+
+        self._state_counters["consumed"] += 1
+        return record
+
+    def _check_nonce(self, token: KakaoTokenResponse, nonce: str | None) -> None:
+        """id_token의 nonce가 인증 요청 때 발급한 값과 같은지 확인한다. (서명은 verify_id_token에서 검증한다)"""
+        if nonce is None or not token.id_token:
+            return
+        try:
+            claims = decode_jwt(token.id_token).claims
+        except JWTError as e:
+            raise HTTPException(
+                status_code=401,
+                detail=f"ID 토큰이 유효하지 않습니다: {e}"
+            )
+        if claims.get("nonce") != nonce:
+            raise HTTPException(
+                status_code=401,
+                detail="ID 토큰의 nonce가 인증 요청과 일치하지 않습니다."
+            )
+
+    async def request_access_token(self, code: str, state: str | None = None) -> KakaoTokenResponse:
         """
         인가 코드로 액세스 토큰 요청
 
+        같은 인가 코드로 동시에 들어온 요청(더블 클릭, 브라우저 재시도)은 하나의 upstream 교환을 공유하며,
+        완료된 결과는 잠시 보관되어 뒤늦은 중복 요청에도 그대로 반환된다.
+        KAKAO_OAUTH_STATE_ENABLED이면 state를 소비해 인증 요청과 대조하고 PKCE code_verifier로 교환한다.
+        이때 중복 제거 키는 (state, code)이며 state 소비도 공유되는 교환 안에서 한 번만 일어나므로,
+        중복 콜백은 같은 결과를 받고 다른 state로 같은 코드를 재사용하는 요청은 400으로 거절된다.
+
         Args:
             code: Kakao 인증 후 발급된 인가 코드
+            state: 인증 요청 때 발급한 state (state 검증을 사용할 때만 필요)
 
         Returns:
             KakaoTokenResponse: 액세스 토큰 및 관련 정보
@@ -90,44 +660,134 @@ class KakaoOAuthServiceImpl(KakaoOAuthServiceInterface):
                 detail="인가 코드(code)가 제공되지 않았습니다."
             )
 
+        if get_kakao_oauth_state_enabled():
+            with timing_phase("token"):
+                return await self._token_exchange_cache.get_or_compute(
+                    hashlib.sha256(f"{state or ''}:{code}".encode()).hexdigest(),
+                    lambda: self._exchange_code_with_state(code, state),
+                )
+
+        with timing_phase("token"):
+            return await self._token_exchange_cache.get_or_compute(
+                hashlib.sha256(code.encode()).hexdigest(),
+                lambda: self._exchange_code(code),
+            )
+
+    async def _exchange_code_with_state(self, code: str, state: str | None) -> KakaoTokenResponse:
+        """state를 소비하고 PKCE code_verifier로 인가 코드를 교환한 뒤 id_token의 nonce를 확인한다."""
+        verification = await self._consume_state(state)
+        token = await self._exchange_code(code, verification.code_verifier)
+        self._check_nonce(token, verification.nonce)
+        return token
+
+    async def _exchange_code(self, code: str, code_verifier: str | None = None) -> KakaoTokenResponse:
         data = {
             "grant_type": "authorization_code",
             "client_id": self._client_id,
             "redirect_uri": self._redirect_uri,
             "code": code,
         }
+        if code_verifier is not None:
+            data["code_verifier"] = code_verifier
+
+        token_data = await self._post_token_request(data)
+
+        return self._to_token_response(token_data)
+
+    async def refresh_access_token(self, refresh_token: str) -> KakaoTokenResponse:
+        """
+        리프레시 토큰으로 액세스 토큰 갱신
+
+        Kakao는 리프레시 토큰의 남은 유효 기간이 짧을 때만 새 리프레시 토큰을 함께 발급한다.
+        새 리프레시 토큰이 없으면 refresh_token / refresh_token_expires_in은 None으로 반환된다.
+
+        Args:
+            refresh_token: Kakao 리프레시 토큰
+
+        Returns:
+            KakaoTokenResponse: 갱신된 액세스 토큰 및 관련 정보
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.KAKAO_TOKEN_URL,
-                data=data,
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
+        Raises:
+            HTTPException: 토큰 갱신 실패 시
+        """
+        if not self._client_id:
+            raise HTTPException(
+                status_code=500,
+                detail="KAKAO_CLIENT_ID 환경 변수가 설정되지 않았습니다."
             )
 
-            if response.status_code != 200:
-                error_data = response.json()
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"토큰 요청 실패: {error_data.get('error_description', error_data.get('error', '알 수 없는 오류'))}"
-                )
+        if not refresh_token:
+            raise HTTPException(
+                status_code=400,
+                detail="리프레시 토큰이 제공되지 않았습니다."
+            )
+
+        data = {
+            "grant_type": "refresh_token",
+            "client_id": self._client_id,
+            "refresh_token": refresh_token,
+        }
+
+        # 리프레시 토큰 교환은 재시도해도 안전하다. (인가 코드 교환은 코드가 소모되므로 재시도하지 않는다)
+        # 선제 갱신 작업이 호출하므로 로그인 경로와 분리된 background 버킷을 사용한다.
+        token_data = await self._post_token_request(data, idempotent=True, limiter="background")
 
-            token_data = response.json()
+        return self._to_token_response(token_data)
 
-        return KakaoTokenResponse(
+    def _to_token_response(self, token_data: dict) -> KakaoTokenResponse:
+        """토큰 엔드포인트 응답을 KakaoTokenResponse로 변환한다."""
+        return self._build_response(
+            KakaoTokenResponse,
             access_token=token_data["access_token"],
             token_type=token_data["token_type"],
             refresh_token=token_data.get("refresh_token"),
             expires_in=token_data["expires_in"],
             refresh_token_expires_in=token_data.get("refresh_token_expires_in"),
             scope=token_data.get("scope"),
+            id_token=token_data.get("id_token"),
         )
 
-    async def get_user_info(self, access_token: str) -> KakaoUserInfoResponse:
+    def _build_response(self, model: type[ModelT], **fields) -> ModelT:
+        """
+        응답 모델 생성
+
+        빠른 응답 모드에서는 신뢰할 수 있는 upstream 데이터로 검증 없이(model_construct) 생성한다.
+        """
+        if self._fast_response_mode:
+            return model.model_construct(**fields)
+        return model(**fields)
+
+    async def _post_token_request(self, data: dict, idempotent: bool = False, limiter: str = "login") -> dict:
+        """토큰 엔드포인트 호출 (authorization_code / refresh_token 공통)"""
+        response = await self._send(
+            self._token_latency,
+            self._token_metrics,
+            "POST",
+            self._token_url,
+            idempotent=idempotent,
+            limiter=limiter,
+            data=data,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+
+        if response.status_code != 200:
+            error_data = response.json()
+            raise HTTPException(
+                status_code=response.status_code,
+                detail=f"토큰 요청 실패: {error_data.get('error_description', error_data.get('error', '알 수 없는 오류'))}"
+            )
+
+        return response.json()
+
+    async def get_user_info(self, access_token: str, expires_in: int | None = None) -> KakaoUserInfoResponse:
         """
         액세스 토큰으로 사용자 정보 조회
 
+        같은 토큰으로 조회한 결과는 캐시되며, 캐시 항목은 토큰 만료(expires_in) 이전에 만료된다.
+
         Args:
             access_token: 유효한 Kakao 액세스 토큰
+            expires_in: 액세스 토큰의 남은 유효 시간(초). 없으면 기본 캐시 TTL만 적용된다.
 
         Returns:
             KakaoUserInfoResponse: 사용자 정보
@@ -141,31 +801,199 @@ class KakaoOAuthServiceImpl(KakaoOAuthServiceInterface):
                 detail="액세스 토큰이 제공되지 않았습니다."
             )
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                self.KAKAO_USER_INFO_URL,
+        with timing_phase("userinfo"):
+            return await self._get_user_info(access_token, expires_in)
+
+    async def _get_user_info(self, access_token: str, expires_in: int | None) -> KakaoUserInfoResponse:
+        return await self._user_info_cache.get_or_compute(
+            hashlib.sha256(access_token.encode()).hexdigest(),
+            lambda: self._fetch_user_info(access_token),
+            ttl=expires_in,
+        )
+
+    async def _fetch_user_info(self, access_token: str) -> KakaoUserInfoResponse:
+        def fetch() -> Awaitable[httpx.Response]:
+            return self._send(
+                self._user_info_latency,
+                self._user_info_metrics,
+                "GET",
+                self._user_info_url,
+                idempotent=True,
                 headers={"Authorization": f"Bearer {access_token}"},
             )
 
-            if response.status_code != 200:
-                if response.status_code == 401:
-                    raise HTTPException(
-                        status_code=401,
-                        detail="액세스 토큰이 유효하지 않거나 만료되었습니다."
-                    )
+        if self._user_info_hedging_enabled:
+            response = await self._user_info_hedger.run(fetch)
+        else:
+            response = await fetch()
+
+        if response.status_code != 200:
+            if response.status_code == 401:
                 raise HTTPException(
-                    status_code=response.status_code,
-                    detail="사용자 정보 조회에 실패했습니다."
+                    status_code=401,
+                    detail="액세스 토큰이 유효하지 않거나 만료되었습니다."
                 )
+            raise HTTPException(
+                status_code=response.status_code,
+                detail="사용자 정보 조회에 실패했습니다."
+            )
 
-            user_data = response.json()
+        return self._to_user_info_response(response.json())
 
+    def _to_user_info_response(self, user_data: dict) -> KakaoUserInfoResponse:
+        """사용자 정보 API 응답을 KakaoUserInfoResponse로 변환한다."""
         kakao_account = user_data.get("kakao_account", {})
         profile = kakao_account.get("profile", {})
 
-        return KakaoUserInfoResponse(
+        return self._build_response(
+            KakaoUserInfoResponse,
             id=user_data["id"],
             nickname=profile.get("nickname"),
             email=kakao_account.get("email"),
             profile_image_url=profile.get("profile_image_url"),
         )
+
+    def _require_admin_key(self) -> str:
+        admin_key = get_env("KAKAO_ADMIN_KEY")
+        if not admin_key:
+            raise HTTPException(
+                status_code=500,
+                detail="KAKAO_ADMIN_KEY 환경 변수가 설정되지 않았습니다."
+            )
+        return admin_key
+
+    async def get_user_profile(self, user_id: int) -> KakaoUserInfoResponse:
+        """
+        어드민 키로 회원번호의 사용자 정보 조회
+
+        결과는 KAKAO_PROFILE_CACHE_TTL 동안 캐시되며, 같은 회원번호의 동시 조회는 한 번만 upstream으로 보낸다.
+
+        Args:
+            user_id: Kakao 회원번호
+
+        Returns:
+            KakaoUserInfoResponse: 사용자 정보
+
+        Raises:
+            HTTPException: 어드민 키가 설정되지 않았거나 조회 실패 시
+        """
+        return await self._get_user_profile(self._require_admin_key(), user_id)
+
+    def resolve_user_profiles(self, user_ids: list[int]) -> AsyncIterator[KakaoUserProfileResult]:
+        """
+        어드민 키로 여러 회원번호의 사용자 정보를 동시에 조회하고, 끝나는 순서대로 결과를 내보낸다.
+
+        동시 upstream 호출은 KAKAO_BULK_PROFILE_CONCURRENCY개로 제한되며 공유 HTTP 클라이언트(keep-alive 풀)를 사용한다.
+        중복된 회원번호는 한 번만 조회하고, 실패한 항목은 상태 코드와 사유를 담은 결과로 내보낸다.
+
+        Raises:
+            HTTPException: 어드민 키가 설정되지 않은 경우 (스트림 시작 전에 확인한다)
+        """
+        admin_key = self._require_admin_key()
+        return self._resolve_user_profiles(admin_key, list(dict.fromkeys(user_ids)))
+
+    async def _resolve_user_profiles(self, admin_key: str, user_ids: list[int]) -> AsyncIterator[KakaoUserProfileResult]:
+        async for user_id, outcome in bounded_fan_out(
+            user_ids,
+            lambda user_id: self._get_user_profile(admin_key, user_id),
+            self._bulk_profile_concurrency,
+        ):
+            yield to_user_profile_result(user_id, outcome)
+
+    async def _get_user_profile(self, admin_key: str, user_id: int) -> KakaoUserInfoResponse:
+        return await self._profile_cache.get_or_compute(
+            str(user_id),
+            lambda: self._fetch_user_profile(admin_key, user_id),
+        )
+
+    async def _fetch_user_profile(self, admin_key: str, user_id: int) -> KakaoUserInfoResponse:
+        response = await self._send(
+            self._profile_latency,
+            self._profile_metrics,
+            "GET",
+            self._user_info_url,
+            idempotent=True,
+            limiter="admin",
+            params={"target_id_type": "user_id", "target_id": str(user_id)},
+            headers={"Authorization": f"KakaoAK {admin_key}"},
+        )
+
+        if response.status_code != 200:
+            raise HTTPException(
+                status_code=response.status_code,
+                detail="사용자 정보 조회에 실패했습니다."
+            )
+
+        return self._to_user_info_response(response.json())
+
+    async def _fetch_jwks(self) -> dict:
+        response = await self._get_http_client().get(self._jwks_url)
+        response.raise_for_status()
+        return response.json()
+
+    async def verify_id_token(self, id_token: str) -> KakaoUserInfoResponse:
+        """
+        OIDC id_token을 로컬에서 검증하고 사용자 정보를 만든다.
+
+        서명(RS256, 캐시된 JWKS)과 iss / aud / exp 클레임을 확인하며 Kakao API를 호출하지 않는다.
+        (JWKS가 아직 없거나 키가 교체된 경우에만 공개키를 가져온다)
+
+        Args:
+            id_token: 토큰 응답에 포함된 ID 토큰
+
+        Returns:
+            KakaoUserInfoResponse: 사용자 정보 (회원번호, 닉네임, 이메일, 프로필 이미지)
+
+        Raises:
+            HTTPException: ID 토큰이 유효하지 않은 경우 (401), 공개키를 가져올 수 없는 경우 (502)
+        """
+        with timing_phase("id_token"):
+            try:
+                claims = await self._verify_id_token(id_token)
+            except JWKSUnavailableError:
+                raise HTTPException(
+                    status_code=502,
+                    detail="Kakao 공개키(JWKS)를 가져올 수 없습니다."
+                )
+            except JWTError as e:
+                raise HTTPException(
+                    status_code=401,
+                    detail=f"ID 토큰이 유효하지 않습니다: {e}"
+                )
+
+        return self._build_response(
+            KakaoUserInfoResponse,
+            id=int(claims["sub"]),
+            nickname=claims.get("nickname"),
+            email=claims.get("email"),
+            profile_image_url=claims.get("picture"),
+        )
+
+    async def _verify_id_token(self, id_token: str) -> dict:
+        token = decode_jwt(id_token)
+        if token.header.get("alg") != "RS256":
+            raise JWTError(f"지원하지 않는 서명 알고리즘입니다: {token.header.get('alg')}")
+
+        key = await self._jwks.get_key(token.header.get("kid"))
+        if not verify_rs256(token.signing_input, token.signature, key):
+            raise JWTError("서명이 일치하지 않습니다.")
+
+        claims = token.claims
+        now = time.time()
+        if claims.get("iss") != self._oidc_issuer:
+            raise JWTError("발급자(iss)가 일치하지 않습니다.")
+
+        audience = claims.get("aud")
+        if audience != self._client_id and not (isinstance(audience, list) and self._client_id in audience):
+            raise JWTError("대상(aud)이 일치하지 않습니다.")
+
+        if not isinstance(claims.get("exp"), (int, float)) or claims["exp"] + self._id_token_leeway <= now:
+            raise JWTError("만료된 토큰입니다.")
+
+        if isinstance(claims.get("iat"), (int, float)) and claims["iat"] - self._id_token_leeway > now:
+            raise JWTError("발급 시각(iat)이 올바르지 않습니다.")
+
+        if not str(claims.get("sub", "")).isdigit():
+            raise JWTError("회원번호(sub)가 올바르지 않습니다.")
+
+        return claims
@@ -1,25 +1,94 @@
 from abc import ABC, abstractmethod
+from typing import AsyncIterator, NoReturn
+
+from fastapi import HTTPException
+
 from kakao_authentication.schemas.kakao_oauth import (
     KakaoAuthUrlResponse,
     KakaoTokenResponse,
     KakaoUserInfoResponse,
+    KakaoUserProfileResult,
 )
 
 
+def _not_supported(feature: str) -> NoReturn:
+    raise HTTPException(status_code=501, detail=f"이 Service 구현체는 {feature}을(를) 지원하지 않습니다.")
+
+
 class KakaoOAuthServiceInterface(ABC):
-    """Kakao OAuth Service Interface"""
+    """
+    Kakao OAuth Service Interface
+
+    인증 URL 생성, 토큰 교환, 사용자 정보 조회만 필수이며 나머지(state / PKCE, 토큰 갱신, OIDC, 어드민 조회)는
+    선택 기능이다. 구현하지 않은 선택 기능은 501(Not Implemented)로 거절된다.
+    수명 주기(validate_config/start/stop/reload_config)와 통계(get_stats) 메서드는 컨테이너가 구현체 종류와
+    관계없이 호출하며, 기본 동작은 아무 일도 하지 않는다.
+    """
+
+    def validate_config(self) -> None:
+        """필수 설정값 검증 (애플리케이션 시작 시 1회 호출)"""
+        pass
+
+    def start(self) -> None:
+        """백그라운드 작업 시작"""
+        pass
+
+    async def stop(self) -> None:
+        """백그라운드 작업 중지 및 자원 정리"""
+        pass
+
+    def reload_config(self) -> bool:
+        """설정값을 다시 읽고, 변경으로 내부 캐시가 무효화되었는지 반환"""
+        return False
+
+    def get_upstream_urls(self) -> list[str]:
+        """서버에서 호출하는 Kakao 엔드포인트 URL (커넥션 사전 준비 대상)"""
+        return []
+
+    def get_stats(self, group: str) -> dict:
+        """
+        통계 그룹을 반환한다. 제공하지 않는 그룹은 빈 dict를 반환한다.
+
+        그룹: cache, upstream, endpoints, rate_limiters, retry_budget, jwks, oauth_state, executor
+        """
+        return {}
+
+    @property
+    def oidc_enabled(self) -> bool:
+        """콜백에서 id_token으로 사용자를 확인할지 여부 (verify_id_token을 지원하는 구현체만 True)"""
+        return False
 
     @abstractmethod
     def generate_auth_url(self) -> KakaoAuthUrlResponse:
         """Kakao 인증 URL 생성"""
         pass
 
+    async def create_authorization_request(self) -> KakaoAuthUrlResponse:
+        """state / PKCE가 포함된 1회용 Kakao 인증 URL 생성 (선택 기능)"""
+        _not_supported("state / PKCE 인증 요청")
+
     @abstractmethod
-    async def request_access_token(self, code: str) -> KakaoTokenResponse:
-        """인가 코드로 액세스 토큰 요청"""
+    async def request_access_token(self, code: str, state: str | None = None) -> KakaoTokenResponse:
+        """인가 코드로 액세스 토큰 요청 (state 검증 사용 시 state 소비 및 PKCE 교환)"""
         pass
 
+    async def refresh_access_token(self, refresh_token: str) -> KakaoTokenResponse:
+        """리프레시 토큰으로 액세스 토큰 갱신 (선택 기능)"""
+        _not_supported("액세스 토큰 갱신")
+
     @abstractmethod
-    async def get_user_info(self, access_token: str) -> KakaoUserInfoResponse:
+    async def get_user_info(self, access_token: str, expires_in: int | None = None) -> KakaoUserInfoResponse:
         """액세스 토큰으로 사용자 정보 조회"""
         pass
+
+    async def verify_id_token(self, id_token: str) -> KakaoUserInfoResponse:
+        """OIDC id_token을 로컬에서 검증하고 사용자 정보 반환 (선택 기능)"""
+        _not_supported("OIDC id_token 검증")
+
+    async def get_user_profile(self, user_id: int) -> KakaoUserInfoResponse:
+        """어드민 키로 회원번호의 사용자 정보 조회 (선택 기능)"""
+        _not_supported("회원번호 조회")
+
+    def resolve_user_profiles(self, user_ids: list[int]) -> AsyncIterator[KakaoUserProfileResult]:
+        """어드민 키로 여러 회원번호의 사용자 정보를 동시에 조회하고 완료 순서대로 반환 (선택 기능)"""
+        _not_supported("회원번호 조회")
@@ -0,0 +1,240 @@
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+
+from fastapi import HTTPException
+
+from config.env import get_bool_env, get_float_env, get_int_env
+from kakao_authentication.repository import KakaoTokenStoreInterface, StoredKakaoToken
+from kakao_authentication.schemas.kakao_oauth import KakaoTokenResponse
+from kakao_authentication.service.kakao_oauth_service_interface import KakaoOAuthServiceInterface
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class KakaoTokenRefreshConfig:
+    """토큰 선제 갱신 설정"""
+    enabled: bool = True
+    # 만료 몇 초 전부터 갱신 대상으로 볼지
+    refresh_margin: float = 600.0
+    # 갱신 시각을 [0, jitter) 초 범위에서 앞당겨 분산시킨다.
+    refresh_jitter: float = 300.0
+    # 만료가 짧은 토큰이 폴링마다 다시 갱신되지 않도록 다음 갱신까지 최소 간격을 둔다.
+    min_refresh_interval: float = 60.0
+    poll_interval: float = 5.0
+    batch_size: int = 200
+    concurrency: int = 8
+    retry_delay: float = 30.0
+    # 갱신 대상을 선점한 워커가 이 시간 안에 끝내지 못하면 다른 워커가 다시 갱신할 수 있다.
+    claim_ttl: float = 60.0
+
+    @classmethod
+    def from_env(cls) -> "KakaoTokenRefreshConfig":
+        default = cls()
+        return cls(
+            enabled=get_bool_env("KAKAO_TOKEN_REFRESH_ENABLED", default.enabled),
+            refresh_margin=get_float_env("KAKAO_TOKEN_REFRESH_MARGIN", default.refresh_margin),
+            refresh_jitter=get_float_env("KAKAO_TOKEN_REFRESH_JITTER", default.refresh_jitter),
+            min_refresh_interval=get_float_env("KAKAO_TOKEN_REFRESH_MIN_INTERVAL", default.min_refresh_interval),
+            poll_interval=get_float_env("KAKAO_TOKEN_REFRESH_POLL_INTERVAL", default.poll_interval),
+            batch_size=get_int_env("KAKAO_TOKEN_REFRESH_BATCH_SIZE", default.batch_size),
+            concurrency=get_int_env("KAKAO_TOKEN_REFRESH_CONCURRENCY", default.concurrency),
+            retry_delay=get_float_env("KAKAO_TOKEN_REFRESH_RETRY_DELAY", default.retry_delay),
+            claim_ttl=get_float_env("KAKAO_TOKEN_REFRESH_CLAIM_TTL", default.claim_ttl),
+        )
+
+
+class KakaoTokenRefreshService:
+    """
+    Kakao 토큰 보관 및 선제 갱신 Service
+
+    - 콜백에서 발급된 토큰을 저장소에 보관한다.
+    - 백그라운드 작업이 만료 전에 refresh_token으로 액세스 토큰을 갱신한다.
+    - 갱신 시각에 지터를 적용해 대량의 토큰이 같은 순간에 갱신되지 않도록 한다.
+    - 갱신 전에 저장소에서 토큰을 선점(compare-and-swap)하므로 워커가 여러 개여도 한 곳만 갱신한다.
+    """
+
+    def __init__(
+        self,
+        store: KakaoTokenStoreInterface,
+        oauth_service: KakaoOAuthServiceInterface,
+        config: KakaoTokenRefreshConfig | None = None,
+    ):
+        self._store = store
+        self._oauth_service = oauth_service
+        self._config = config or KakaoTokenRefreshConfig.from_env()
+        self._task: asyncio.Task | None = None
+
+        self.refreshed = 0
+        self.failed = 0
+        self.dropped = 0
+        self.claim_conflicts = 0
+
+    @property
+    def store(self) -> KakaoTokenStoreInterface:
+        return self._store
+
+    def _schedule_refresh_at(self, now: float, access_token_expires_at: float) -> float:
+        jitter = random.uniform(0, self._config.refresh_jitter)
+        return max(
+            access_token_expires_at - self._config.refresh_margin - jitter,
+            now + self._config.min_refresh_interval,
+        )
+
+    def _to_stored_token(
+        self,
+        user_id: int,
+        token: KakaoTokenResponse,
+        previous: StoredKakaoToken | None = None,
+    ) -> StoredKakaoToken:
+        now = time.time()
+        access_token_expires_at = now + token.expires_in
+
+        refresh_token = token.refresh_token
+        refresh_token_expires_at = (
+            now + token.refresh_token_expires_in if token.refresh_token_expires_in else None
+        )
+        # 갱신 응답에 새 리프레시 토큰이 없으면 기존 리프레시 토큰을 계속 사용한다.
+        if refresh_token is None and previous is not None:
+            refresh_token = previous.refresh_token
+            refresh_token_expires_at = previous.refresh_token_expires_at
+
+        return StoredKakaoToken(
+            user_id=user_id,
+            access_token=token.access_token,
+            token_type=token.token_type,
+            access_token_expires_at=access_token_expires_at,
+            refresh_at=self._schedule_refresh_at(now, access_token_expires_at),
+            refresh_token=refresh_token,
+            refresh_token_expires_at=refresh_token_expires_at,
+            scope=token.scope or (previous.scope if previous else None),
+        )
+
+    async def register(self, user_id: int, token: KakaoTokenResponse) -> None:
+        """콜백에서 발급된 사용자 토큰을 저장하고 갱신 일정을 등록한다."""
+        await self._store.save(self._to_stored_token(user_id, token))
+
+    async def get_token(self, user_id: int) -> StoredKakaoToken | None:
+        """저장된 사용자 토큰 조회 (만료된 토큰은 반환하지 않는다)"""
+        token = await self._store.get(user_id)
+        if token is None or token.access_token_expires_at <= time.time():
+            return None
+        return token
+
+    async def refresh_due(self) -> int:
+        """
+        갱신 시각이 지난 토큰을 갱신한다.
+
+        Returns:
+            int: 처리한 토큰 수
+        """
+        due = await self._store.find_due_for_refresh(time.time(), self._config.batch_size)
+        if not due:
+            return 0
+
+        semaphore = asyncio.Semaphore(self._config.concurrency)
+
+        async def refresh(token: StoredKakaoToken) -> None:
+            async with semaphore:
+                claimed = await self._claim(token)
+                if claimed is not None:
+                    await self._refresh_one(claimed)
+
+        await asyncio.gather(*(refresh(token) for token in due))
+        return len(due)
+
+    async def _claim(self, token: StoredKakaoToken) -> StoredKakaoToken | None:
+        """
+        갱신 시각을 claim_ttl 뒤로 미뤄 토큰을 선점한다.
+
+        다른 워커가 먼저 선점했거나 그사이 토큰이 바뀌었으면 None을 반환한다.
+        """
+        claimed = StoredKakaoToken(**{**token.__dict__, "refresh_at": time.time() + self._config.claim_ttl})
+        if not await self._store.compare_and_swap(token.user_id, token.refresh_at, claimed):
+            self.claim_conflicts += 1
+            return None
+        return claimed
+
+    async def _replace_claimed(self, claimed: StoredKakaoToken, token: StoredKakaoToken | None) -> None:
+        """선점한 토큰이 그대로일 때만 결과를 반영한다. (그사이 재로그인으로 저장된 토큰은 유지)"""
+        await self._store.compare_and_swap(claimed.user_id, claimed.refresh_at, token)
+
+    async def _refresh_one(self, token: StoredKakaoToken) -> None:
+        now = time.time()
+        refresh_expired = (
+            token.refresh_token_expires_at is not None and token.refresh_token_expires_at <= now
+        )
+
+        if not token.refresh_token or refresh_expired:
+            # 갱신할 수 없는 토큰은 액세스 토큰이 만료되는 시점에 정리한다.
+            if token.access_token_expires_at <= now:
+                await self._replace_claimed(token, None)
+                self.dropped += 1
+            else:
+                await self._replace_claimed(
+                    token, StoredKakaoToken(**{**token.__dict__, "refresh_at": token.access_token_expires_at})
+                )
+            return
+
+        try:
+            refreshed = await self._oauth_service.refresh_access_token(token.refresh_token)
+        except HTTPException as e:
+            if e.status_code in (400, 401):
+                # invalid_grant 등: 리프레시 토큰이 폐기되었으므로 재로그인이 필요하다.
+                await self._replace_claimed(token, None)
+                self.dropped += 1
+                return
+            await self._reschedule_after_failure(token)
+            return
+        except Exception:
+            logger.exception("Kakao 토큰 갱신 중 오류가 발생했습니다. (user_id=%s)", token.user_id)
+            await self._reschedule_after_failure(token)
+            return
+
+        await self._replace_claimed(token, self._to_stored_token(token.user_id, refreshed, previous=token))
+        self.refreshed += 1
+
+    async def _reschedule_after_failure(self, token: StoredKakaoToken) -> None:
+        self.failed += 1
+        retry_at = time.time() + self._config.retry_delay * random.uniform(0.5, 1.5)
+        await self._replace_claimed(token, StoredKakaoToken(**{**token.__dict__, "refresh_at": retry_at}))
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh_due()
+            except Exception:
+                logger.exception("Kakao 토큰 갱신 작업이 실패했습니다.")
+            # 워커 간 폴링 시점이 겹치지 않도록 주기에도 지터를 적용한다.
+            await asyncio.sleep(self._config.poll_interval * random.uniform(0.5, 1.5))
+
+    def start(self) -> None:
+        """백그라운드 갱신 작업을 시작한다."""
+        if not self._config.enabled or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run(), name="kakao-token-refresher")
+
+    async def stop(self) -> None:
+        """백그라운드 갱신 작업을 중지하고 저장소를 닫는다."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._store.close()
+
+    def get_counters(self) -> dict:
+        return {
+            "refreshed": self.refreshed,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "claim_conflicts": self.claim_conflicts,
+        }
+
+    async def get_stats(self) -> dict:
+        return {"tokens": await self._store.count(), **self.get_counters()}
@@ -0,0 +1,186 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+
+from config.env import get_bool_env, get_float_env, get_int_env
+from kakao_authentication.repository import LoginAuditRecord, LoginAuditStoreInterface
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class LoginAuditConfig:
+    """로그인 감사 로그 설정"""
+    enabled: bool = True
+    # 저장을 기다리는 기록의 최대 수 (넘으면 backpressure)
+    max_queue: int = 10000
+    # 한 트랜잭션으로 커밋할 최대 기록 수
+    batch_size: int = 500
+    # 첫 기록을 꺼낸 뒤 같은 배치로 묶을 기록을 기다리는 시간(초)
+    flush_interval: float = 0.05
+    # 대기열이 가득 찼을 때 로그인 요청이 자리를 기다리는 최대 시간(초). 0이면 기다리지 않고 버린다.
+    enqueue_timeout: float = 1.0
+    # 저장 실패 시 같은 배치를 다시 시도하는 횟수
+    max_retries: int = 3
+    retry_delay: float = 0.5
+    # 종료 시 남은 기록을 저장하기 위해 기다리는 최대 시간(초)
+    shutdown_timeout: float = 10.0
+
+    @classmethod
+    def from_env(cls) -> "LoginAuditConfig":
+        default = cls()
+        return cls(
+            enabled=get_bool_env("LOGIN_AUDIT_ENABLED", default.enabled),
+            max_queue=get_int_env("LOGIN_AUDIT_MAX_QUEUE", default.max_queue),
+            batch_size=get_int_env("LOGIN_AUDIT_BATCH_SIZE", default.batch_size),
+            flush_interval=get_float_env("LOGIN_AUDIT_FLUSH_INTERVAL", default.flush_interval),
+            enqueue_timeout=get_float_env("LOGIN_AUDIT_ENQUEUE_TIMEOUT", default.enqueue_timeout),
+            max_retries=get_int_env("LOGIN_AUDIT_MAX_RETRIES", default.max_retries),
+            retry_delay=get_float_env("LOGIN_AUDIT_RETRY_DELAY", default.retry_delay),
+            shutdown_timeout=get_float_env("LOGIN_AUDIT_SHUTDOWN_TIMEOUT", default.shutdown_timeout),
+        )
+
+
+class LoginAuditService:
+    """
+    로그인 감사 로그 Service
+
+    - 로그인 요청은 기록을 메모리 대기열에 넣기만 하고, 디스크 쓰기를 기다리지 않는다.
+    - 백그라운드 작업이 대기열의 기록을 배치로 묶어 한 트랜잭션으로 저장한다. (group commit)
+    - 대기열이 가득 차면 로그인 요청이 enqueue_timeout까지 자리를 기다리고(backpressure), 그래도 없으면 기록을 버리고 집계한다.
+    - 종료 시 대기열에 남은 기록을 모두 저장한 뒤 저장소를 닫는다.
+    - 감사 로그를 끈 경우(LOGIN_AUDIT_ENABLED=false) 저장소 없이(None) 만들 수 있다.
+    """
+
+    def __init__(self, store: LoginAuditStoreInterface | None, config: LoginAuditConfig | None = None):
+        self._store = store
+        self._config = config or LoginAuditConfig.from_env()
+        self._enabled = self._config.enabled and store is not None
+        self._queue: asyncio.Queue[LoginAuditRecord] = asyncio.Queue(maxsize=self._config.max_queue)
+        self._task: asyncio.Task | None = None
+
+        self.queued = 0
+        self.written = 0
+        self.dropped = 0
+        self.batches = 0
+        self.write_errors = 0
+
+    def _drop(self, record: LoginAuditRecord, reason: str) -> None:
+        self.dropped += 1
+        # 저장하지 못한 기록도 로그로는 남긴다.
+        logger.error(
+            "로그인 감사 기록을 저장하지 못했습니다. (reason=%s, user_id=%s, logged_in_at=%s, scope=%s)",
+            reason,
+            record.user_id,
+            record.logged_in_at,
+            record.scope,
+        )
+
+    async def record(self, user_id: int, scope: str | None) -> None:
+        """
+        로그인 성공을 기록한다.
+
+        대기열에 자리가 있으면 즉시 반환하며, 가득 찬 경우에만 enqueue_timeout까지 기다린다.
+        """
+        if not self._enabled:
+            return
+
+        record = LoginAuditRecord(user_id=user_id, logged_in_at=time.time(), scope=scope)
+        try:
+            self._queue.put_nowait(record)
+        except asyncio.QueueFull:
+            if self._config.enqueue_timeout <= 0:
+                self._drop(record, "queue_full")
+                return
+            try:
+                await asyncio.wait_for(self._queue.put(record), timeout=self._config.enqueue_timeout)
+            except asyncio.TimeoutError:
+                self._drop(record, "queue_full")
+                return
+        self.queued += 1
+
+    async def _next_batch(self) -> list[LoginAuditRecord]:
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._config.flush_interval
+
+        while len(batch) < self._config.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _write(self, batch: list[LoginAuditRecord]) -> None:
+        for attempt in range(self._config.max_retries + 1):
+            try:
+                await self._store.write_batch(batch)
+            except Exception:
+                self.write_errors += 1
+                logger.exception("로그인 감사 기록 저장에 실패했습니다. (attempt=%s, records=%s)", attempt + 1, len(batch))
+                if attempt < self._config.max_retries:
+                    await asyncio.sleep(self._config.retry_delay * (2 ** attempt))
+                continue
+            self.written += len(batch)
+            self.batches += 1
+            return
+
+        for record in batch:
+            self._drop(record, "write_failed")
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def start(self) -> None:
+        """백그라운드 저장 작업을 시작한다."""
+        if not self._enabled or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run(), name="login-audit-writer")
+
+    async def stop(self) -> None:
+        """대기열에 남은 기록을 저장한 뒤 백그라운드 작업을 중지하고 저장소를 닫는다."""
+        if self._task is not None:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=self._config.shutdown_timeout)
+            except asyncio.TimeoutError:
+                logger.error("종료 전에 로그인 감사 기록을 모두 저장하지 못했습니다. (남은 기록=%s)", self._queue.qsize())
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        while not self._queue.empty():
+            self._drop(self._queue.get_nowait(), "shutdown")
+        if self._store is not None:
+            await self._store.close()
+
+    def get_counters(self) -> dict:
+        return {
+            "queued": self.queued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "batches": self.batches,
+            "write_errors": self.write_errors,
+            "queue_depth": self._queue.qsize(),
+        }
+
+    async def get_stats(self) -> dict:
+        records = await self._store.count() if self._store is not None else 0
+        return {"records": records, **self.get_counters()}
@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from kakao_authentication.schemas.kakao_oauth import (
+    KakaoAuthUrlResponse,
+    KakaoTokenResponse,
+    KakaoUserInfoResponse,
+)
+
+
+class SyncKakaoOAuthServiceInterface(ABC):
+    """
+    동기 Kakao OAuth Service Interface
+
+    requests 등 동기 HTTP 클라이언트로 구현한 Service의 계약이다.
+    이벤트 루프에서 직접 호출하지 않고 ThreadPoolKakaoOAuthService로 감싸서 주입한다.
+    """
+
+    @abstractmethod
+    def generate_auth_url(self) -> KakaoAuthUrlResponse:
+        """Kakao 인증 URL 생성"""
+        pass
+
+    @abstractmethod
+    def request_access_token(self, code: str) -> KakaoTokenResponse:
+        """인가 코드로 액세스 토큰 요청"""
+        pass
+
+    @abstractmethod
+    def refresh_access_token(self, refresh_token: str) -> KakaoTokenResponse:
+        """리프레시 토큰으로 액세스 토큰 갱신"""
+        pass
+
+    @abstractmethod
+    def get_user_info(self, access_token: str) -> KakaoUserInfoResponse:
+        """액세스 토큰으로 사용자 정보 조회"""
+        pass
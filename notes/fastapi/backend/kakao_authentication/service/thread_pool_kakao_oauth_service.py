@@ -0,0 +1,119 @@
+from typing import AsyncIterator
+
+from fastapi import HTTPException
+
+from config.env import get_float_env, get_int_env, get_kakao_oauth_state_enabled
+from infrastructure.bounded_executor import BoundedThreadPool, ExecutorSaturated
+from infrastructure.fan_out import bounded_fan_out
+from kakao_authentication.schemas.kakao_oauth import (
+    KakaoAuthUrlResponse,
+    KakaoTokenResponse,
+    KakaoUserInfoResponse,
+    KakaoUserProfileResult,
+)
+from kakao_authentication.service.kakao_oauth_service_impl import to_user_profile_result
+from kakao_authentication.service.kakao_oauth_service_interface import KakaoOAuthServiceInterface
+from kakao_authentication.service.sync_kakao_oauth_service_interface import SyncKakaoOAuthServiceInterface
+
+
+def build_sync_executor() -> BoundedThreadPool:
+    """KAKAO_SYNC_EXECUTOR_* 설정으로 동기 Service 전용 스레드 풀을 생성한다."""
+    return BoundedThreadPool(
+        "kakao-sync",
+        max_workers=get_int_env("KAKAO_SYNC_EXECUTOR_MAX_WORKERS", 8),
+        max_queue=get_int_env("KAKAO_SYNC_EXECUTOR_MAX_QUEUE", 64),
+        max_wait=get_float_env("KAKAO_SYNC_EXECUTOR_MAX_WAIT", 5.0),
+    )
+
+
+class ThreadPoolKakaoOAuthService(KakaoOAuthServiceInterface):
+    """
+    동기 Service 구현체를 비동기 계약으로 감싸는 어댑터
+
+    - 블로킹 호출(request_access_token 등)은 크기가 제한된 전용 스레드 풀에서 실행한다.
+      느린 Kakao 응답이 쌓여도 Starlette 기본 threadpool을 쓰는 다른 동기 엔드포인트는 영향을 받지 않는다.
+    - 스레드 풀이 포화되면 기다리지 않고 503(Retry-After)으로 거절한다.
+    - generate_auth_url은 I/O 없이 설정값만으로 계산된다고 보고 이벤트 루프에서 직접 호출한다.
+    """
+
+    def __init__(self, service: SyncKakaoOAuthServiceInterface, executor: BoundedThreadPool | None = None):
+        self._service = service
+        self._executor = executor or build_sync_executor()
+
+    @property
+    def wrapped(self) -> SyncKakaoOAuthServiceInterface:
+        return self._service
+
+    @property
+    def oidc_enabled(self) -> bool:
+        # 감싼 구현체가 OIDC 모드이고 id_token 검증을 제공할 때만 켠다.
+        return bool(getattr(self._service, "oidc_enabled", False)) and callable(
+            getattr(self._service, "verify_id_token", None)
+        )
+
+    def validate_config(self) -> None:
+        """감싼 구현체가 설정 검증을 제공하면 호출한다."""
+        validate = getattr(self._service, "validate_config", None)
+        if callable(validate):
+            validate()
+
+    async def _run(self, fn, *args):
+        try:
+            return await self._executor.run(fn, *args)
+        except ExecutorSaturated as e:
+            raise HTTPException(
+                status_code=503,
+                detail="Kakao 로그인 요청이 많아 잠시 후 다시 시도해 주세요.",
+                headers={"Retry-After": e.retry_after_header},
+            )
+
+    def generate_auth_url(self) -> KakaoAuthUrlResponse:
+        return self._service.generate_auth_url()
+
+    async def request_access_token(self, code: str, state: str | None = None) -> KakaoTokenResponse:
+        # state 검증을 켠 상태에서 검증 없이 교환하지 않도록 거절한다.
+        if get_kakao_oauth_state_enabled():
+            raise HTTPException(status_code=501, detail="이 Service 구현체는 state / PKCE 검증을 지원하지 않습니다.")
+        return await self._run(self._service.request_access_token, code)
+
+    async def refresh_access_token(self, refresh_token: str) -> KakaoTokenResponse:
+        return await self._run(self._service.refresh_access_token, refresh_token)
+
+    async def get_user_info(self, access_token: str, expires_in: int | None = None) -> KakaoUserInfoResponse:
+        # 동기 구현체는 자체 캐시를 두지 않으므로 expires_in은 사용하지 않는다.
+        return await self._run(self._service.get_user_info, access_token)
+
+    # 선택 기능은 감싼 구현체가 같은 이름의 동기 메서드를 제공할 때만 위임하고, 없으면 Interface 기본 동작(501)을 따른다.
+    async def verify_id_token(self, id_token: str) -> KakaoUserInfoResponse:
+        verify = getattr(self._service, "verify_id_token", None)
+        if not callable(verify):
+            return await super().verify_id_token(id_token)
+        return await self._run(verify, id_token)
+
+    async def get_user_profile(self, user_id: int) -> KakaoUserInfoResponse:
+        get_user_profile = getattr(self._service, "get_user_profile", None)
+        if not callable(get_user_profile):
+            return await super().get_user_profile(user_id)
+        return await self._run(get_user_profile, user_id)
+
+    def resolve_user_profiles(self, user_ids: list[int]) -> AsyncIterator[KakaoUserProfileResult]:
+        if not callable(getattr(self._service, "get_user_profile", None)):
+            return super().resolve_user_profiles(user_ids)
+        return self._resolve_user_profiles(list(dict.fromkeys(user_ids)))
+
+    async def _resolve_user_profiles(self, user_ids: list[int]) -> AsyncIterator[KakaoUserProfileResult]:
+        # 동시 실행 수는 전용 스레드 풀 크기로 제한된다.
+        async for user_id, outcome in bounded_fan_out(
+            user_ids, self.get_user_profile, self._executor.max_workers
+        ):
+            yield to_user_profile_result(user_id, outcome)
+
+    def get_stats(self, group: str) -> dict:
+        return self._executor.stats() if group == "executor" else {}
+
+    async def stop(self) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """전용 스레드 풀을 종료한다."""
+        self._executor.shutdown()
@@ -0,0 +1 @@
+# Kakao OAuth/API 로컬 대역(mock) 서버 Package
@@ -0,0 +1,88 @@
+import math
+import os
+import random
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class LatencyProfile:
+    """
+    응답 지연 분포 (밀리초)
+
+    문자열 형식: "<분포>:<키>=<값>,..."
+    - fixed:ms=20
+    - uniform:min=10,max=50
+    - normal:mean=40,stddev=10
+    - lognormal:median=30,sigma=0.5
+    - pareto:scale=20,alpha=2.5   (긴 꼬리 지연 재현용)
+    """
+    distribution: str
+    params: dict[str, float]
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyProfile":
+        distribution, _, raw_params = spec.strip().partition(":")
+        params: dict[str, float] = {}
+        for pair in filter(None, raw_params.split(",")):
+            key, _, value = pair.partition("=")
+            params[key.strip()] = float(value)
+
+        if distribution not in ("fixed", "uniform", "normal", "lognormal", "pareto"):
+            raise ValueError(f"지원하지 않는 지연 분포입니다: {distribution}")
+
+        return cls(distribution=distribution, params=params)
+
+    def sample_ms(self) -> float:
+        p = self.params
+        if self.distribution == "fixed":
+            value = p.get("ms", 0.0)
+        elif self.distribution == "uniform":
+            value = random.uniform(p.get("min", 0.0), p.get("max", 0.0))
+        elif self.distribution == "normal":
+            value = random.gauss(p.get("mean", 0.0), p.get("stddev", 0.0))
+        elif self.distribution == "lognormal":
+            value = random.lognormvariate(math.log(max(p.get("median", 1.0), 1e-6)), p.get("sigma", 0.0))
+        else:
+            value = p.get("scale", 1.0) * random.paretovariate(p.get("alpha", 3.0))
+
+        cap = p.get("max_ms")
+        if cap is not None:
+            value = min(value, cap)
+        return max(value, 0.0)
+
+
+@dataclass(frozen=True)
+class FaultProfile:
+    """엔드포인트별 지연/오류 주입 설정"""
+    latency: LatencyProfile
+    # 5xx 응답 비율 (0.0 ~ 1.0)
+    error_rate: float = 0.0
+    # 429 응답 비율 (0.0 ~ 1.0)
+    rate_limit_rate: float = 0.0
+    retry_after: int = 1
+
+    @classmethod
+    def from_env(cls, endpoint: str) -> "FaultProfile":
+        """
+        MOCK_KAKAO_* 환경 변수에서 설정을 읽는다.
+
+        엔드포인트별 값(MOCK_KAKAO_TOKEN_LATENCY 등)이 있으면 공통 값(MOCK_KAKAO_LATENCY)보다 우선한다.
+        """
+        def read(name: str, default: str) -> str:
+            return os.getenv(f"MOCK_KAKAO_{endpoint}_{name}") or os.getenv(f"MOCK_KAKAO_{name}") or default
+
+        return cls(
+            latency=LatencyProfile.parse(read("LATENCY", "lognormal:median=30,sigma=0.4,max_ms=2000")),
+            error_rate=float(read("ERROR_RATE", "0")),
+            rate_limit_rate=float(read("RATE_LIMIT_RATE", "0")),
+            retry_after=int(read("RETRY_AFTER", "1")),
+        )
+
+    def pick_fault(self) -> int | None:
+        """이번 요청에 주입할 오류 상태 코드 (없으면 None)"""
+        roll = random.random()
+        if roll < self.rate_limit_rate:
+            return 429
+        if roll < self.rate_limit_rate + self.error_rate:
+            return random.choice((500, 502, 503))
+        return None
@@ -0,0 +1,288 @@
+import asyncio
+import base64
+import hashlib
+import os
+import secrets
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from urllib.parse import urlencode
+
+from fastapi import FastAPI, Form, Header, Query
+from fastapi.responses import JSONResponse, RedirectResponse
+
+from kakao_mock_server.fault_profile import FaultProfile
+from kakao_mock_server.signing import RSASigningKey, build_id_token_claims
+
+app = FastAPI(
+    title="Kakao Mock Server",
+    description="부하 테스트용 Kakao OAuth/API 로컬 대역 서버",
+    version="1.0.0",
+)
+
+ACCESS_TOKEN_EXPIRES_IN = 21599
+REFRESH_TOKEN_EXPIRES_IN = 5183999
+
+# 엄격 모드에서는 발급한 인가 코드/토큰만 허용한다. (기본: 임의의 값도 허용하여 부하 테스트를 단순화)
+STRICT = os.getenv("MOCK_KAKAO_STRICT", "false").lower() in ("1", "true", "yes", "on")
+
+_profiles = {
+    "authorize": FaultProfile.from_env("AUTHORIZE"),
+    "token": FaultProfile.from_env("TOKEN"),
+    "user_info": FaultProfile.from_env("USER_INFO"),
+}
+
+# 인가 코드 → 사용자 id, 액세스/리프레시 토큰 → 사용자 id (장시간 부하 테스트를 위해 크기를 제한한다)
+MAX_ISSUED = int(os.getenv("MOCK_KAKAO_MAX_ISSUED", "1000000"))
+_codes: OrderedDict[str, int] = OrderedDict()
+_access_tokens: OrderedDict[str, int] = OrderedDict()
+_refresh_tokens: OrderedDict[str, int] = OrderedDict()
+# openid scope로 발급된 인가 코드 → nonce
+_openid_codes: OrderedDict[str, str | None] = OrderedDict()
+# PKCE(code_challenge)와 함께 발급된 인가 코드 → code_challenge
+_pkce_codes: OrderedDict[str, str] = OrderedDict()
+
+# OIDC: 모든 인가 코드 교환에 id_token을 포함할지 (기본: authorize에서 openid scope를 요청한 경우만)
+OIDC_ALWAYS = os.getenv("MOCK_KAKAO_OIDC", "false").lower() in ("1", "true", "yes", "on")
+ISSUER = os.getenv("MOCK_KAKAO_ISSUER", "https://kauth.kakao.com")
+# 어드민 키 조회(KakaoAK)에 허용할 키 (비우면 임의의 키 허용)
+ADMIN_KEY = os.getenv("MOCK_KAKAO_ADMIN_KEY")
+# 서명 키는 기동 시 생성한다. 키 교체 후에도 이전 키는 JWKS에 남겨 발급된 토큰이 검증되도록 한다.
+_signing_keys: list[RSASigningKey] = [RSASigningKey.generate(int(os.getenv("MOCK_KAKAO_RSA_BITS", "2048")))]
+
+
+def _remember(issued: OrderedDict[str, int], key: str, user_id: int) -> None:
+    issued[key] = user_id
+    if len(issued) > MAX_ISSUED:
+        issued.popitem(last=False)
+
+
+def _user_id_for(seed: str) -> int:
+    """같은 입력에 대해 항상 같은 회원번호를 만든다."""
+    return 1_000_000_000 + int.from_bytes(hashlib.sha256(seed.encode()).digest()[:4], "big") % 1_000_000_000
+
+
+async def _apply_profile(name: str, error_body: dict) -> JSONResponse | None:
+    profile = _profiles[name]
+    await asyncio.sleep(profile.latency.sample_ms() / 1000)
+
+    status_code = profile.pick_fault()
+    if status_code is None:
+        return None
+
+    if status_code == 429:
+        return JSONResponse(
+            status_code=429,
+            content={"msg": "API limit has been exceeded.", "code": -10},
+            headers={"Retry-After": str(profile.retry_after)},
+        )
+    return JSONResponse(status_code=status_code, content=error_body)
+
+
+def _profile_for(user_id: int) -> tuple[str, str, str]:
+    """회원번호에 대한 (닉네임, 이메일, 프로필 이미지 URL)"""
+    nickname = f"user{user_id % 100000}"
+    return nickname, f"{nickname}@example.com", f"http://k.kakaocdn.net/dn/mock/{user_id}/img_640x640.jpg"
+
+
+def _issue_id_token(client_id: str, user_id: int, nonce: str | None) -> str:
+    nickname, email, picture = _profile_for(user_id)
+    claims = build_id_token_claims(
+        ISSUER, client_id, user_id, nickname, email, picture, ACCESS_TOKEN_EXPIRES_IN, nonce=nonce
+    )
+    return _signing_keys[-1].sign_jwt(claims)
+
+
+def _issue_tokens(user_id: int, include_refresh_token: bool = True) -> dict:
+    access_token = secrets.token_urlsafe(40)
+    _remember(_access_tokens, access_token, user_id)
+    payload = {
+        "token_type": "bearer",
+        "access_token": access_token,
+        "expires_in": ACCESS_TOKEN_EXPIRES_IN,
+        "scope": "account_email profile_image profile_nickname",
+    }
+    if include_refresh_token:
+        refresh_token = secrets.token_urlsafe(40)
+        _remember(_refresh_tokens, refresh_token, user_id)
+        payload["refresh_token"] = refresh_token
+        payload["refresh_token_expires_in"] = REFRESH_TOKEN_EXPIRES_IN
+    return payload
+
+
+def _token_error(description: str, error_code: str) -> JSONResponse:
+    return JSONResponse(
+        status_code=400,
+        content={"error": "invalid_grant", "error_description": description, "error_code": error_code},
+    )
+
+
+@app.get("/oauth/authorize")
+async def authorize(
+    client_id: str = Query(...),
+    redirect_uri: str = Query(...),
+    response_type: str = Query("code"),
+    state: str | None = Query(None),
+    scope: str | None = Query(None),
+    nonce: str | None = Query(None),
+    code_challenge: str | None = Query(None),
+    code_challenge_method: str | None = Query(None),
+):
+    """로그인/동의 화면 없이 즉시 인가 코드를 발급하여 redirect_uri로 리다이렉트한다."""
+    fault = await _apply_profile("authorize", {"error": "server_error"})
+    if fault is not None:
+        return fault
+
+    code = secrets.token_urlsafe(48)
+    _remember(_codes, code, _user_id_for(f"{client_id}:{time.time_ns()}"))
+    if scope and "openid" in scope.split():
+        _openid_codes[code] = nonce
+        if len(_openid_codes) > MAX_ISSUED:
+            _openid_codes.popitem(last=False)
+    if code_challenge is not None:
+        if code_challenge_method != "S256":
+            return JSONResponse(status_code=400, content={"error": "invalid_request", "error_description": "unsupported code_challenge_method"})
+        _pkce_codes[code] = code_challenge
+        if len(_pkce_codes) > MAX_ISSUED:
+            _pkce_codes.popitem(last=False)
+
+    params = {"code": code}
+    if state is not None:
+        params["state"] = state
+    separator = "&" if "?" in redirect_uri else "?"
+    return RedirectResponse(f"{redirect_uri}{separator}{urlencode(params)}", status_code=302)
+
+
+@app.post("/oauth/token")
+async def token(
+    grant_type: str = Form(...),
+    client_id: str = Form(...),
+    code: str | None = Form(None),
+    refresh_token: str | None = Form(None),
+    redirect_uri: str | None = Form(None),
+    code_verifier: str | None = Form(None),
+):
+    """authorization_code / refresh_token 그랜트를 처리한다."""
+    fault = await _apply_profile(
+        "token",
+        {"error": "server_error", "error_description": "internal server error", "error_code": "KOE999"},
+    )
+    if fault is not None:
+        return fault
+
+    if grant_type == "authorization_code":
+        if not code:
+            return _token_error("authorization code not found", "KOE320")
+        # PKCE로 발급된 코드는 code_verifier가 code_challenge와 일치해야 교환된다.
+        challenge = _pkce_codes.pop(code, None)
+        if challenge is not None:
+            digest = hashlib.sha256((code_verifier or "").encode()).digest()
+            if base64.urlsafe_b64encode(digest).rstrip(b"=").decode() != challenge:
+                _codes.pop(code, None)
+                return _token_error("code_verifier mismatch", "KOE010")
+        user_id = _codes.pop(code, None)
+        if user_id is None:
+            if STRICT:
+                return _token_error(f"authorization code not found for code={code}", "KOE320")
+            user_id = _user_id_for(code)
+        payload = _issue_tokens(user_id)
+        openid = code in _openid_codes
+        if openid or OIDC_ALWAYS:
+            payload["id_token"] = _issue_id_token(client_id, user_id, _openid_codes.pop(code, None))
+            payload["scope"] += " openid"
+        return payload
+
+    if grant_type == "refresh_token":
+        if not refresh_token:
+            return _token_error("refresh_token is required", "KOE322")
+        user_id = _refresh_tokens.get(refresh_token)
+        if user_id is None:
+            if STRICT:
+                return _token_error("refresh_token not found", "KOE322")
+            user_id = _user_id_for(refresh_token)
+        # 실제 Kakao처럼 리프레시 토큰은 재발급하지 않고 액세스 토큰만 갱신한다.
+        return _issue_tokens(user_id, include_refresh_token=False)
+
+    return JSONResponse(
+        status_code=400,
+        content={"error": "unsupported_grant_type", "error_description": f"grant_type={grant_type}"},
+    )
+
+
+@app.get("/v2/user/me")
+async def user_me(
+    authorization: str | None = Header(None),
+    target_id_type: str | None = Query(None),
+    target_id: str | None = Query(None),
+):
+    """Bearer 토큰(또는 어드민 키 + target_id)에 해당하는 사용자 정보를 반환한다."""
+    fault = await _apply_profile("user_info", {"msg": "internal server error", "code": -1})
+    if fault is not None:
+        return fault
+
+    if authorization and authorization.startswith("KakaoAK "):
+        if ADMIN_KEY and authorization[len("KakaoAK "):] != ADMIN_KEY:
+            return JSONResponse(status_code=401, content={"msg": "wrong appKey", "code": -401})
+        if target_id_type != "user_id" or not (target_id or "").isdigit():
+            return JSONResponse(status_code=400, content={"msg": "invalid target_id", "code": -2})
+        user_id = int(target_id)
+    elif authorization and authorization.startswith("Bearer "):
+        access_token = authorization[len("Bearer "):]
+        user_id = _access_tokens.get(access_token)
+        if user_id is None:
+            if STRICT:
+                return JSONResponse(status_code=401, content={"msg": "this access token does not exist", "code": -401})
+            user_id = _user_id_for(access_token)
+    else:
+        return JSONResponse(status_code=401, content={"msg": "this access token does not exist", "code": -401})
+
+    nickname, email, image_url = _profile_for(user_id)
+    return {
+        "id": user_id,
+        "connected_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "properties": {
+            "nickname": nickname,
+            "profile_image": image_url,
+            "thumbnail_image": image_url.replace("640x640", "110x110"),
+        },
+        "kakao_account": {
+            "profile_nickname_needs_agreement": False,
+            "profile_image_needs_agreement": False,
+            "profile": {
+                "nickname": nickname,
+                "thumbnail_image_url": image_url.replace("640x640", "110x110"),
+                "profile_image_url": image_url,
+                "is_default_image": False,
+            },
+            "has_email": True,
+            "email_needs_agreement": False,
+            "is_email_valid": True,
+            "is_email_verified": True,
+            "email": email,
+        },
+    }
+
+
+@app.get("/.well-known/jwks.json")
+async def jwks():
+    """id_token 서명 검증용 공개키 집합"""
+    return {"keys": [key.to_jwk() for key in _signing_keys]}
+
+
+@app.post("/_mock/rotate-keys")
+async def rotate_keys():
+    """테스트용: 새 서명 키로 교체한다. (이전 키 1개는 JWKS에 유지)"""
+    _signing_keys.append(await asyncio.to_thread(RSASigningKey.generate, _signing_keys[-1].key_size))
+    del _signing_keys[:-2]
+    return {"kids": [key.kid for key in _signing_keys]}
+
+
+@app.get("/health")
+async def health_check():
+    """헬스 체크 엔드포인트"""
+    return {"status": "healthy"}
+
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(app, host="127.0.0.1", port=int(os.getenv("MOCK_KAKAO_PORT", "9000")))
@@ -0,0 +1,71 @@
+import json
+import secrets
+import time
+from dataclasses import dataclass
+
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+
+from infrastructure.jwt import base64url_encode
+
+
+def _int_to_base64url(value: int) -> str:
+    return base64url_encode(value.to_bytes((value.bit_length() + 7) // 8, "big"))
+
+
+@dataclass(frozen=True)
+class RSASigningKey:
+    """대역 서버용 RSA 서명 키"""
+    kid: str
+    private_key: rsa.RSAPrivateKey
+
+    @classmethod
+    def generate(cls, bits: int = 2048, e: int = 65537) -> "RSASigningKey":
+        return cls(
+            kid=secrets.token_hex(16),
+            private_key=rsa.generate_private_key(public_exponent=e, key_size=bits),
+        )
+
+    @property
+    def key_size(self) -> int:
+        """모듈러스 비트 길이"""
+        return self.private_key.key_size
+
+    def to_jwk(self) -> dict:
+        numbers = self.private_key.public_key().public_numbers()
+        return {
+            "kid": self.kid,
+            "kty": "RSA",
+            "alg": "RS256",
+            "use": "sig",
+            "n": _int_to_base64url(numbers.n),
+            "e": _int_to_base64url(numbers.e),
+        }
+
+    def sign_jwt(self, claims: dict) -> str:
+        """claims를 RS256으로 서명한 JWS Compact 토큰을 만든다."""
+        header = {"alg": "RS256", "typ": "JWT", "kid": self.kid}
+        signing_input = ".".join(
+            base64url_encode(json.dumps(part, separators=(",", ":")).encode()) for part in (header, claims)
+        )
+        signature = self.private_key.sign(signing_input.encode("ascii"), padding.PKCS1v15(), hashes.SHA256())
+        return f"{signing_input}.{base64url_encode(signature)}"
+
+
+def build_id_token_claims(issuer: str, client_id: str, user_id: int, nickname: str, email: str, picture: str,
+                          expires_in: int, nonce: str | None = None) -> dict:
+    now = int(time.time())
+    claims = {
+        "iss": issuer,
+        "aud": client_id,
+        "sub": str(user_id),
+        "iat": now,
+        "exp": now + expires_in,
+        "auth_time": now,
+        "nickname": nickname,
+        "picture": picture,
+        "email": email,
+    }
+    if nonce is not None:
+        claims["nonce"] = nonce
+    return claims
@@ -1,16 +1,132 @@
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from infrastructure.startup_profile import startup_profile
 
-from config import load_env
+from config import Settings, SettingsWatcher, load_env, subscribe_settings
+from config.env import get_bool_env, get_float_env, get_int_env
 
 load_env()
+startup_profile.mark("env_loaded")
+
+# 기동 시간 프로파일: 이후의 import부터 모듈별 import 시간을 측정한다.
+_startup_profile_enabled = get_bool_env("STARTUP_PROFILE", False)
+if _startup_profile_enabled:
+    startup_profile.start_import_timer()
 
+import asyncio
+from contextlib import asynccontextmanager
+from functools import partial
+
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
+
+from authentication.container import authentication_container
+from authentication.controller.authentication_controller import router as authentication_router
+from infrastructure.cache import close_shared_cache_backend, get_shared_cache_stats
+from infrastructure.http_client import (
+    close_http_client,
+    get_http_client_config,
+    get_http_pool_stats,
+    prewarm_http_client,
+    start_http_client,
+    start_prewarm,
+)
+from infrastructure.loop_monitor import EventLoopMonitor
+from infrastructure.responses import FastJSONResponse
+from infrastructure.server_timing import ServerTimingMiddleware, set_server_timing_enabled
+from infrastructure.warmup import WarmupGate, WarmupGateMiddleware
+from kakao_authentication.container import kakao_authentication_container
+from kakao_authentication.controller.kakao_admin_controller import router as kakao_admin_router
 from kakao_authentication.controller.kakao_oauth_controller import router as kakao_oauth_router
+from metrics import REGISTRY, MetricsMiddleware
+from metrics.collectors import stats_collector
+
+startup_profile.mark("imported")
+startup_profile.stop_import_timer()
+
+# 지연 기동 모드: 워밍업(HTTP 클라이언트, Service, 스키마 생성)을 백그라운드로 돌리고 /health는 바로 응답한다.
+_startup_lazy = get_bool_env("STARTUP_LAZY", False)
+_warmup_gate = WarmupGate()
+
+# 이벤트 루프 지연 측정 및 블로킹 호출 스택 캡처 (LOOP_MONITOR_*)
+_loop_monitor = EventLoopMonitor()
+
+# .env 변경 감시: 새 설정 스냅샷으로 교체되면 의존하는 캐시/스위치를 갱신한다.
+_settings_watcher = SettingsWatcher(interval=get_float_env("SETTINGS_WATCH_INTERVAL", 2.0))
+
+
+def on_settings_changed(previous: Settings, current: Settings) -> None:
+    """설정 스냅샷 교체 시 런타임에 반영 가능한 설정을 적용한다."""
+    if previous.server_timing_enabled != current.server_timing_enabled:
+        set_server_timing_enabled(current.server_timing_enabled)
+    # Kakao 설정(client_id, redirect_uri, 엔드포인트, OIDC)이 바뀌면 인증 URL/사용자 정보 캐시가 무효화된다.
+    kakao_authentication_container.reload_config()
+
+
+subscribe_settings(on_settings_changed)
+
+
+async def warm_up() -> None:
+    """요청 처리에 필요한 공유 자원을 생성하고 첫 요청 비용이 큰 작업을 미리 수행한다."""
+    with startup_profile.phase("warmup.http_client"):
+        http_client = await start_http_client()
+
+    # 설정 누락 시 요청마다 500을 반환하는 대신 기동(워밍업) 단계에서 실패한다.
+    with startup_profile.phase("warmup.kakao_authentication"):
+        kakao_authentication_container.init(http_client=http_client)
+        kakao_authentication_container.start()
+
+    # 첫 로그인이 Kakao 호스트의 DNS 조회와 TLS 핸드셰이크 비용을 치르지 않도록 커넥션을 미리 열어 둔다.
+    http_config = get_http_client_config()
+    if http_config.prewarm_enabled:
+        upstream_urls = kakao_authentication_container.get_upstream_urls()
+        if http_config.prewarm_gate_readiness:
+            with startup_profile.phase("warmup.http_prewarm"):
+                await prewarm_http_client(upstream_urls)
+        else:
+            start_prewarm(upstream_urls)
+
+    with startup_profile.phase("warmup.authentication"):
+        authentication_container.init()
+        authentication_container.start()
+
+    # OpenAPI 스키마는 첫 /docs, /openapi.json 요청 때 생성되므로 미리 만들어 둔다.
+    with startup_profile.phase("warmup.openapi"):
+        await asyncio.to_thread(app.openapi)
+
+    startup_profile.mark("ready")
+    if _startup_profile_enabled:
+        startup_profile.log_report(get_int_env("STARTUP_PROFILE_TOP", 20))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 수명 주기 동안 공유 HTTP 클라이언트(커넥션 풀)와 Service 인스턴스를 관리한다."""
+    startup_profile.mark("lifespan_started")
+    _warmup_gate.reset()
+    _settings_watcher.start()
+    _loop_monitor.start()
+    try:
+        if _startup_lazy:
+            _warmup_gate.start(warm_up)
+        else:
+            await _warmup_gate.run(warm_up)
+        yield
+    finally:
+        await _warmup_gate.stop()
+        await _settings_watcher.stop()
+        await _loop_monitor.stop()
+        await authentication_container.shutdown()
+        await kakao_authentication_container.shutdown()
+        await close_shared_cache_backend()
+        await close_http_client()
+
 
 app = FastAPI(
     title="FastAPI Backend",
     description="FastAPI 백엔드 프로젝트",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 # CORS 설정
@@ -22,8 +138,127 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 워밍업 전 요청은 완료까지 대기 (지연 기동 모드에서만 의미가 있다)
+app.add_middleware(
+    WarmupGateMiddleware,
+    gate=_warmup_gate,
+    bypass_paths=frozenset({"/health", "/health/ready", "/health/startup"}),
+    timeout=get_float_env("STARTUP_WARMUP_TIMEOUT", 10.0),
+)
+
+# 단계별 처리 시간 Server-Timing 헤더 (SERVER_TIMING_ENABLED, 런타임 전환 가능)
+app.add_middleware(ServerTimingMiddleware)
+
+# 요청 지연/진행 중 요청 메트릭 (가장 바깥쪽에서 측정하도록 마지막에 등록)
+app.add_middleware(MetricsMiddleware)
+
+# 수집 시점에 계산되는 통계 메트릭 (누적 값은 counter, 나머지는 gauge로 노출)
+REGISTRY.register_collector(
+    stats_collector("http_client_pool", "공유 HTTP 커넥션 풀 통계", get_http_pool_stats)
+)
+REGISTRY.register_collector(
+    stats_collector(
+        "kakao_oauth_cache",
+        "Kakao OAuth Service 캐시 통계",
+        partial(kakao_authentication_container.get_service_stats, "cache"),
+        "cache",
+        counters=frozenset({
+            "local_evictions", "local_hits", "shared_hits", "misses", "computes", "lease_waits", "lease_timeouts",
+        }),
+    )
+)
+REGISTRY.register_collector(
+    stats_collector(
+        "kakao_upstream",
+        "Kakao upstream 지연/hedging 통계",
+        partial(kakao_authentication_container.get_service_stats, "endpoints"),
+        "endpoint",
+        counters=frozenset({"timeouts", "requests", "hedges_fired", "hedge_wins"}),
+    )
+)
+# 대기열 길이는 rate limiter가 kakao_rate_limiter_queue_depth 게이지로 직접 노출한다.
+REGISTRY.register_collector(
+    stats_collector(
+        "kakao_rate_limiter",
+        "Kakao upstream 요청 종류별 rate limiter 통계",
+        lambda: {
+            name: {key: value for key, value in stats.items() if key != "queue_depth"}
+            for name, stats in kakao_authentication_container.get_service_stats("rate_limiters").items()
+        },
+        "limiter",
+    )
+)
+REGISTRY.register_collector(
+    stats_collector(
+        "kakao_retry_budget",
+        "Kakao upstream 재시도 예산 통계",
+        partial(kakao_authentication_container.get_service_stats, "retry_budget"),
+        counters=frozenset({"spent", "exhausted"}),
+    )
+)
+REGISTRY.register_collector(
+    stats_collector(
+        "kakao_oidc_jwks",
+        "OIDC JWKS 캐시 통계",
+        partial(kakao_authentication_container.get_service_stats, "jwks"),
+        counters=frozenset({"fetches", "fetch_failures", "rotations", "unknown_kid"}),
+    )
+)
+REGISTRY.register_collector(
+    stats_collector(
+        "login_audit",
+        "로그인 감사 로그 대기열/저장 통계",
+        kakao_authentication_container.get_login_audit_counters,
+        counters=frozenset({"queued", "written", "dropped", "batches", "write_errors"}),
+    )
+)
+REGISTRY.register_collector(
+    stats_collector(
+        "kakao_oauth_state",
+        "OAuth state / PKCE 저장소 통계",
+        partial(kakao_authentication_container.get_service_stats, "oauth_state"),
+        counters=frozenset({"issued", "consumed", "rejected", "expired", "evicted"}),
+    )
+)
+REGISTRY.register_collector(
+    stats_collector(
+        "kakao_sync_executor",
+        "동기 Service 전용 스레드 풀 통계",
+        partial(kakao_authentication_container.get_service_stats, "executor"),
+        counters=frozenset({"completed"}),
+    )
+)
+REGISTRY.register_collector(
+    stats_collector(
+        "kakao_token_refresh",
+        "Kakao 토큰 선제 갱신 통계",
+        kakao_authentication_container.get_token_refresh_counters,
+        counters=frozenset({"refreshed", "failed", "dropped", "claim_conflicts"}),
+    )
+)
+REGISTRY.register_collector(
+    stats_collector(
+        "shared_cache",
+        "프로세스 간 공유 캐시 백엔드 통계",
+        get_shared_cache_stats,
+        counters=frozenset({"reads", "writes", "leases_acquired", "leases_contended"}),
+    )
+)
+REGISTRY.register_collector(
+    stats_collector(
+        "session",
+        "자체 세션 발급/조회 통계",
+        authentication_container.get_session_counters,
+        counters=frozenset({"issued", "revoked", "rejected", "store_hits", "store_misses", "purged"}),
+    )
+)
+
 # 라우터 등록
 app.include_router(kakao_oauth_router)
+app.include_router(kakao_admin_router)
+app.include_router(authentication_router)
+
+startup_profile.mark("app_constructed")
 
 
 @app.get("/")
@@ -38,6 +273,84 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/health/ready")
+async def readiness_check():
+    """준비 상태 엔드포인트 (워밍업 완료 전에는 503)"""
+    if _warmup_gate.ready:
+        return {"status": "ready"}
+
+    if _warmup_gate.done:
+        return FastJSONResponse(status_code=503, content={"status": "failed", "error": repr(_warmup_gate.error)})
+    return FastJSONResponse(status_code=503, content={"status": "warming_up"})
+
+
+@app.get("/health/event-loop")
+async def event_loop_stats():
+    """이벤트 루프 지연 통계 및 최근 블로킹 지점(스택) 보고"""
+    return {**_loop_monitor.stats(), "reports": _loop_monitor.reports()}
+
+
+@app.get("/health/settings")
+async def settings_stats():
+    """설정 스냅샷 버전 및 .env 변경 감시 통계 (설정값 자체는 노출하지 않는다)"""
+    return _settings_watcher.stats()
+
+
+@app.get("/health/startup")
+async def startup_report():
+    """기동 시간 프로파일 (단계별 시간, STARTUP_PROFILE=true이면 모듈별 import 시간)"""
+    return startup_profile.report(get_int_env("STARTUP_PROFILE_TOP", 20))
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus 텍스트 노출 형식 메트릭 엔드포인트"""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@app.get("/health/http-pool")
+async def http_pool_stats():
+    """공유 HTTP 커넥션 풀, DNS 캐시 및 커넥션 사전 준비 결과 엔드포인트"""
+    return get_http_pool_stats()
+
+
+@app.get("/health/caches")
+async def cache_stats():
+    """Kakao OAuth Service 캐시, OAuth state 저장소 및 공유 캐시 백엔드 통계 엔드포인트"""
+    return {
+        **kakao_authentication_container.get_service_stats("cache"),
+        "oauth_state": kakao_authentication_container.get_service_stats("oauth_state"),
+        "shared_backend": get_shared_cache_stats(),
+    }
+
+
+@app.get("/health/upstream")
+async def upstream_stats():
+    """Kakao upstream 지연, 적응형 타임아웃, hedging 통계 (동기 Service 사용 시 전용 스레드 풀 통계) 엔드포인트"""
+    executor_stats = kakao_authentication_container.get_service_stats("executor")
+    if executor_stats:
+        return {"sync_executor": executor_stats}
+    return kakao_authentication_container.get_service_stats("upstream")
+
+
+@app.get("/health/token-refresh")
+async def token_refresh_stats():
+    """Kakao 토큰 저장/선제 갱신 통계 엔드포인트"""
+    return await kakao_authentication_container.get_token_refresh_service().get_stats()
+
+
+@app.get("/health/login-audit")
+async def login_audit_stats():
+    """로그인 감사 로그 대기열/저장 통계 엔드포인트"""
+    return await kakao_authentication_container.get_login_audit_service().get_stats()
+
+
+@app.get("/health/sessions")
+async def session_stats():
+    """자체 세션 발급/조회 및 세션 캐시 통계 엔드포인트"""
+    return authentication_container.get_session_service().get_stats()
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=33333)
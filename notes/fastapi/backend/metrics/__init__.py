@@ -0,0 +1,4 @@
+from metrics.registry import REGISTRY, Counter, Gauge, Histogram, MetricsRegistry
+from metrics.middleware import MetricsMiddleware
+
+__all__ = ["REGISTRY", "Counter", "Gauge", "Histogram", "MetricsRegistry", "MetricsMiddleware"]
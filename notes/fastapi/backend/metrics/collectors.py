@@ -0,0 +1,41 @@
+from typing import Callable, Iterable
+
+from metrics.registry import CollectedFamily
+
+
+def stats_collector(
+    prefix: str,
+    help_text: str,
+    get_stats: Callable[[], dict],
+    label_name: str | None = None,
+    counters: frozenset[str] = frozenset(),
+) -> Callable[[], Iterable[CollectedFamily]]:
+    """
+    통계 dict를 메트릭으로 노출하는 collector를 만든다.
+
+    - label_name이 없으면 {지표: 값} 형태의 dict를 {prefix}_{지표}로 노출한다.
+    - label_name이 있으면 {라벨값: {지표: 값}} 형태를 {prefix}_{지표}{label_name="라벨값"}로 노출한다.
+    - counters에 포함된 지표는 누적 값이므로 {prefix}_{지표}_total 카운터로, 나머지는 게이지로 노출한다.
+    숫자가 아닌 값(None, 문자열)과 중첩 dict는 건너뛰며 불리언은 0/1로 노출한다.
+    """
+
+    def collect() -> Iterable[CollectedFamily]:
+        stats = get_stats()
+        grouped = stats.items() if label_name else [(None, stats)]
+        families: dict[tuple[str, str], list[tuple[dict[str, str], float]]] = {}
+
+        for label_value, values in grouped:
+            if not isinstance(values, dict):
+                continue
+            labels = {label_name: label_value} if label_name else {}
+            for key, value in values.items():
+                if isinstance(value, bool):
+                    value = int(value)
+                if not isinstance(value, (int, float)):
+                    continue
+                family = (f"{prefix}_{key}_total", "counter") if key in counters else (f"{prefix}_{key}", "gauge")
+                families.setdefault(family, []).append((labels, value))
+
+        return [(name, kind, help_text, samples) for (name, kind), samples in families.items()]
+
+    return collect
@@ -0,0 +1,57 @@
+import time
+
+from metrics.registry import REGISTRY, MetricsRegistry
+
+UNMATCHED_ROUTE = "<unmatched>"
+# 표준 메서드 외의 값은 클라이언트가 임의로 보낼 수 있으므로 하나의 라벨 값으로 묶는다.
+KNOWN_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "DELETE", "CONNECT", "OPTIONS", "TRACE", "PATCH"})
+OTHER_METHOD = "OTHER"
+
+
+class MetricsMiddleware:
+    """
+    요청 지연/진행 중 요청 수를 기록하는 순수 ASGI 미들웨어
+
+    라벨 값으로 실제 URL이 아닌 라우트 경로 템플릿과 표준 메서드(그 외는 OTHER)를 사용해
+    시계열 수가 라우트 수로 제한된다.
+    """
+
+    def __init__(self, app, registry: MetricsRegistry = REGISTRY):
+        self.app = app
+        self._duration = registry.histogram(
+            "http_request_duration_seconds",
+            "HTTP 요청 처리 시간(초)",
+            ("method", "route", "status"),
+        )
+        self._in_flight = registry.gauge(
+            "http_requests_in_flight",
+            "처리 중인 HTTP 요청 수",
+            ("method",),
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"] if scope["method"] in KNOWN_METHODS else OTHER_METHOD
+        in_flight = self._in_flight.labels(method)
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            in_flight.dec()
+            # 라우팅이 끝나면 Starlette가 scope["route"]에 매칭된 라우트를 기록한다.
+            route = scope.get("route")
+            route_path = getattr(route, "path", UNMATCHED_ROUTE)
+            self._duration.labels(method, route_path, status_code).observe(elapsed)
@@ -0,0 +1,219 @@
+import math
+import threading
+from bisect import bisect_left
+from typing import Callable, Iterable
+
+# 지연 시간(초) 히스토그램 기본 버킷
+DEFAULT_LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0,
+)
+
+# 수집 시점에 값을 계산하는 collector가 반환하는 형식: (이름, 타입, 설명, [(라벨, 값), ...])
+CollectedFamily = tuple[str, str, str, list[tuple[dict[str, str], float]]]
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+def _escape(value: object) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    """라벨별 하위 시계열을 미리 만들어 두고 재사용하는 메트릭 기반 클래스"""
+
+    type_name = ""
+
+    def __init__(self, name: str, help_text: str, label_names: tuple[str, ...] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._children: dict[tuple, "_Metric"] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values) -> "_Metric":
+        """
+        라벨 값에 해당하는 하위 시계열을 반환한다.
+
+        최초 호출 시에만 생성되며 이후에는 같은 객체를 돌려준다. 요청 경로에서는
+        반환값을 모듈/인스턴스 변수에 보관해 두고 재사용하는 것을 권장한다.
+        """
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.get(values)
+                if child is None:
+                    child = self._new_child()
+                    self._children[values] = child
+        return child
+
+    def _new_child(self) -> "_Metric":
+        return type(self)(self.name, self.help_text)
+
+    def _series(self) -> Iterable[tuple[tuple, "_Metric"]]:
+        if self.label_names:
+            return list(self._children.items())
+        return [((), self)]
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.type_name}"]
+        for values, child in self._series():
+            lines.extend(child._render_samples(self.label_names, values))
+        return lines
+
+    def _render_samples(self, label_names: tuple[str, ...], values: tuple) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, help_text: str, label_names: tuple[str, ...] = ()):
+        super().__init__(name, help_text, label_names)
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def _render_samples(self, label_names, values):
+        return [f"{self.name}{_format_labels(label_names, values)} {_format_value(self.value)}"]
+
+
+class Gauge(_Metric):
+    """증감 가능한 게이지"""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, help_text: str, label_names: tuple[str, ...] = ()):
+        super().__init__(name, help_text, label_names)
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def _render_samples(self, label_names, values):
+        return [f"{self.name}{_format_labels(label_names, values)} {_format_value(self.value)}"]
+
+
+class Histogram(_Metric):
+    """
+    고정 버킷 히스토그램
+
+    버킷 카운트 배열을 생성 시 미리 할당하며, observe()는 이진 탐색 후 한 칸만 증가시킨다.
+    누적(cumulative) 값은 수집 시점에 계산한다.
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, help_text, label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def _new_child(self) -> "Histogram":
+        return Histogram(self.name, self.help_text, buckets=self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def _render_samples(self, label_names, values):
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets + (math.inf,), self._counts):
+            cumulative += bucket_count
+            le = f'le="{_format_value(bound)}"'
+            lines.append(f"{self.name}_bucket{_format_labels(label_names, values, le)} {cumulative}")
+        lines.append(f"{self.name}_sum{_format_labels(label_names, values)} {_format_value(self.sum)}")
+        lines.append(f"{self.name}_count{_format_labels(label_names, values)} {self.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """메트릭 등록소 및 텍스트 노출 형식(Prometheus exposition format) 렌더러"""
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], Iterable[CollectedFamily]]] = []
+
+    def _register(self, metric: _Metric) -> _Metric:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            if type(existing) is not type(metric) or existing.label_names != metric.label_names:
+                raise ValueError(f"이미 다른 형식으로 등록된 메트릭입니다: {metric.name}")
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help_text: str, label_names: tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, help_text, label_names))
+
+    def gauge(self, name: str, help_text: str, label_names: tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge(name, help_text, label_names))
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, help_text, label_names, buckets))
+
+    def register_collector(self, collector: Callable[[], Iterable[CollectedFamily]]) -> None:
+        """수집 시점에 값을 계산하는 collector를 등록한다. (풀/캐시 통계 등)"""
+        self._collectors.append(collector)
+
+    def unregister_collector(self, collector: Callable[[], Iterable[CollectedFamily]]) -> None:
+        if collector in self._collectors:
+            self._collectors.remove(collector)
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+
+        for collector in self._collectors:
+            for name, type_name, help_text, samples in collector():
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {type_name}")
+                for labels, value in samples:
+                    label_names = tuple(labels)
+                    label_values = tuple(labels.values())
+                    lines.append(f"{name}{_format_labels(label_names, label_values)} {_format_value(float(value))}")
+
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
@@ -0,0 +1,47 @@
+from metrics.registry import REGISTRY, Histogram, MetricsRegistry
+
+_OUTCOMES = ("1xx", "2xx", "3xx", "4xx", "5xx")
+
+
+class UpstreamMetrics:
+    """
+    외부(upstream) API 호출 지연 히스토그램
+
+    엔드포인트별로 결과(상태 코드 계열/timeout/error)마다 하위 시계열을 미리 만들어 두어
+    요청 경로에서는 라벨 조회 없이 바로 observe()만 호출한다.
+    """
+
+    def __init__(self, endpoint: str, registry: MetricsRegistry = REGISTRY):
+        histogram = registry.histogram(
+            "kakao_upstream_request_duration_seconds",
+            "Kakao upstream API 호출 시간(초)",
+            ("endpoint", "outcome"),
+        )
+        self._by_status_class: list[Histogram] = [histogram.labels(endpoint, outcome) for outcome in _OUTCOMES]
+        self._timeout = histogram.labels(endpoint, "timeout")
+        self._error = histogram.labels(endpoint, "error")
+
+        self.attempts = registry.counter(
+            "kakao_upstream_attempts_total", "Kakao upstream 호출 시도 수 (재시도 포함)", ("endpoint",)
+        ).labels(endpoint)
+        self.retries = registry.counter(
+            "kakao_upstream_retries_total", "Kakao upstream 재시도 수", ("endpoint",)
+        ).labels(endpoint)
+        self.retry_budget_exhausted = registry.counter(
+            "kakao_upstream_retry_budget_exhausted_total",
+            "재시도 예산 부족으로 재시도하지 않은 횟수",
+            ("endpoint",),
+        ).labels(endpoint)
+
+    def observe(self, status_code: int, seconds: float) -> None:
+        index = status_code // 100 - 1
+        if 0 <= index < len(self._by_status_class):
+            self._by_status_class[index].observe(seconds)
+        else:
+            self._error.observe(seconds)
+
+    def observe_timeout(self, seconds: float) -> None:
+        self._timeout.observe(seconds)
+
+    def observe_error(self, seconds: float) -> None:
+        self._error.observe(seconds)
@@ -0,0 +1,21 @@
+import pytest
+
+from config import settings as settings_module
+from config.settings import Settings
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def use_settings(monkeypatch):
+    """설정 스냅샷을 주어진 값으로 교체한다. (테스트가 끝나면 원래 스냅샷으로 돌아간다)"""
+
+    def apply(**values: str) -> Settings:
+        settings = Settings.parse(values, version=1)
+        monkeypatch.setattr(settings_module, "_current", settings)
+        return settings
+
+    return apply
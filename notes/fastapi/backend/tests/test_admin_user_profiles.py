@@ -0,0 +1,68 @@
+import json
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from kakao_authentication.controller import kakao_admin_controller, kakao_oauth_controller
+from kakao_authentication.schemas.kakao_oauth import KakaoUserInfoResponse
+from kakao_authentication.service.thread_pool_kakao_oauth_service import ThreadPoolKakaoOAuthService
+from tests.test_thread_pool_kakao_oauth_service import SyncService
+
+USER_PROFILES = "/kakao-authentication/admin/user-profiles"
+ADMIN = {"X-Admin-Token": "admin-token"}
+
+
+class ProfileSyncService(SyncService):
+    def get_user_profile(self, user_id: int) -> KakaoUserInfoResponse:
+        if user_id == 404:
+            raise HTTPException(status_code=404, detail="존재하지 않는 회원번호입니다.")
+        return KakaoUserInfoResponse(id=user_id, nickname=f"user-{user_id}")
+
+
+def _client(sync_service: SyncService) -> TestClient:
+    service = ThreadPoolKakaoOAuthService(sync_service)
+    app = FastAPI()
+    app.include_router(kakao_admin_controller.router)
+    app.dependency_overrides[kakao_oauth_controller.get_kakao_oauth_service] = lambda: service
+    return TestClient(app)
+
+
+@pytest.fixture
+def client(use_settings):
+    use_settings(ADMIN_API_TOKEN="admin-token", KAKAO_BULK_PROFILE_MAX_IDS="4")
+    return _client(ProfileSyncService())
+
+
+def test_streams_one_ndjson_line_per_user(client):
+    response = client.post(USER_PROFILES, json={"user_ids": [1, 404, 2, 1]}, headers=ADMIN)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    by_id = {line["user_id"]: line for line in lines}
+    assert sorted(by_id) == [1, 2, 404]
+    assert len(lines) == 3
+    assert by_id[1]["user_info"]["nickname"] == "user-1"
+    assert by_id[404] == {
+        "user_id": 404, "user_info": None, "status_code": 404, "error": "존재하지 않는 회원번호입니다.",
+    }
+
+
+def test_admin_token_is_required(client, use_settings):
+    assert client.post(USER_PROFILES, json={"user_ids": [1]}).status_code == 401
+    assert client.post(USER_PROFILES, json={"user_ids": [1]}, headers={"X-Admin-Token": "wrong"}).status_code == 401
+
+    use_settings(KAKAO_BULK_PROFILE_MAX_IDS="4")
+    assert client.post(USER_PROFILES, json={"user_ids": [1]}, headers=ADMIN).status_code == 403
+
+
+def test_too_many_ids_are_rejected(client):
+    assert client.post(USER_PROFILES, json={"user_ids": [1, 2, 3, 4, 5]}, headers=ADMIN).status_code == 400
+
+
+def test_unsupported_service_returns_501(use_settings):
+    use_settings(ADMIN_API_TOKEN="admin-token")
+    client = _client(SyncService())
+
+    assert client.post(USER_PROFILES, json={"user_ids": [1]}, headers=ADMIN).status_code == 501
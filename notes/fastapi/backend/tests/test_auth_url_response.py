@@ -0,0 +1,65 @@
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from infrastructure.precomputed_response import etag_matches
+from kakao_authentication.controller import kakao_oauth_controller
+from kakao_authentication.service.kakao_oauth_service_impl import KakaoOAuthServiceImpl
+
+AUTH_URL = "/kakao-authentication/request-oauth-link"
+
+
+@pytest.fixture
+def client(use_settings):
+    use_settings(KAKAO_CLIENT_ID="client", KAKAO_REDIRECT_URI="http://localhost/callback")
+    service = KakaoOAuthServiceImpl()
+    app = FastAPI()
+    app.include_router(kakao_oauth_controller.router)
+    app.dependency_overrides[kakao_oauth_controller.get_kakao_oauth_service] = lambda: service
+
+    with TestClient(app) as test_client:
+        yield test_client, service
+
+
+def test_if_none_match_returns_304(client):
+    test_client, service = client
+
+    first = test_client.get(AUTH_URL)
+    etag = first.headers["ETag"]
+
+    assert first.status_code == 200
+    assert first.headers["Cache-Control"].startswith("public")
+    assert first.json()["client_id"] == "client"
+
+    cached = test_client.get(AUTH_URL, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["ETag"] == etag
+
+    assert test_client.get(AUTH_URL, headers={"If-None-Match": f"W/{etag}"}).status_code == 304
+    assert test_client.get(AUTH_URL, headers={"If-None-Match": '"other"'}).status_code == 200
+
+
+def test_config_change_invalidates_cached_response(client, use_settings):
+    """client_id / redirect_uri가 바뀌면 이전 ETag로 304를 받지 않고 새 URL을 받는다."""
+    test_client, service = client
+    etag = test_client.get(AUTH_URL).headers["ETag"]
+
+    use_settings(KAKAO_CLIENT_ID="client", KAKAO_REDIRECT_URI="http://localhost/new-callback")
+    assert service.reload_config()
+
+    response = test_client.get(AUTH_URL, headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    query = parse_qs(urlsplit(response.json()["auth_url"]).query)
+    assert query["redirect_uri"] == ["http://localhost/new-callback"]
+
+
+def test_etag_matches_wildcard_and_lists():
+    assert etag_matches("*", '"a"')
+    assert etag_matches('"b", "a"', '"a"')
+    assert not etag_matches(None, '"a"')
+    assert not etag_matches('"b"', '"a"')
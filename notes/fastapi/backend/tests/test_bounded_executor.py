@@ -0,0 +1,81 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from infrastructure.bounded_executor import BoundedThreadPool, ExecutorSaturated
+from kakao_authentication.service.thread_pool_kakao_oauth_service import ThreadPoolKakaoOAuthService
+from tests.test_thread_pool_kakao_oauth_service import SyncService
+
+
+@pytest.fixture
+def release():
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+async def _fill(executor: BoundedThreadPool, release: threading.Event, count: int) -> list[asyncio.Task]:
+    tasks = [asyncio.ensure_future(executor.run(release.wait)) for _ in range(count)]
+    await asyncio.sleep(0.02)
+    return tasks
+
+
+@pytest.mark.anyio
+async def test_queue_cap_rejects_immediately(release):
+    executor = BoundedThreadPool("test-queue", max_workers=1, max_queue=1, max_wait=5.0)
+    tasks = await _fill(executor, release, 2)
+
+    assert executor.stats()["in_flight"] == 1
+    assert executor.stats()["queue_depth"] == 1
+    with pytest.raises(ExecutorSaturated) as exc_info:
+        await executor.run(release.wait)
+    assert exc_info.value.reason == "queue_full"
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert executor.stats()["completed"] == 2
+    executor.shutdown()
+
+
+@pytest.mark.anyio
+async def test_max_wait_rejects_with_retry_after(release):
+    executor = BoundedThreadPool("test-wait", max_workers=1, max_queue=4, max_wait=0.05)
+    tasks = await _fill(executor, release, 1)
+
+    with pytest.raises(ExecutorSaturated) as exc_info:
+        await executor.run(release.wait)
+    assert exc_info.value.reason == "timeout"
+    assert exc_info.value.retry_after_header == "1"
+    assert executor.stats()["queue_depth"] == 0
+
+    release.set()
+    await asyncio.gather(*tasks)
+    executor.shutdown()
+
+
+class BlockingSyncService(SyncService):
+    def __init__(self, release: threading.Event):
+        self._release = release
+
+    def get_user_info(self, access_token: str):
+        self._release.wait()
+        return super().get_user_info(access_token)
+
+
+@pytest.mark.anyio
+async def test_saturated_adapter_returns_503(release):
+    executor = BoundedThreadPool("test-adapter", max_workers=1, max_queue=0, max_wait=5.0)
+    service = ThreadPoolKakaoOAuthService(BlockingSyncService(release), executor)
+    pending = asyncio.ensure_future(service.get_user_info("access"))
+    await asyncio.sleep(0.02)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.get_user_info("access")
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.headers["Retry-After"] == "5"
+
+    release.set()
+    assert (await pending).id == 1
+    await service.stop()
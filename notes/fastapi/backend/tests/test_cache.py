@@ -0,0 +1,154 @@
+import asyncio
+import time
+
+import pytest
+
+from infrastructure.cache.cache import Cache
+from infrastructure.cache.encryption import encrypted_codec
+from infrastructure.cache.sqlite_cache_backend import SQLiteCacheBackend
+from infrastructure.cache.ttl_lru_cache import TTLLRUCache
+from kakao_authentication.service import kakao_oauth_service_impl
+
+
+def _cache(backend: SQLiteCacheBackend, default_ttl: float = 60.0) -> Cache[str]:
+    return Cache(
+        "test",
+        local=TTLLRUCache(max_entries=100, max_bytes=1024 * 1024, default_ttl=default_ttl),
+        encode=str.encode,
+        decode=bytes.decode,
+        default_ttl=default_ttl,
+        shared=backend,
+    )
+
+
+@pytest.fixture
+async def backend(tmp_path):
+    backend = SQLiteCacheBackend(tmp_path / "cache.sqlite3")
+    yield backend
+    await backend.close()
+
+
+@pytest.mark.anyio
+async def test_shared_backend_returns_remaining_ttl(backend):
+    await backend.set("key", b"value", ttl=10.0)
+
+    value, remaining = await backend.get_with_ttl("key")
+    assert value == b"value"
+    assert 9.0 < remaining <= 10.0
+    assert await backend.get("key") == b"value"
+
+
+@pytest.mark.anyio
+async def test_shared_hit_does_not_outlive_shared_entry(backend):
+    """공유 계층 적중을 로컬에 채울 때 공유 항목의 남은 TTL을 넘기지 않는다."""
+    writer, reader = _cache(backend), _cache(backend)
+    await writer.set("key", "value", ttl=0.2)
+
+    assert await reader.get("key") == "value"
+    assert reader.stats()["shared_hits"] == 1
+
+    await asyncio.sleep(0.3)
+    assert await reader.get("key") is None
+
+
+@pytest.mark.anyio
+async def test_get_or_compute_runs_once_across_caches(backend):
+    first, second = _cache(backend), _cache(backend)
+    calls = 0
+
+    async def compute() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "value"
+
+    results = await asyncio.gather(
+        *(first.get_or_compute("key", compute) for _ in range(5)),
+        *(second.get_or_compute("key", compute) for _ in range(5)),
+    )
+
+    assert results == ["value"] * 10
+    assert calls == 1
+
+
+@pytest.mark.anyio
+async def test_failed_compute_is_not_cached(backend):
+    cache = _cache(backend)
+
+    async def fail() -> str:
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_compute("key", fail)
+    assert await cache.get("key") is None
+
+
+def test_local_ttl_is_capped_by_default():
+    local: TTLLRUCache[str] = TTLLRUCache(max_entries=10, max_bytes=1024, default_ttl=0.05)
+    local.set("key", "value", ttl=60.0)
+    time.sleep(0.1)
+    assert local.get("key") is None
+
+
+def _encrypted_cache(backend: SQLiteCacheBackend, secret: str) -> Cache[str]:
+    encode, decode = encrypted_codec(str.encode, bytes.decode, secret, "test")
+    return Cache(
+        "test",
+        local=TTLLRUCache(max_entries=100, max_bytes=1024 * 1024, default_ttl=60.0),
+        encode=encode,
+        decode=decode,
+        default_ttl=60.0,
+        shared=backend,
+    )
+
+
+def _raw_values(backend: SQLiteCacheBackend) -> list[bytes]:
+    return [row[0] for row in backend._conn.execute("SELECT value FROM cache_entries")]
+
+
+@pytest.mark.anyio
+async def test_encrypted_values_are_not_stored_in_plaintext(backend):
+    await _encrypted_cache(backend, "secret").set("k", "refresh-token-value")
+
+    assert all(b"refresh-token-value" not in value for value in _raw_values(backend))
+    assert await _encrypted_cache(backend, "secret").get("k") == "refresh-token-value"
+
+
+@pytest.mark.anyio
+async def test_value_encrypted_with_other_key_is_a_miss(backend):
+    await _encrypted_cache(backend, "old-secret").set("k", "v")
+
+    assert await _encrypted_cache(backend, "new-secret").get("k") is None
+
+
+@pytest.mark.anyio
+async def test_expired_row_is_deleted_on_read(backend):
+    await backend.set("k", b"v", 0.01)
+    await asyncio.sleep(0.02)
+
+    assert await backend.get("k") is None
+    assert _raw_values(backend) == []
+
+
+@pytest.mark.anyio
+async def test_expired_rows_are_purged_on_interval(tmp_path):
+    backend = SQLiteCacheBackend(tmp_path / "cache.sqlite3", purge_interval=0.05)
+    await backend.set("a", b"v", 0.01)
+    await asyncio.sleep(0.06)
+
+    # 다른 키를 읽기만 해도 주기가 지나면 만료된 행이 정리된다.
+    assert await backend.get("b") is None
+    assert _raw_values(backend) == []
+    await backend.close()
+
+
+@pytest.mark.anyio
+async def test_token_exchange_is_not_shared_without_secret(use_settings, monkeypatch, backend):
+    monkeypatch.setattr(kakao_oauth_service_impl, "get_shared_cache_backend", lambda: backend)
+    use_settings(KAKAO_CLIENT_ID="client", KAKAO_REDIRECT_URI="http://localhost/callback")
+
+    assert not kakao_oauth_service_impl.KakaoOAuthServiceImpl().get_cache_stats()["token_exchange"]["shared"]
+
+    use_settings(KAKAO_CLIENT_ID="client", KAKAO_REDIRECT_URI="http://localhost/callback", CACHE_SECRET_KEY="s")
+
+    assert kakao_oauth_service_impl.KakaoOAuthServiceImpl().get_cache_stats()["token_exchange"]["shared"]
@@ -0,0 +1,65 @@
+import pytest
+
+from kakao_authentication.container import KakaoAuthenticationContainer
+from kakao_authentication.exceptions import KakaoOAuthConfigurationError
+from kakao_authentication.schemas.kakao_oauth import KakaoAuthUrlResponse, KakaoTokenResponse, KakaoUserInfoResponse
+from kakao_authentication.service import KakaoOAuthServiceInterface
+
+
+class FakeOAuthService(KakaoOAuthServiceInterface):
+    def generate_auth_url(self) -> KakaoAuthUrlResponse:
+        raise NotImplementedError
+
+    async def request_access_token(self, code: str, state: str | None = None) -> KakaoTokenResponse:
+        raise NotImplementedError
+
+    async def get_user_info(self, access_token: str, expires_in: int | None = None) -> KakaoUserInfoResponse:
+        raise NotImplementedError
+
+    def get_stats(self, group: str) -> dict:
+        return {"calls": 1} if group == "cache" else {}
+
+
+def test_init_fails_fast_without_required_settings(use_settings):
+    use_settings()
+    container = KakaoAuthenticationContainer()
+
+    with pytest.raises(KakaoOAuthConfigurationError):
+        container.init()
+    assert container._service is None
+
+
+def test_dependent_services_use_the_override(use_settings):
+    """override 중에는 필수 설정이 없어도 실제 구현체를 만들지 않고 주입한 구현체를 쓴다. (회귀)"""
+    use_settings(LOGIN_AUDIT_ENABLED="false")
+    container = KakaoAuthenticationContainer()
+    fake = FakeOAuthService()
+
+    with container.override(fake):
+        assert container.get_token_refresh_service()._oauth_service is fake
+        assert container.get_login_audit_service().get_counters()["queued"] == 0
+        assert container.get_service_stats("cache") == {"calls": 1}
+        assert container.get_service_stats("jwks") == {}
+
+    assert container._service is None
+    assert container._token_refresh_service is None
+    assert container.get_service_stats("cache") == {}
+
+
+@pytest.mark.anyio
+async def test_thread_pool_service_stats_and_shutdown(use_settings):
+    use_settings(
+        KAKAO_OAUTH_SERVICE_IMPL="tests.test_thread_pool_kakao_oauth_service:SyncService",
+        LOGIN_AUDIT_ENABLED="false",
+    )
+    container = KakaoAuthenticationContainer()
+
+    container.init()
+    container.start()
+
+    assert container.get_service_stats("executor")["max_workers"] > 0
+    assert container.get_service_stats("cache") == {}
+    assert container.get_upstream_urls() == []
+
+    await container.shutdown()
+    assert container.get_service_stats("executor") == {}
@@ -0,0 +1,105 @@
+import asyncio
+import time
+
+import httpcore
+import httpx
+import pytest
+
+from infrastructure.dns_cache import CachingNetworkBackend, DNSCache
+from infrastructure.pooled_transport import PooledTransport
+
+
+class FakeDNSCache(DNSCache):
+    def __init__(self, results: list, **kwargs):
+        super().__init__(**kwargs)
+        self._results = results
+        self.lookups = 0
+
+    async def _lookup(self, host: str, port: int) -> list[str]:
+        self.lookups += 1
+        await asyncio.sleep(0.01)
+        result = self._results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class TimeoutBackend(httpcore.AsyncNetworkBackend):
+    """주어진 timeout을 모두 기다린 뒤 ConnectTimeout을 내는 백엔드"""
+
+    def __init__(self):
+        self.attempts: list[tuple[str, float | None]] = []
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        self.attempts.append((host, timeout))
+        await asyncio.sleep(timeout)
+        raise httpcore.ConnectTimeout(host)
+
+
+@pytest.mark.anyio
+async def test_concurrent_lookups_share_one_query():
+    cache = FakeDNSCache([["10.0.0.1"]])
+
+    results = await asyncio.gather(*(cache.resolve("kauth.kakao.com", 443) for _ in range(5)))
+
+    assert results == [["10.0.0.1"]] * 5
+    assert cache.lookups == 1
+    assert await cache.resolve("kauth.kakao.com", 443) == ["10.0.0.1"]
+    assert cache.hits == 1
+
+
+@pytest.mark.anyio
+async def test_failed_lookup_serves_stale_entry():
+    cache = FakeDNSCache([["10.0.0.1"], OSError("down")], ttl=0.0, stale_ttl=60.0)
+
+    await cache.resolve("kauth.kakao.com", 443)
+
+    assert await cache.resolve("kauth.kakao.com", 443) == ["10.0.0.1"]
+    assert cache.errors == 1
+    assert cache.stale_served == 1
+
+
+@pytest.mark.anyio
+async def test_connect_attempts_share_one_deadline():
+    cache = FakeDNSCache([["10.0.0.1", "10.0.0.2", "10.0.0.3"]])
+    inner = TimeoutBackend()
+    backend = CachingNetworkBackend(inner, cache)
+
+    started = time.monotonic()
+    with pytest.raises(httpcore.ConnectTimeout):
+        await backend.connect_tcp("kauth.kakao.com", 443, timeout=0.2)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.35
+    assert inner.attempts[0][1] < 0.2
+    # 실패한 호스트의 조회 결과는 버린다.
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.anyio
+async def test_pooled_transport_uses_dns_cache_backend():
+    cache = FakeDNSCache([["127.0.0.1"]])
+    mock = httpcore.AsyncMockBackend([b"HTTP/1.1 200 OK\r\n", b"Content-Length: 2\r\n", b"\r\n", b"ok"])
+    transport = PooledTransport(httpx.Limits(), network_backend=CachingNetworkBackend(mock, cache))
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        response = await client.get("http://kauth.kakao.com/")
+        stats = transport.stats()
+
+    assert response.text == "ok"
+    assert cache.lookups == 1
+    assert stats["connections"] == 1
+    assert stats["idle_connections"] == 1
+    assert stats["requests_in_flight"] == 0
+
+
+@pytest.mark.anyio
+async def test_pooled_transport_maps_httpcore_errors():
+    cache = FakeDNSCache([OSError("no such host")])
+    transport = PooledTransport(httpx.Limits(), network_backend=CachingNetworkBackend(TimeoutBackend(), cache))
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        with pytest.raises(httpx.ConnectError):
+            await client.get("http://kauth.kakao.com/")
+
+    assert transport.stats()["requests_in_flight"] == 0
@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+
+from infrastructure.hedging import HedgedRequester
+from infrastructure.latency_tracker import LatencyTracker
+
+
+def test_delay_uses_initial_delay_until_window_fills():
+    tracker = LatencyTracker(min_samples=10)
+    hedger = HedgedRequester(tracker, min_delay=0.02, max_delay=1.0, initial_delay=0.2)
+
+    assert hedger.delay() == 0.2
+
+    for _ in range(10):
+        tracker.record(0.05)
+    assert hedger.delay() == 0.05
+
+
+def test_initial_delay_is_clamped():
+    tracker = LatencyTracker(min_samples=10)
+
+    assert HedgedRequester(tracker, min_delay=0.02, max_delay=1.0, initial_delay=5.0).delay() == 1.0
+    assert HedgedRequester(tracker, min_delay=0.02, max_delay=1.0, initial_delay=0.0).delay() == 0.02
+
+
+@pytest.mark.anyio
+async def test_hedge_fires_after_initial_delay_without_samples():
+    """기동 직후에도 max_delay까지 기다리지 않고 initial_delay 뒤에 두 번째 요청을 보낸다. (회귀)"""
+    hedger = HedgedRequester(LatencyTracker(min_samples=10), min_delay=0.01, max_delay=5.0, initial_delay=0.01)
+    calls = 0
+
+    async def fetch() -> int:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(5)
+        return calls
+
+    assert await asyncio.wait_for(hedger.run(fetch), timeout=1.0) == 2
+    assert hedger.hedges_fired == hedger.hedge_wins == 1
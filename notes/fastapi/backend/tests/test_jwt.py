@@ -0,0 +1,135 @@
+import asyncio
+
+import pytest
+
+from infrastructure.jwks import JWKSCache, JWKSUnavailableError
+from infrastructure.jwt import (
+    JWTError,
+    base64url_decode,
+    base64url_encode,
+    decode_jwt,
+    rsa_public_key_from_jwk,
+    verify_rs256,
+)
+from kakao_authentication.service.kakao_oauth_service_impl import KakaoOAuthServiceImpl
+from kakao_mock_server.signing import RSASigningKey, build_id_token_claims
+
+
+@pytest.fixture(scope="module")
+def signing_key() -> RSASigningKey:
+    return RSASigningKey.generate()
+
+
+def _claims() -> dict:
+    return build_id_token_claims(
+        "https://kauth.kakao.com", "client", 1, "nick", "a@example.com", "http://img", expires_in=60
+    )
+
+
+def test_signed_token_verifies(signing_key):
+    token = decode_jwt(signing_key.sign_jwt(_claims()))
+    key = rsa_public_key_from_jwk(signing_key.to_jwk())
+
+    assert token.header["kid"] == signing_key.kid
+    assert token.claims["sub"] == "1"
+    assert verify_rs256(token.signing_input, token.signature, key)
+
+
+def test_tampered_claims_fail_verification(signing_key):
+    header, _, signature = signing_key.sign_jwt(_claims()).split(".")
+    forged_claims = base64url_encode(b'{"sub":"2"}')
+    token = decode_jwt(f"{header}.{forged_claims}.{signature}")
+
+    assert not verify_rs256(token.signing_input, token.signature, rsa_public_key_from_jwk(signing_key.to_jwk()))
+
+
+def test_other_key_fails_verification(signing_key):
+    token = decode_jwt(signing_key.sign_jwt(_claims()))
+    other = rsa_public_key_from_jwk(RSASigningKey.generate().to_jwk())
+
+    assert not verify_rs256(token.signing_input, token.signature, other)
+
+
+def test_truncated_signature_fails_verification(signing_key):
+    token = decode_jwt(signing_key.sign_jwt(_claims()))
+    key = rsa_public_key_from_jwk(signing_key.to_jwk())
+
+    assert not verify_rs256(token.signing_input, token.signature[:-1], key)
+
+
+@pytest.mark.parametrize("value", ["", "a.b", "a.b.c.d", "e30.bm90LWpzb24.c2ln"])
+def test_malformed_token_is_rejected(value):
+    with pytest.raises(JWTError):
+        decode_jwt(value)
+
+
+def test_non_rsa_jwk_is_rejected():
+    with pytest.raises(JWTError):
+        rsa_public_key_from_jwk({"kty": "EC", "crv": "P-256"})
+    with pytest.raises(JWTError):
+        rsa_public_key_from_jwk({"kty": "RSA", "n": base64url_encode(b"\x01")})
+
+
+def test_base64url_roundtrip():
+    assert base64url_decode(base64url_encode(b"\xff\xfe\x00")) == b"\xff\xfe\x00"
+
+
+@pytest.mark.anyio
+async def test_jwks_cache_refetches_unknown_kid_after_min_interval(signing_key):
+    keys = [signing_key]
+    fetches = 0
+
+    async def fetch() -> dict:
+        nonlocal fetches
+        fetches += 1
+        return {"keys": [key.to_jwk() for key in keys]}
+
+    now = [0.0]
+    cache = JWKSCache(fetch, min_refresh_interval=60.0, clock=lambda: now[0])
+    await cache.get_key(signing_key.kid)
+    assert fetches == 1
+
+    rotated = RSASigningKey.generate()
+    keys.append(rotated)
+    with pytest.raises(JWTError):
+        await cache.get_key(rotated.kid)
+    assert fetches == 1
+
+    now[0] += 60
+    await cache.get_key(rotated.kid)
+    assert fetches == 2
+
+    with pytest.raises(JWTError):
+        await cache.get_key("unknown")
+    assert fetches == 2
+
+
+@pytest.mark.anyio
+async def test_jwks_unavailable():
+    async def fetch() -> dict:
+        raise OSError("down")
+
+    with pytest.raises(JWKSUnavailableError):
+        await JWKSCache(fetch).get_key("kid")
+
+
+@pytest.mark.anyio
+async def test_reload_config_starts_and_stops_jwks_refresher(use_settings):
+    base = {"KAKAO_CLIENT_ID": "client", "KAKAO_REDIRECT_URI": "http://localhost/callback"}
+    use_settings(**base)
+    service = KakaoOAuthServiceImpl()
+    service.start()
+    assert service._jwks._task is None
+
+    use_settings(**base, KAKAO_OIDC_ENABLED="true")
+    assert service.reload_config()
+    task = service._jwks._task
+    assert task is not None and not task.done()
+
+    use_settings(**base)
+    assert service.reload_config()
+    assert service._jwks._task is None
+    await asyncio.sleep(0)
+    assert task.cancelled()
+
+    await service.stop()
@@ -0,0 +1,147 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from authentication.controller.authentication_controller import router as authentication_router
+from authentication.dependencies import get_session_service
+from authentication.repository import SQLiteSessionStore
+from authentication.service import SessionConfig, SessionService
+from kakao_authentication.controller import kakao_oauth_controller
+from kakao_authentication.repository import InMemoryKakaoTokenStore, LoginAuditRecord, LoginAuditStoreInterface
+from kakao_authentication.schemas.kakao_oauth import KakaoTokenResponse, KakaoUserInfoResponse
+from kakao_authentication.service.kakao_token_refresh_service import (
+    KakaoTokenRefreshConfig,
+    KakaoTokenRefreshService,
+)
+from kakao_authentication.service.login_audit_service import LoginAuditConfig, LoginAuditService
+
+CALLBACK = "/kakao-authentication/request-access-token-after-redirection"
+
+
+class FakeOAuthService:
+    """인가 코드별 교환 결과를 재사용하는 Service (토큰 교환 중복 제거 캐시와 같은 동작)"""
+
+    oidc_enabled = False
+
+    def __init__(self):
+        self.exchanges = 0
+        self._tokens: dict[str, KakaoTokenResponse] = {}
+
+    async def request_access_token(self, code: str, state: str | None = None) -> KakaoTokenResponse:
+        if code not in self._tokens:
+            self.exchanges += 1
+            self._tokens[code] = KakaoTokenResponse(
+                access_token=f"access-{code}",
+                token_type="bearer",
+                refresh_token=f"refresh-{code}",
+                expires_in=21599,
+                id_token=f"id-token-{code}",
+            )
+        return self._tokens[code]
+
+    async def get_user_info(self, access_token: str, expires_in: int | None = None) -> KakaoUserInfoResponse:
+        return KakaoUserInfoResponse(id=42, nickname="nick", email="nick@example.com", profile_image_url=None)
+
+
+class MemoryAuditStore(LoginAuditStoreInterface):
+    def __init__(self):
+        self.records: list[LoginAuditRecord] = []
+
+    async def write_batch(self, records: list[LoginAuditRecord]) -> None:
+        self.records.extend(records)
+
+    async def count(self) -> int:
+        return len(self.records)
+
+
+@pytest.fixture
+def client(use_settings, tmp_path):
+    # OIDC 설정을 켜도 OIDC를 지원하지 않는 Service는 사용자 정보 API로 사용자를 확인해야 한다.
+    use_settings(KAKAO_CLIENT_ID="client", KAKAO_REDIRECT_URI="http://localhost/callback", KAKAO_OIDC_ENABLED="true")
+    oauth = FakeOAuthService()
+    token_store = InMemoryKakaoTokenStore()
+    audit_store = MemoryAuditStore()
+    session_service = SessionService(
+        SQLiteSessionStore(tmp_path / "sessions.sqlite3"),
+        SessionConfig(secret_key="secret", purge_interval=0),
+    )
+    audit_service = LoginAuditService(audit_store, LoginAuditConfig(flush_interval=0.0))
+    refresh_service = KakaoTokenRefreshService(token_store, oauth, KakaoTokenRefreshConfig(enabled=False))
+
+    app = FastAPI()
+    app.include_router(kakao_oauth_controller.router)
+    app.include_router(authentication_router)
+    app.dependency_overrides.update({
+        kakao_oauth_controller.get_kakao_oauth_service: lambda: oauth,
+        kakao_oauth_controller.get_kakao_token_refresh_service: lambda: refresh_service,
+        kakao_oauth_controller.get_login_audit_service: lambda: audit_service,
+        get_session_service: lambda: session_service,
+    })
+
+    with TestClient(app) as test_client:
+        test_client.portal.call(audit_service.start)
+        yield test_client, oauth, session_service, audit_service, audit_store, token_store
+        test_client.portal.call(audit_service.stop)
+        test_client.portal.call(session_service.stop)
+
+
+def test_callback_issues_session_and_audit(client):
+    test_client, oauth, session_service, audit_service, audit_store, token_store = client
+
+    response = test_client.get(CALLBACK, params={"code": "code-1"})
+
+    assert response.status_code == 200
+    assert response.json()["user_info"]["id"] == 42
+    assert test_client.get("/authentication/me").json()["user_id"] == 42
+    assert test_client.portal.call(token_store.get, 42).access_token == "access-code-1"
+    test_client.portal.call(audit_service.stop)
+    assert [record.user_id for record in audit_store.records] == [42]
+
+
+def test_duplicate_callback_reuses_session_and_audits_once(client):
+    """중복 콜백은 같은 세션을 받고 세션/감사 기록은 한 번만 만들어진다. (회귀)"""
+    test_client, oauth, session_service, audit_service, audit_store, token_store = client
+
+    first = test_client.get(CALLBACK, params={"code": "code-1"})
+    second = test_client.get(CALLBACK, params={"code": "code-1"})
+
+    assert first.status_code == second.status_code == 200
+    assert first.cookies["session"] == second.cookies["session"]
+    assert oauth.exchanges == 1
+    assert session_service.get_counters()["issued"] == 1
+    assert audit_service.get_counters()["queued"] == 1
+    test_client.portal.call(audit_service.stop)
+    assert len(audit_store.records) == 1
+
+
+def test_new_login_gets_new_session(client):
+    test_client, oauth, session_service, audit_service, audit_store, token_store = client
+
+    first = test_client.get(CALLBACK, params={"code": "code-1"})
+    second = test_client.get(CALLBACK, params={"code": "code-2"})
+
+    assert first.cookies["session"] != second.cookies["session"]
+    assert session_service.get_counters()["issued"] == 2
+    assert audit_service.get_counters()["queued"] == 2
+
+
+def test_user_info_uses_stored_token(client):
+    test_client, *_ = client
+    assert test_client.get("/kakao-authentication/user-info").status_code == 401
+
+    test_client.get(CALLBACK, params={"code": "code-1"})
+    assert test_client.get("/kakao-authentication/user-info").json()["id"] == 42
+
+
+def test_callback_replay_after_logout_is_rejected(client):
+    """로그아웃한 로그인의 콜백을 다시 보내면 세션을 되살리지 않고 401을 반환한다. (회귀)"""
+    test_client, oauth, session_service, audit_service, audit_store, token_store = client
+
+    assert test_client.get(CALLBACK, params={"code": "code-1"}).status_code == 200
+    assert test_client.post("/authentication/logout").status_code == 200
+
+    replay = test_client.get(CALLBACK, params={"code": "code-1"})
+
+    assert replay.status_code == 401
+    assert "session" not in replay.cookies
+    assert test_client.get("/authentication/me").status_code == 401
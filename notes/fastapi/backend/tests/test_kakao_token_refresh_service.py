@@ -0,0 +1,117 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from kakao_authentication.repository import InMemoryKakaoTokenStore, SQLiteKakaoTokenStore, StoredKakaoToken
+from kakao_authentication.schemas.kakao_oauth import KakaoTokenResponse
+from kakao_authentication.service.kakao_token_refresh_service import (
+    KakaoTokenRefreshConfig,
+    KakaoTokenRefreshService,
+)
+
+
+class FakeOAuthService:
+    def __init__(self, expires_in: int = 21599, error: HTTPException | None = None):
+        self.calls = 0
+        self._expires_in = expires_in
+        self._error = error
+
+    async def refresh_access_token(self, refresh_token: str) -> KakaoTokenResponse:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self._error is not None:
+            raise self._error
+        return KakaoTokenResponse(
+            access_token=f"access-{self.calls}",
+            token_type="bearer",
+            expires_in=self._expires_in,
+        )
+
+
+def _due_token(user_id: int = 1) -> StoredKakaoToken:
+    now = time.time()
+    return StoredKakaoToken(
+        user_id=user_id,
+        access_token="old",
+        token_type="bearer",
+        access_token_expires_at=now + 300,
+        refresh_at=now - 1,
+        refresh_token="refresh",
+        refresh_token_expires_at=now + 86400,
+    )
+
+
+def _config(**overrides) -> KakaoTokenRefreshConfig:
+    return KakaoTokenRefreshConfig(**{"refresh_jitter": 0.0, **overrides})
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_store(request, tmp_path):
+    if request.param == "memory":
+        shared = InMemoryKakaoTokenStore()
+        return lambda: shared
+    return lambda: SQLiteKakaoTokenStore(tmp_path / "tokens.sqlite3")
+
+
+@pytest.mark.anyio
+async def test_workers_refresh_each_token_once(make_store):
+    """같은 저장소를 보는 워커 둘이 동시에 폴링해도 한 번만 갱신한다."""
+    first_store, second_store = make_store(), make_store()
+    await first_store.save(_due_token())
+    oauth = FakeOAuthService()
+    workers = [
+        KakaoTokenRefreshService(store, oauth, _config()) for store in (first_store, second_store)
+    ]
+
+    await asyncio.gather(*(worker.refresh_due() for worker in workers))
+
+    assert oauth.calls == 1
+    assert sum(worker.claim_conflicts for worker in workers) == 1
+    stored = await first_store.get(1)
+    assert stored.access_token == "access-1"
+    assert stored.refresh_token == "refresh"
+
+
+@pytest.mark.anyio
+async def test_short_lived_token_is_not_refreshed_every_poll(make_store):
+    store = make_store()
+    await store.save(_due_token())
+    oauth = FakeOAuthService(expires_in=30)
+    service = KakaoTokenRefreshService(store, oauth, _config(min_refresh_interval=60.0))
+
+    await service.refresh_due()
+    await service.refresh_due()
+
+    assert oauth.calls == 1
+    assert (await store.get(1)).refresh_at >= time.time() + 59
+
+
+@pytest.mark.anyio
+async def test_revoked_token_is_dropped(make_store):
+    store = make_store()
+    await store.save(_due_token())
+    service = KakaoTokenRefreshService(
+        store, FakeOAuthService(error=HTTPException(status_code=400)), _config()
+    )
+
+    await service.refresh_due()
+
+    assert await store.get(1) is None
+    assert service.get_counters()["dropped"] == 1
+
+
+@pytest.mark.anyio
+async def test_login_during_refresh_is_not_overwritten():
+    store = InMemoryKakaoTokenStore()
+    await store.save(_due_token())
+    service = KakaoTokenRefreshService(store, FakeOAuthService(), _config())
+    claimed = await service._claim(await store.get(1))
+    relogin = StoredKakaoToken(**{**claimed.__dict__, "access_token": "relogin", "refresh_at": time.time() + 600})
+    await store.save(relogin)
+
+    await service._refresh_one(claimed)
+
+    assert (await store.get(1)).access_token == "relogin"
+
@@ -0,0 +1,55 @@
+from infrastructure.latency_tracker import LatencyTracker
+
+
+def _warm(tracker: LatencyTracker, seconds: float, count: int = 64) -> None:
+    for _ in range(count):
+        tracker.record(seconds)
+
+
+def test_adaptive_timeout_defaults_without_samples():
+    tracker = LatencyTracker(min_samples=10)
+    assert tracker.adaptive_timeout(default=5.0) == 5.0
+
+
+def test_adaptive_timeout_shrinks_to_floor_for_fast_upstream():
+    tracker = LatencyTracker(min_samples=10)
+    _warm(tracker, 0.01)
+    assert tracker.adaptive_timeout(default=5.0, floor=0.5) == 0.5
+
+
+def test_timeouts_do_not_lock_at_floor():
+    """느려진 upstream에서 타임아웃이 이어져도 바닥값에 고정되지 않아야 한다. (회귀)"""
+    tracker = LatencyTracker(min_samples=10, max_consecutive_timeouts=3)
+    _warm(tracker, 0.01)
+    upstream_latency = 1.2
+
+    timeouts = 0
+    for _ in range(20):
+        timeout = tracker.adaptive_timeout(default=5.0, floor=0.5)
+        if upstream_latency > timeout:
+            tracker.record_timeout(timeout)
+            timeouts += 1
+        else:
+            tracker.record(upstream_latency)
+
+    assert timeouts <= 3
+    assert tracker.adaptive_timeout(default=5.0, floor=0.5) >= upstream_latency
+
+
+def test_timeout_sample_raises_lower_bound():
+    tracker = LatencyTracker(min_samples=10)
+    _warm(tracker, 0.01)
+    tracker.record_timeout(0.8)
+    assert tracker.adaptive_timeout(default=5.0, floor=0.5) >= 0.8
+
+
+def test_consecutive_timeouts_back_off_to_default():
+    tracker = LatencyTracker(min_samples=10, max_consecutive_timeouts=2)
+    _warm(tracker, 0.01)
+    tracker.record_timeout(0.5)
+    tracker.record_timeout(0.5)
+    assert tracker.adaptive_timeout(default=5.0) == 5.0
+
+    tracker.record(0.02)
+    assert tracker.consecutive_timeouts == 0
+    assert tracker.stats()["timeouts"] == 2
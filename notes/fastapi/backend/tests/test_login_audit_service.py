@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from kakao_authentication.container import build_login_audit_service
+from kakao_authentication.repository import LoginAuditRecord, LoginAuditStoreInterface, SQLiteLoginAuditStore
+from kakao_authentication.service.login_audit_service import LoginAuditConfig, LoginAuditService
+
+
+class FlakyAuditStore(LoginAuditStoreInterface):
+    def __init__(self, failures: int = 0):
+        self.batches: list[list[LoginAuditRecord]] = []
+        self._failures = failures
+
+    async def write_batch(self, records: list[LoginAuditRecord]) -> None:
+        if self._failures > 0:
+            self._failures -= 1
+            raise OSError("disk full")
+        self.batches.append(list(records))
+
+    async def count(self) -> int:
+        return sum(len(batch) for batch in self.batches)
+
+
+def _config(**overrides) -> LoginAuditConfig:
+    return LoginAuditConfig(**{"flush_interval": 0.01, "retry_delay": 0.0, **overrides})
+
+
+@pytest.mark.anyio
+async def test_records_are_written_in_batches(tmp_path):
+    store = SQLiteLoginAuditStore(tmp_path / "audit.sqlite3")
+    service = LoginAuditService(store, _config(batch_size=100))
+    service.start()
+
+    for user_id in range(250):
+        await service.record(user_id, "profile")
+    await service.stop()
+
+    counters = service.get_counters()
+    assert counters["written"] == 250
+    assert (await service.get_stats())["records"] == 250
+    assert counters["batches"] <= 5
+    reopened = SQLiteLoginAuditStore(tmp_path / "audit.sqlite3")
+    assert await reopened.count() == 250
+    await reopened.close()
+
+
+@pytest.mark.anyio
+async def test_full_queue_drops_without_blocking():
+    service = LoginAuditService(FlakyAuditStore(), _config(max_queue=2, enqueue_timeout=0.0))
+
+    for user_id in range(3):
+        await service.record(user_id, None)
+
+    assert service.get_counters()["queued"] == 2
+    assert service.get_counters()["dropped"] == 1
+
+
+@pytest.mark.anyio
+async def test_full_queue_waits_for_writer():
+    store = FlakyAuditStore()
+    service = LoginAuditService(store, _config(max_queue=1, enqueue_timeout=1.0))
+    service.start()
+
+    await asyncio.gather(*(service.record(user_id, None) for user_id in range(5)))
+    await service.stop()
+
+    assert service.get_counters()["dropped"] == 0
+    assert await store.count() == 5
+
+
+@pytest.mark.anyio
+async def test_failed_write_is_retried():
+    store = FlakyAuditStore(failures=2)
+    service = LoginAuditService(store, _config(max_retries=3))
+    service.start()
+
+    await service.record(1, None)
+    await service.stop()
+
+    assert service.get_counters()["write_errors"] == 2
+    assert await store.count() == 1
+
+
+@pytest.mark.anyio
+async def test_disabled_service_records_nothing():
+    service = LoginAuditService(FlakyAuditStore(), _config(enabled=False))
+    await service.record(1, None)
+    assert service.get_counters()["queued"] == 0
+
+
+@pytest.mark.anyio
+async def test_disabled_audit_does_not_open_store(use_settings, tmp_path):
+    path = tmp_path / "audit.sqlite3"
+    use_settings(LOGIN_AUDIT_ENABLED="false", LOGIN_AUDIT_SQLITE_PATH=str(path))
+
+    service = build_login_audit_service()
+    service.start()
+    await service.record(1, None)
+    await service.stop()
+
+    assert not path.exists()
+    assert (await service.get_stats())["records"] == 0
@@ -0,0 +1,53 @@
+import asyncio
+import time
+
+import pytest
+
+from infrastructure.loop_monitor import EventLoopMonitor, LoopMonitorConfig
+
+
+def _blocking_sleep(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+@pytest.mark.anyio
+async def test_blocking_call_is_reported_with_stack():
+    monitor = EventLoopMonitor(LoopMonitorConfig(interval=0.01, threshold=0.05))
+    monitor.start()
+    try:
+        await asyncio.sleep(0.03)
+        _blocking_sleep(0.2)
+        await asyncio.sleep(0.05)
+    finally:
+        await monitor.stop()
+
+    stats = monitor.stats()
+    assert stats["blocked"] == 1
+    assert stats["max_lag"] >= 0.15
+    assert not stats["running"]
+
+    [report] = monitor.reports()
+    assert report["captured"]
+    assert "_blocking_sleep" in "".join(report["stack"])
+
+
+@pytest.mark.anyio
+async def test_short_pauses_are_not_reported():
+    monitor = EventLoopMonitor(LoopMonitorConfig(interval=0.01, threshold=0.2, capture_stacks=False))
+    monitor.start()
+    try:
+        await asyncio.sleep(0.05)
+    finally:
+        await monitor.stop()
+
+    assert monitor.blocked == 0
+    assert monitor.reports() == []
+
+
+@pytest.mark.anyio
+async def test_disabled_monitor_does_not_start():
+    monitor = EventLoopMonitor(LoopMonitorConfig(enabled=False))
+    monitor.start()
+
+    assert not monitor.stats()["running"]
+    await monitor.stop()
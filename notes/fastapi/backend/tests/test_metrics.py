@@ -0,0 +1,72 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from kakao_authentication.container import KakaoAuthenticationContainer
+from metrics.collectors import stats_collector
+from metrics.middleware import MetricsMiddleware
+from metrics.registry import MetricsRegistry
+
+
+def test_stats_collector_exports_counters_with_total_suffix():
+    collect = stats_collector(
+        "demo",
+        "demo stats",
+        lambda: {"hits": 3, "entries": 2, "enabled": True, "backend": "memory", "nested": {"x": 1}},
+        counters=frozenset({"hits"}),
+    )
+
+    families = {name: (kind, samples) for name, kind, _, samples in collect()}
+
+    assert families == {
+        "demo_hits_total": ("counter", [({}, 3)]),
+        "demo_entries": ("gauge", [({}, 2)]),
+        "demo_enabled": ("gauge", [({}, 1)]),
+    }
+
+
+def test_stats_collector_labels_grouped_stats_and_skips_flat_values():
+    collect = stats_collector(
+        "demo",
+        "demo stats",
+        lambda: {"a": {"requests": 1}, "b": {"requests": 2}, "default": 5.0},
+        "endpoint",
+        counters=frozenset({"requests"}),
+    )
+
+    [(name, kind, _, samples)] = collect()
+
+    assert (name, kind) == ("demo_requests_total", "counter")
+    assert samples == [({"endpoint": "a"}, 1), ({"endpoint": "b"}, 2)]
+
+
+def test_middleware_maps_unknown_methods_to_other():
+    registry = MetricsRegistry()
+    app = FastAPI()
+
+    @app.api_route("/items", methods=["GET", "PURGE"])
+    async def items():
+        return {}
+
+    app.add_middleware(MetricsMiddleware, registry=registry)
+    client = TestClient(app)
+
+    client.get("/items")
+    client.request("PURGE", "/items")
+    client.request("FOO123", "/items")
+
+    rendered = registry.render()
+    assert 'http_request_duration_seconds_count{method="GET",route="/items",status="200"} 1' in rendered
+    assert 'http_request_duration_seconds_count{method="OTHER",route="/items",status="200"} 1' in rendered
+    assert "PURGE" not in rendered
+    assert "FOO123" not in rendered
+
+
+def test_container_counters_do_not_build_services_on_scrape():
+    container = KakaoAuthenticationContainer()
+
+    assert container.get_login_audit_counters() == {}
+    assert container.get_token_refresh_counters() == {}
+    assert container.get_service_stats("rate_limiters") == {}
+    assert container._service is None
+    assert container._login_audit_service is None
+    assert container._token_refresh_service is None
@@ -0,0 +1,178 @@
+import asyncio
+import hashlib
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from infrastructure.jwt import base64url_encode
+from infrastructure.timing_wheel import TimingWheel
+from kakao_authentication.repository import InMemoryOAuthStateStore, SQLiteOAuthStateStore, StoredOAuthState
+from kakao_authentication.service.kakao_oauth_service_impl import KakaoOAuthServiceImpl
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_timing_wheel_expires_after_ttl():
+    clock = FakeClock()
+    wheel = TimingWheel(tick=1.0, max_ttl=10.0, max_entries=100, clock=clock)
+    wheel.put("a", 1, ttl=3.0)
+    wheel.put("b", 2, ttl=8.0)
+
+    clock.now += 5
+    assert wheel.advance() == 1
+    assert wheel.pop("a") is None
+    assert wheel.pop("b") == 2
+    assert wheel.pop("b") is None
+
+
+def test_timing_wheel_survives_long_idle():
+    clock = FakeClock()
+    wheel = TimingWheel(tick=1.0, max_ttl=5.0, max_entries=100, clock=clock)
+    for i in range(10):
+        wheel.put(str(i), i, ttl=5.0)
+
+    clock.now += 1000
+    assert wheel.advance() == 10
+    assert len(wheel) == 0
+
+
+def test_timing_wheel_evicts_oldest_when_full():
+    wheel = TimingWheel(tick=1.0, max_ttl=10.0, max_entries=2, clock=FakeClock())
+    wheel.put("a", 1, ttl=5.0)
+    wheel.put("b", 2, ttl=5.0)
+    wheel.put("c", 3, ttl=5.0)
+
+    assert wheel.pop("a") is None
+    assert wheel.pop("c") == 3
+    assert wheel.stats()["evicted"] == 1
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def state_store(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryOAuthStateStore(max_ttl=60.0, max_entries=100, tick=0.01)
+    return SQLiteOAuthStateStore(tmp_path / "states.sqlite3")
+
+
+@pytest.mark.anyio
+async def test_state_is_consumed_once(state_store):
+    record = StoredOAuthState(code_verifier="verifier", nonce="nonce", created_at=0.0)
+    await state_store.save("state", record, ttl=60.0)
+
+    assert await state_store.consume("state") == record
+    assert await state_store.consume("state") is None
+    await state_store.close()
+
+
+@pytest.mark.anyio
+async def test_expired_state_is_rejected(state_store):
+    await state_store.save("state", StoredOAuthState("verifier", None, 0.0), ttl=0.0)
+    await asyncio.sleep(0.05)
+
+    assert await state_store.consume("state") is None
+    await state_store.close()
+
+
+@pytest.mark.anyio
+async def test_sqlite_state_count_tracks_saves_and_consumes(tmp_path):
+    store = SQLiteOAuthStateStore(tmp_path / "states.sqlite3", purge_interval=0.0)
+    for i in range(3):
+        await store.save(f"s{i}", StoredOAuthState("verifier", None, 0.0), ttl=60.0)
+    await store.consume("s0")
+    await store.consume("missing")
+
+    assert store.stats()["live"] == 2
+    await store.close()
+
+
+class FakeKakao:
+    """PKCE를 확인하는 토큰 엔드포인트 (인가 코드는 한 번만 교환된다)"""
+
+    def __init__(self):
+        self.token_calls = 0
+        self.verifiers: list[str] = []
+        self._used_codes: set[str] = set()
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        form = parse_qs(request.content.decode())
+        self.token_calls += 1
+        await asyncio.sleep(0.01)
+        code = form["code"][0]
+        if "code_verifier" not in form or code in self._used_codes:
+            return httpx.Response(400, json={"error": "invalid_grant"})
+        self._used_codes.add(code)
+        self.verifiers.append(form["code_verifier"][0])
+        return httpx.Response(
+            200,
+            json={"access_token": f"access-{code}", "token_type": "bearer", "expires_in": 21599},
+        )
+
+
+@pytest.fixture
+def oauth_service(use_settings):
+    use_settings(
+        KAKAO_CLIENT_ID="client",
+        KAKAO_REDIRECT_URI="http://localhost/callback",
+        KAKAO_OAUTH_STATE_ENABLED="true",
+    )
+    kakao = FakeKakao()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(kakao))
+    return KakaoOAuthServiceImpl(http_client=client), kakao
+
+
+async def _issue_state(service: KakaoOAuthServiceImpl) -> str:
+    auth_url = (await service.create_authorization_request()).auth_url
+    return parse_qs(urlsplit(auth_url).query)["state"][0]
+
+
+@pytest.mark.anyio
+async def test_code_verifier_matches_issued_challenge(oauth_service):
+    service, kakao = oauth_service
+    query = parse_qs(urlsplit((await service.create_authorization_request()).auth_url).query)
+
+    await service.request_access_token("code-1", state=query["state"][0])
+
+    assert query["code_challenge_method"] == ["S256"]
+    [verifier] = kakao.verifiers
+    assert base64url_encode(hashlib.sha256(verifier.encode()).digest()) == query["code_challenge"][0]
+
+
+@pytest.mark.anyio
+async def test_duplicate_callback_with_state_shares_exchange(oauth_service):
+    """같은 (state, code) 중복 콜백은 state 소비 전에 합쳐져 같은 토큰을 받는다. (회귀)"""
+    service, kakao = oauth_service
+    state = await _issue_state(service)
+
+    first, second = await asyncio.gather(
+        service.request_access_token("code-1", state=state),
+        service.request_access_token("code-1", state=state),
+    )
+    late = await service.request_access_token("code-1", state=state)
+
+    assert first.access_token == second.access_token == late.access_token == "access-code-1"
+    assert kakao.token_calls == 1
+    assert service.get_oauth_state_stats()["consumed"] == 1
+
+
+@pytest.mark.anyio
+async def test_same_code_with_other_state_is_rejected(oauth_service):
+    service, kakao = oauth_service
+    state = await _issue_state(service)
+    await service.request_access_token("code-1", state=state)
+
+    with pytest.raises(HTTPException) as excinfo:
+        await service.request_access_token("code-1", state="forged")
+    assert excinfo.value.status_code == 400
+
+    with pytest.raises(HTTPException) as excinfo:
+        await service.request_access_token("code-2", state=None)
+    assert excinfo.value.status_code == 400
+    assert kakao.token_calls == 1
@@ -0,0 +1,45 @@
+import httpcore
+import httpx
+import pytest
+
+from infrastructure.pooled_transport import PooledTransport
+
+RESPONSE = [b"HTTP/1.1 200 OK\r\n", b"Content-Length: 2\r\n", b"\r\n", b"ok"]
+
+
+def _transport(buffer: list[bytes]) -> PooledTransport:
+    return PooledTransport(
+        httpx.Limits(max_connections=4, max_keepalive_connections=4),
+        network_backend=httpcore.AsyncMockBackend(buffer),
+    )
+
+
+@pytest.mark.anyio
+async def test_stats_track_in_flight_and_idle_connections():
+    transport = _transport(RESPONSE)
+    async with httpx.AsyncClient(transport=transport) as client:
+        assert transport.stats()["connections"] == 0
+
+        async with client.stream("GET", "http://kakao.test/v2/user/me") as response:
+            stats = transport.stats()
+            assert stats["requests_in_flight"] == 1
+            assert stats["active_connections"] == 1
+            assert await response.aread() == b"ok"
+
+        assert transport.stats() == {
+            "connections": 1,
+            "active_connections": 0,
+            "idle_connections": 1,
+            "http2_connections": 0,
+            "requests_in_flight": 0,
+        }
+
+
+@pytest.mark.anyio
+async def test_failed_request_releases_in_flight_and_maps_exception():
+    transport = _transport([b"not http\r\n\r\n"])
+    async with httpx.AsyncClient(transport=transport) as client:
+        with pytest.raises(httpx.RemoteProtocolError):
+            await client.get("http://kakao.test/v2/user/me")
+
+    assert transport.stats()["requests_in_flight"] == 0
@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+from infrastructure.rate_limiter import AsyncTokenBucket, RateLimitExceeded
+
+
+@pytest.mark.anyio
+async def test_burst_is_granted_without_waiting():
+    bucket = AsyncTokenBucket("test_burst", rate=1.0, burst=3, max_queue=10, max_wait=1.0)
+    for _ in range(3):
+        await bucket.acquire()
+    assert bucket.stats()["tokens"] < 1
+
+
+@pytest.mark.anyio
+async def test_queue_full_is_rejected():
+    bucket = AsyncTokenBucket("test_queue_full", rate=0.1, burst=1, max_queue=1, max_wait=5.0)
+    await bucket.acquire()
+    waiter = asyncio.create_task(bucket.acquire())
+    await asyncio.sleep(0)
+
+    with pytest.raises(RateLimitExceeded) as excinfo:
+        await bucket.acquire()
+    assert excinfo.value.reason == "queue_full"
+    assert excinfo.value.retry_after_header == "20"
+
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+    assert bucket.stats()["queue_depth"] == 0
+
+
+@pytest.mark.anyio
+async def test_waiter_times_out():
+    bucket = AsyncTokenBucket("test_timeout", rate=0.1, burst=1, max_queue=10, max_wait=0.05)
+    await bucket.acquire()
+    with pytest.raises(RateLimitExceeded) as excinfo:
+        await bucket.acquire()
+    assert excinfo.value.reason == "timeout"
+
+
+@pytest.mark.anyio
+async def test_waiters_are_served_in_order():
+    bucket = AsyncTokenBucket("test_order", rate=100.0, burst=1, max_queue=10, max_wait=1.0)
+    await bucket.acquire()
+    order = []
+
+    async def take(i):
+        await bucket.acquire()
+        order.append(i)
+
+    await asyncio.gather(*(take(i) for i in range(5)))
+    assert order == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.anyio
+async def test_drain_empties_tokens():
+    bucket = AsyncTokenBucket("test_drain", rate=1.0, burst=5, max_queue=10, max_wait=1.0)
+    bucket.drain()
+    assert bucket.stats()["tokens"] < 1
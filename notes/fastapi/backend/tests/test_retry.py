@@ -0,0 +1,103 @@
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from infrastructure.retry import RetryBudget, RetryPolicy
+from kakao_authentication.service.kakao_oauth_service_impl import KakaoOAuthServiceImpl
+
+USER = {"id": 1, "kakao_account": {"profile": {"nickname": "nick"}}}
+
+
+def test_backoff_is_bounded_by_max_delay():
+    policy = RetryPolicy(base_delay=0.1, max_delay=0.3)
+
+    assert all(0 <= policy.backoff(1) <= 0.1 for _ in range(100))
+    assert all(0 <= policy.backoff(10) <= 0.3 for _ in range(100))
+
+
+def test_budget_is_spent_and_exhausted():
+    budget = RetryBudget(ratio=0.5, min_per_second=0.0, max_balance=2.0)
+
+    assert budget.try_spend()
+    assert budget.try_spend()
+    assert not budget.try_spend()
+    assert budget.stats()["exhausted"] == 1
+
+    # 최초 시도 2건이 재시도 1회 분량을 적립한다.
+    budget.record_request()
+    budget.record_request()
+    assert budget.try_spend()
+    assert budget.stats()["spent"] == 3
+
+
+def test_budget_balance_is_capped():
+    budget = RetryBudget(ratio=1.0, min_per_second=0.0, max_balance=2.0)
+
+    for _ in range(10):
+        budget.record_request()
+
+    assert budget.stats()["balance"] == 2.0
+
+
+@pytest.fixture
+def service_factory(use_settings):
+    def build(responses: list[int], **settings: str):
+        use_settings(
+            KAKAO_CLIENT_ID="client",
+            KAKAO_REDIRECT_URI="http://localhost/callback",
+            KAKAO_RETRY_BASE_DELAY="0",
+            **settings,
+        )
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.method)
+            status = responses.pop(0)
+            if status == 200:
+                return httpx.Response(200, json=USER if request.method == "GET" else {
+                    "access_token": "access", "token_type": "bearer", "expires_in": 21599,
+                })
+            return httpx.Response(status, json={"error": "unavailable"})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return KakaoOAuthServiceImpl(http_client=client), calls
+
+    return build
+
+
+@pytest.mark.anyio
+async def test_idempotent_call_is_retried_on_5xx(service_factory):
+    service, calls = service_factory([503, 502, 200])
+
+    user = await service.get_user_info("token")
+
+    assert user.id == 1
+    assert calls == ["GET", "GET", "GET"]
+    assert service.get_retry_budget_stats()["spent"] == 2
+
+
+@pytest.mark.anyio
+async def test_retries_stop_when_budget_is_exhausted(service_factory):
+    service, calls = service_factory(
+        [503, 503, 200],
+        KAKAO_RETRY_BUDGET_MAX_BALANCE="1",
+        KAKAO_RETRY_BUDGET_RATIO="0",
+        KAKAO_RETRY_BUDGET_MIN_PER_SECOND="0",
+    )
+
+    with pytest.raises(HTTPException) as excinfo:
+        await service.get_user_info("token")
+
+    assert excinfo.value.status_code == 503
+    assert calls == ["GET", "GET"]
+    assert service.get_retry_budget_stats()["exhausted"] == 1
+
+
+@pytest.mark.anyio
+async def test_code_exchange_is_not_retried(service_factory):
+    service, calls = service_factory([503, 200])
+
+    with pytest.raises(HTTPException):
+        await service.request_access_token("code")
+
+    assert calls == ["POST"]
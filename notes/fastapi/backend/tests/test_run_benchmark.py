@@ -0,0 +1,35 @@
+import json
+
+from benchmark.run_benchmark import (
+    DEFAULT_BASELINE,
+    ScenarioResult,
+    benchmark_parameters,
+    compare_with_baseline,
+    parameter_mismatches,
+    parse_args,
+)
+
+
+def _result(throughput: float, p95: float) -> ScenarioResult:
+    return ScenarioResult("root", "/", 20, 500, 0, 1.0, throughput, 1.0, p95, p95, p95)
+
+
+def test_default_parameters_match_committed_baseline():
+    baseline = json.loads(DEFAULT_BASELINE.read_text())
+    assert parameter_mismatches(benchmark_parameters(parse_args([])), baseline) == []
+
+
+def test_mismatched_parameters_are_reported():
+    baseline = {"parameters": benchmark_parameters(parse_args([]))}
+    mismatches = parameter_mismatches(benchmark_parameters(parse_args(["--concurrency", "50"])), baseline)
+    assert mismatches == ["concurrency: 50 != baseline 20"]
+
+
+def test_baseline_without_parameters_is_refused():
+    assert parameter_mismatches(benchmark_parameters(parse_args([])), {"scenarios": []})
+
+
+def test_regression_beyond_tolerance_is_reported():
+    baseline = {"scenarios": [{"name": "root", "throughput_rps": 100.0, "p95_ms": 10.0, "p99_ms": 10.0}]}
+    assert compare_with_baseline([_result(90.0, 11.0)], baseline, tolerance=0.25) == []
+    assert len(compare_with_baseline([_result(50.0, 20.0)], baseline, tolerance=0.25)) == 3
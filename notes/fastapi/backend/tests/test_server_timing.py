@@ -0,0 +1,49 @@
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from infrastructure import server_timing
+from infrastructure.server_timing import ServerTimingMiddleware, set_server_timing_enabled, timing_phase
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(server_timing, "_enabled", True)
+    app = FastAPI()
+
+    @app.get("/items")
+    async def items():
+        with timing_phase("upstream"):
+            pass
+        with timing_phase("serialize"):
+            pass
+        return {}
+
+    app.add_middleware(ServerTimingMiddleware)
+    return TestClient(app)
+
+
+def test_header_lists_phases_and_total(client, caplog):
+    with caplog.at_level(logging.INFO, logger="server_timing"):
+        response = client.get("/items")
+
+    names = [part.split(";")[0] for part in response.headers["server-timing"].split(", ")]
+    assert names == ["upstream", "serialize", "total"]
+    assert all(";dur=" in part for part in response.headers["server-timing"].split(", "))
+    assert '"route":"/items"' in caplog.text
+    assert '"upstream"' in caplog.text
+
+
+def test_toggle_disables_header_at_runtime(client):
+    set_server_timing_enabled(False)
+    assert "server-timing" not in client.get("/items").headers
+
+    set_server_timing_enabled(True)
+    assert "server-timing" in client.get("/items").headers
+
+
+def test_timing_phase_outside_request_is_noop():
+    with timing_phase("idle"):
+        pass
@@ -0,0 +1,101 @@
+import asyncio
+import time
+
+import pytest
+
+from authentication.exceptions import SessionConfigurationError, SessionRevokedError
+from authentication.repository import SQLiteSessionStore
+from authentication.schemas.session import SessionUser
+from authentication.service import SessionConfig, SessionService
+
+USER = SessionUser(user_id=1, nickname="nick", email=None, profile_image_url=None)
+
+
+@pytest.fixture
+async def make_service(tmp_path):
+    services = []
+
+    def make(**overrides) -> SessionService:
+        config = SessionConfig(**{"secret_key": "secret", "purge_interval": 0, **overrides})
+        service = SessionService(SQLiteSessionStore(tmp_path / "sessions.sqlite3"), config)
+        services.append(service)
+        return service
+
+    yield make
+    for service in services:
+        await service.stop()
+
+
+@pytest.mark.anyio
+async def test_issued_session_resolves(make_service):
+    service = make_service()
+    session = await service.create_session(USER)
+
+    assert session.created
+    assert await service.resolve(session.token) == USER
+    assert service.get_counters()["issued"] == 1
+
+
+@pytest.mark.anyio
+async def test_tampered_or_expired_token_is_rejected(make_service):
+    service = make_service()
+    session = await service.create_session(USER)
+    session_id, expires_at, signature = session.token.split(".")
+
+    assert await service.resolve(f"{session_id}.{int(expires_at) + 1}.{signature}") is None
+    assert await service.resolve("not-a-token") is None
+
+    expired = f"{session_id}.{int(time.time()) - 1}"
+    assert await service.resolve(f"{expired}.{service._sign(expired)}") is None
+    assert service.get_counters()["rejected"] == 3
+
+
+@pytest.mark.anyio
+async def test_other_secret_cannot_forge(make_service):
+    session = await make_service().create_session(USER)
+    assert await make_service(secret_key="other").resolve(session.token) is None
+
+
+@pytest.mark.anyio
+async def test_same_login_key_returns_same_session_across_workers(make_service):
+    """중복 콜백은 워커가 달라도 같은 세션을 받고 새 세션을 만들지 않는다. (회귀)"""
+    first, second = make_service(), make_service()
+
+    issued = await asyncio.gather(
+        first.create_session(USER, login_key="login-1"),
+        second.create_session(USER, login_key="login-1"),
+    )
+
+    assert issued[0].token == issued[1].token
+    assert sorted(session.created for session in issued) == [False, True]
+    assert first.get_counters()["issued"] + second.get_counters()["issued"] == 1
+    assert await second.resolve(issued[0].token) == USER
+
+    other = await first.create_session(USER, login_key="login-2")
+    assert other.created and other.token != issued[0].token
+
+
+@pytest.mark.anyio
+async def test_revoked_session_is_not_resolved(make_service):
+    service = make_service()
+    session = await service.create_session(USER)
+
+    assert await service.revoke(session.token)
+    assert await service.resolve(session.token) is None
+
+
+@pytest.mark.anyio
+async def test_login_key_replay_after_revoke_is_rejected(make_service):
+    """로그아웃 후 같은 로그인의 콜백이 다시 들어와도 세션을 되살리지 않는다. (회귀)"""
+    service = make_service()
+    session = await service.create_session(USER, login_key="login-1")
+    assert await service.revoke(session.token)
+
+    with pytest.raises(SessionRevokedError):
+        await make_service().create_session(USER, login_key="login-1")
+    assert await service.resolve(session.token) is None
+
+
+def test_missing_secret_key_fails(tmp_path):
+    with pytest.raises(SessionConfigurationError):
+        SessionService(SQLiteSessionStore(tmp_path / "sessions.sqlite3"), SessionConfig(secret_key=""))
@@ -0,0 +1,79 @@
+import os
+
+import pytest
+
+from config import settings as settings_module
+from config.settings import Settings, SettingsWatcher, get_settings, reload_settings, subscribe_settings
+from kakao_authentication.service.kakao_oauth_service_impl import KakaoOAuthServiceImpl
+
+BASE = "KAKAO_CLIENT_ID=client\nKAKAO_REDIRECT_URI=http://localhost/callback\n"
+
+
+@pytest.fixture
+def env_file(tmp_path, monkeypatch):
+    """임시 .env를 설정 원본으로 사용한다. (프로세스 환경 변수와 구독자는 테스트 동안 격리)"""
+    path = tmp_path / ".env"
+    path.write_text(BASE)
+    monkeypatch.setattr(os, "environ", {})
+    monkeypatch.setattr(settings_module, "_env_path", path)
+    monkeypatch.setattr(settings_module, "_process_environ", {})
+    monkeypatch.setattr(settings_module, "_listeners", [])
+    monkeypatch.setattr(settings_module, "_current", Settings.parse(settings_module._read_values(), version=1))
+    return path
+
+
+def test_reload_swaps_snapshot_and_notifies_listeners(env_file):
+    changes = []
+    subscribe_settings(lambda previous, current: changes.append((previous.version, current.version)))
+    first = get_settings()
+
+    assert not reload_settings()
+
+    env_file.write_text(BASE + "SERVER_TIMING_ENABLED=false\n")
+    assert reload_settings()
+
+    assert changes == [(1, 2)]
+    assert not get_settings().server_timing_enabled
+    assert first.server_timing_enabled
+    assert os.environ["SERVER_TIMING_ENABLED"] == "false"
+
+
+def test_invalid_values_keep_previous_snapshot(env_file):
+    previous = get_settings()
+    env_file.write_text(BASE + "KAKAO_OIDC_ENABLED=maybe\n")
+
+    assert not reload_settings()
+    assert get_settings() is previous
+
+
+def test_failing_listener_does_not_block_others(env_file):
+    calls = []
+
+    def broken(previous, current):
+        raise RuntimeError("boom")
+
+    subscribe_settings(broken)
+    unsubscribe = subscribe_settings(lambda previous, current: calls.append(current.version))
+    env_file.write_text(BASE + "SERVER_TIMING_ENABLED=true\n")
+
+    assert reload_settings()
+    assert calls == [2]
+
+    unsubscribe()
+    env_file.write_text(BASE)
+    assert reload_settings()
+    assert calls == [2]
+
+
+def test_redirect_uri_change_invalidates_auth_url(env_file):
+    """설정 변경 구독자가 Service 설정을 다시 읽으면 캐시된 인증 URL이 바뀐다."""
+    service = KakaoOAuthServiceImpl()
+    subscribe_settings(lambda previous, current: service.reload_config())
+    before = service.generate_auth_url()
+
+    env_file.write_text("KAKAO_CLIENT_ID=client\nKAKAO_REDIRECT_URI=http://localhost/new-callback\n")
+    assert SettingsWatcher().check()
+
+    after = service.generate_auth_url()
+    assert after.redirect_uri == "http://localhost/new-callback"
+    assert after.auth_url != before.auth_url
@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+from infrastructure.single_flight import SingleFlight
+
+
+@pytest.mark.anyio
+async def test_concurrent_calls_share_one_execution():
+    flight: SingleFlight[int] = SingleFlight()
+    calls = 0
+
+    async def fn() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return 7
+
+    results = await asyncio.gather(*(flight.do("key", fn) for _ in range(10)))
+
+    assert results == [7] * 10
+    assert calls == 1
+    assert flight.stats()["shared"] == 9
+    assert flight.stats()["in_flight"] == 0
+
+
+@pytest.mark.anyio
+async def test_leader_cancellation_does_not_cancel_waiters():
+    """첫 호출자가 끊겨도 같은 키를 기다리던 호출자는 결과를 받는다. (회귀)"""
+    flight: SingleFlight[str] = SingleFlight()
+    started = asyncio.Event()
+
+    async def fn() -> str:
+        started.set()
+        await asyncio.sleep(0.05)
+        return "done"
+
+    leader = asyncio.create_task(flight.do("key", fn))
+    await started.wait()
+    waiter = asyncio.create_task(flight.do("key", fn))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    assert await waiter == "done"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+@pytest.mark.anyio
+async def test_failure_propagates_and_is_not_kept():
+    flight: SingleFlight[str] = SingleFlight()
+    attempts = 0
+
+    async def fn() -> str:
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(flight.do("key", fn), flight.do("key", fn), return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+
+    with pytest.raises(ValueError):
+        await flight.do("key", fn)
+    assert attempts == 2
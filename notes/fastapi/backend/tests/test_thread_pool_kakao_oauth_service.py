@@ -0,0 +1,64 @@
+import pytest
+from fastapi import HTTPException
+
+from kakao_authentication.schemas.kakao_oauth import KakaoAuthUrlResponse, KakaoTokenResponse, KakaoUserInfoResponse
+from kakao_authentication.service.sync_kakao_oauth_service_interface import SyncKakaoOAuthServiceInterface
+from kakao_authentication.service.thread_pool_kakao_oauth_service import ThreadPoolKakaoOAuthService
+
+
+class SyncService(SyncKakaoOAuthServiceInterface):
+    def generate_auth_url(self) -> KakaoAuthUrlResponse:
+        return KakaoAuthUrlResponse(
+            auth_url="https://kauth.kakao.com/oauth/authorize",
+            client_id="client",
+            redirect_uri="http://localhost/callback",
+            response_type="code",
+        )
+
+    def request_access_token(self, code: str) -> KakaoTokenResponse:
+        return KakaoTokenResponse(access_token="access", token_type="bearer", expires_in=60)
+
+    def refresh_access_token(self, refresh_token: str) -> KakaoTokenResponse:
+        return KakaoTokenResponse(access_token="access", token_type="bearer", expires_in=60)
+
+    def get_user_info(self, access_token: str) -> KakaoUserInfoResponse:
+        return KakaoUserInfoResponse(id=1)
+
+
+class OIDCSyncService(SyncService):
+    oidc_enabled = True
+
+    def verify_id_token(self, id_token: str) -> KakaoUserInfoResponse:
+        return KakaoUserInfoResponse(id=1)
+
+
+def test_oidc_follows_wrapped_service_capability():
+    plain = ThreadPoolKakaoOAuthService(SyncService())
+    oidc = ThreadPoolKakaoOAuthService(OIDCSyncService())
+    try:
+        assert not plain.oidc_enabled
+        assert oidc.oidc_enabled
+    finally:
+        plain.close()
+        oidc.close()
+
+
+@pytest.mark.anyio
+async def test_unsupported_optional_features_raise_501():
+    """필수 메서드만 있는 동기 구현체를 감싸도 생성되고, 선택 기능은 501로 거절된다."""
+    service = ThreadPoolKakaoOAuthService(SyncService())
+    try:
+        assert (await service.get_user_info("access")).id == 1
+        for call in (
+            service.create_authorization_request,
+            lambda: service.verify_id_token("id-token"),
+            lambda: service.get_user_profile(1),
+        ):
+            with pytest.raises(HTTPException) as exc_info:
+                await call()
+            assert exc_info.value.status_code == 501
+        with pytest.raises(HTTPException) as exc_info:
+            service.resolve_user_profiles([1, 2])
+        assert exc_info.value.status_code == 501
+    finally:
+        service.close()
@@ -0,0 +1,71 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from infrastructure.warmup import WarmupGate, WarmupGateMiddleware
+
+
+def _app(warm_up, timeout: float = 0.05) -> FastAPI:
+    gate = WarmupGate()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        gate.reset()
+        gate.start(warm_up)
+        yield
+        await gate.stop()
+
+    app = FastAPI(lifespan=lifespan)
+
+    @app.get("/health")
+    async def health():
+        return {"ready": gate.ready}
+
+    @app.get("/items")
+    async def items():
+        return {}
+
+    app.add_middleware(WarmupGateMiddleware, gate=gate, bypass_paths=frozenset({"/health"}), timeout=timeout)
+    return app
+
+
+def test_requests_wait_for_warmup_and_get_503_on_timeout():
+    released = asyncio.Event()
+
+    async def warm_up():
+        await released.wait()
+
+    with TestClient(_app(warm_up)) as client:
+        assert client.get("/health").json() == {"ready": False}
+
+        response = client.get("/items")
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+
+        client.portal.call(released.set)
+        assert client.get("/items").status_code == 200
+        assert client.get("/health").json() == {"ready": True}
+
+
+def test_failed_warmup_keeps_rejecting_requests():
+    async def warm_up():
+        raise RuntimeError("KAKAO_CLIENT_ID 누락")
+
+    with TestClient(_app(warm_up, timeout=1.0)) as client:
+        assert client.get("/items").status_code == 503
+        assert client.get("/health").json() == {"ready": False}
+
+
+@pytest.mark.anyio
+async def test_wait_returns_false_until_warmup_finishes():
+    gate = WarmupGate()
+    released = asyncio.Event()
+    gate.start(released.wait)
+
+    assert not await gate.wait(0.01)
+    released.set()
+    assert await gate.wait(1.0)
+    assert gate.ready